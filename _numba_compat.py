@@ -0,0 +1,16 @@
+"""
+Optional numba support shared by the controller, recorder and path cleaner
+Import njit and NUMBA_AVAILABLE from here instead of repeating the fallback
+"""
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    # Numba is optional - fall back to plain Python functions
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
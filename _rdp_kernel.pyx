@@ -0,0 +1,75 @@
+# cython: boundscheck=False, wraparound=False, cdivision=True, language_level=3
+"""
+Compiled Ramer-Douglas-Peucker kernel for path_cleaner.py
+Build in place with: cythonize -i _rdp_kernel.pyx
+path_cleaner falls back to its numba/Python kernel when this isn't built
+"""
+
+from libc.math cimport fabs, hypot
+from libc.stdlib cimport malloc, free
+
+
+cdef inline double _perp_dist(double x, double y, double x1, double y1,
+                              double dx, double dy, double chord) nogil:
+    """Distance from (x, y) to the chord starting at (x1, y1) with direction (dx, dy)"""
+    if chord > 0.0:
+        return fabs(dx * (y1 - y) - (x1 - x) * dy) / chord
+    # Chord collapsed to a point (path returns to where it started)
+    return hypot(x - x1, y - y1)
+
+
+cpdef void rdp(double[::1] xs, double[::1] ys, double eps, unsigned char[::1] keep) except *:
+    """Set keep[i] for every point that survives; first and last are always kept"""
+    cdef Py_ssize_t n = xs.shape[0]
+    if n == 0:
+        return
+
+    # Explicit (lo, hi) stack - each push pair keeps one more point, so n slots suffice
+    cdef Py_ssize_t *stack_lo = <Py_ssize_t *> malloc(n * sizeof(Py_ssize_t))
+    cdef Py_ssize_t *stack_hi = <Py_ssize_t *> malloc(n * sizeof(Py_ssize_t))
+    if stack_lo == NULL or stack_hi == NULL:
+        free(stack_lo)
+        free(stack_hi)
+        raise MemoryError()
+
+    cdef Py_ssize_t top, lo, hi, i, max_idx
+    cdef double x1, y1, dx, dy, chord, dist, max_dist
+
+    with nogil:
+        keep[0] = 1
+        keep[n - 1] = 1
+        stack_lo[0] = 0
+        stack_hi[0] = n - 1
+        top = 1
+        while top > 0:
+            top -= 1
+            lo = stack_lo[top]
+            hi = stack_hi[top]
+            if hi - lo < 2:
+                continue
+
+            x1 = xs[lo]
+            y1 = ys[lo]
+            dx = xs[hi] - x1
+            dy = ys[hi] - y1
+            chord = hypot(dx, dy)
+
+            max_dist = -1.0
+            max_idx = lo
+            for i in range(lo + 1, hi):
+                dist = _perp_dist(xs[i], ys[i], x1, y1, dx, dy, chord)
+                if dist > max_dist:
+                    max_dist = dist
+                    max_idx = i
+
+            if max_dist > eps:
+                keep[max_idx] = 1
+                stack_lo[top] = lo
+                stack_hi[top] = max_idx
+                top += 1
+                stack_lo[top] = max_idx
+                stack_hi[top] = hi
+                top += 1
+
+    free(stack_lo)
+    free(stack_hi)
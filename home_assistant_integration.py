@@ -362,8 +362,8 @@ class HomeAssistantMQTT:
             
             # Wait for connection
             timeout = 10
-            start_time = time.time()
-            while not self.connected and (time.time() - start_time) < timeout:
+            start_time = time.monotonic()
+            while not self.connected and (time.monotonic() - start_time) < timeout:
                 time.sleep(0.1)
             
             return self.connected
@@ -89,6 +89,14 @@ pip install --upgrade pip
 echo "Installing Python dependencies..."
 pip install -r requirements.txt
 
+# Compile the path cleaner's RDP kernel (optional - a Python fallback is used without it)
+echo "Building optional RDP kernel..."
+if pip install cython && cythonize -i _rdp_kernel.pyx; then
+    echo "RDP kernel built"
+else
+    echo "Warning: RDP kernel build failed - path_cleaner will use the Python kernel"
+fi
+
 # Create log directory
 echo "Creating log directory..."
 sudo mkdir -p /var/log
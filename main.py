@@ -6,8 +6,11 @@ Integrates hardware control with Home Assistant MQTT
 
 import sys
 import time
+import queue
+import atexit
 import signal
 import logging
+import logging.handlers
 import argparse
 import yaml
 from pathlib import Path
@@ -51,14 +54,31 @@ class TVArmApplication:
         log_path = Path(log_file)
         log_path.parent.mkdir(parents=True, exist_ok=True)
         
+        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        
+        # Buffer file writes - flushed every N records or immediately on WARNING and above
+        file_handler = logging.FileHandler(log_file)
+        file_handler.setFormatter(formatter)
+        buffer_size = self.config['system'].get('log_buffer_size', 100)
+        if buffer_size > 1:
+            file_handler = logging.handlers.MemoryHandler(
+                buffer_size, flushLevel=logging.WARNING, target=file_handler
+            )
+        stream_handler = logging.StreamHandler()
+        stream_handler.setFormatter(formatter)
+        
+        # Records are written by a listener thread - the control loops only enqueue them.
+        # Stopped at exit (before logging's own shutdown) so queued records are drained
+        log_queue = queue.Queue(-1)
+        self._log_listener = logging.handlers.QueueListener(log_queue, file_handler, stream_handler)
+        self._log_listener.start()
+        atexit.register(self._log_listener.stop)
+        
         # Configure logging
         logging.basicConfig(
             level=log_level,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(log_file),
-                logging.StreamHandler()
-            ]
+            format='%(message)s',  # Merges the args only - the listener's handlers apply the real format
+            handlers=[logging.handlers.QueueHandler(log_queue)]
         )
         
         logging.info(f"Logging configured: level={self.config['system']['log_level']}, file={log_file}")
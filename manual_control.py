@@ -4,14 +4,23 @@ Manual TV Arm Control - Arrow key control for real-time TV arm movement
 Use arrow keys to control X and Y axes manually
 """
 
+import io
+import os
+import asyncio
 import sys
 import time
 import termios
 import tty
-import select
+import fcntl
 import threading
-from typing import Optional
+from typing import Optional, Tuple
 
+# Final byte of an ESC [ x arrow-key sequence -> key string used by the dispatch table
+_ARROW_MAP = {0x41: '\x1b[A', 0x42: '\x1b[B', 0x43: '\x1b[C', 0x44: '\x1b[D'}
+
+# Status line template - %-formatted with (x, y, speed); trailing spaces clear leftovers
+_STATUS_FMT = "\r📍 X=%5.1f%%, Y=%5.1f%% | Speed: %.0f%%        "
+_STATUS_NO_POS_FMT = "\r📍 X=   -- , Y=   --  | Speed: %.0f%%        "  # No sample yet, or it went stale
 
 class ManualController:
     """Manual arrow key controller for TV arm"""
@@ -19,37 +28,108 @@ class ManualController:
     def __init__(self, tv_controller):
         self.tv_controller = tv_controller
         self.running = False
-        self.control_thread = None
+        self._monotonic = time.monotonic  # Bound once; immune to NTP/wall-clock jumps
         
         # Control settings
         self.step_size = 2.0  # Percentage to move per key press
         self.continuous_speed = 60.0  # Speed for continuous movement (increased for faster manual control)
         self.speed_multiplier = 1.5  # Internal multiplier for actual motor speed
         self.position_update_interval = 1.0  # How often to show position (much slower for responsiveness)
+        self.key_timeout = 0.15  # Stop motors if no key pressed for 150ms
+        self._last_status = None  # Last (x, y, speed) drawn on the status line
         
         # Current movement state
         self.moving_x = 0  # -1 = left, 0 = stop, 1 = right
         self.moving_y = 0  # -1 = down, 0 = stop, 1 = up
         
-        # Position caching to reduce I2C calls and prevent deadlock
-        self.last_position_read = 0
-        self.cached_x_pos = 0
-        self.cached_y_pos = 0
-        self.position_cache_duration = 0.2  # Cache position for 200ms (balance between accuracy and I2C load)
+        # Sensor snapshot (x%, y%, x_volts, y_volts, monotonic timestamp) written only by
+        # the sampler thread. Readers take the tuple reference once - no lock, no dropped reads
+        self._snapshot = None
+        self.sampler_thread = None
+        self.sample_interval = 0.05  # Pause between sampler passes
+        self.snapshot_max_age = 2.0  # Older snapshots are treated as missing
         
         # I2C deadlock prevention
-        self.last_safety_check = 0
+        self.last_safety_check = float('-inf')  # Monotonic timestamp - first check always runs
         self.safety_check_interval = 999.0  # Disable safety checks during manual control (immediate response)
-        self.i2c_lock = threading.Lock()  # Serialize I2C operations to prevent deadlock
+        self._debug = bool(os.environ.get('TVARM_DEBUG'))  # Verbose safety-check output
+        
+        # Bound motor methods - one local load per call on the key path instead of an attribute chain
+        x_motor, y_motor = tv_controller.x_motor, tv_controller.y_motor
+        self._x_fwd = x_motor.set_direction_forward
+        self._x_rev = x_motor.set_direction_reverse
+        self._x_stop = x_motor.stop_motor
+        self._x_speed = x_motor.set_speed
+        self._y_fwd = y_motor.set_direction_forward
+        self._y_rev = y_motor.set_direction_reverse
+        self._y_stop = y_motor.stop_motor
+        self._y_speed = y_motor.set_speed
+        self._stop_both = tv_controller.stop_all  # Both axes in one GPIO batch
+        self._last_cmd = {'x': None, 'y': None}  # Last (direction, speed) issued per axis; None = stopped
+        
+        # Safety settings resolved once per axis so the safety check skips the config dict walk.
+        # An axis with incomplete calibration gets None, and its safety check stops the motor
+        calibration = (tv_controller.config.get('hardware') or {}).get('calibration') or {}
+        self._safety_params = {
+            'x': self._build_safety_params(calibration.get('x_axis'), x_motor.check_safety_limits, 2),
+            'y': self._build_safety_params(calibration.get('y_axis'), y_motor.check_safety_limits, 3),
+        }
         
         # Terminal settings for raw key input
         self.old_settings = None
+        self._loop = None  # asyncio loop while run() is active
+        self._done = None  # Future resolved when the operator quits
+        self._key_timer = None
+        self._flush_timer = None
+        self._tick_timer = None
+        self._old_stdin_flags = None
+        self._pending = b''  # Bytes read past the first key, consumed before the next read
+        
+        # Buffered terminal output - coalesce writes instead of one syscall per print
+        # closefd=False so dropping the wrapper never closes the real stdout
+        self._out_fd = sys.stdout.fileno()
+        self._out = io.TextIOWrapper(
+            io.BufferedWriter(io.FileIO(self._out_fd, 'w', closefd=False), buffer_size=8192),
+            encoding='utf-8', write_through=False)
+        self._last_flush = float('-inf')
+        self._out_pending = False  # Output written but not yet flushed
+        self.output_flush_interval = 0.016  # Flush at most every 16ms (see _urgent for stop messages)
+        
+        # Key dispatch table (see process_key)
+        self._key_handlers = {
+            '\x1b[A': self._y_forward,   # Up arrow
+            '\x1b[B': self._y_reverse,   # Down arrow
+            '\x1b[C': self._x_forward,   # Right arrow
+            '\x1b[D': self._x_reverse,   # Left arrow
+            ' ': self._stop_all,         # Spacebar
+            'q': self._quit,
+            '\x03': self._quit,          # Ctrl+C
+            '+': self._speed_up,
+            '-': self._speed_down,
+            's': self._show_position,
+        }
+    
+    @staticmethod
+    def _build_safety_params(axis_config: Optional[dict], check_limits, voltage_slot: int) -> Optional[tuple]:
+        """One axis' safety settings plus its bound limit check and snapshot voltage index, or None if uncalibrated"""
+        if not axis_config or 'min_voltage' not in axis_config or 'max_voltage' not in axis_config:
+            return None
+        return (axis_config['min_voltage'],
+                axis_config['max_voltage'],
+                axis_config.get('safety_margin', 0.05),
+                axis_config.get('slow_zone_margin', 0.1),
+                axis_config.get('safety_slow_speed', 30),
+                check_limits,
+                voltage_slot)
     
     def setup_terminal(self):
         """Setup terminal for raw key input"""
         try:
             self.old_settings = termios.tcgetattr(sys.stdin)
             tty.setraw(sys.stdin.fileno())
+            # Non-blocking stdin so get_key can grab a whole escape sequence in one read
+            self._old_stdin_flags = fcntl.fcntl(sys.stdin.fileno(), fcntl.F_GETFL)
+            fcntl.fcntl(sys.stdin.fileno(), fcntl.F_SETFL, self._old_stdin_flags | os.O_NONBLOCK)
             return True
         except Exception as e:
             print(f"❌ Error setting up terminal: {e}")
@@ -57,6 +137,12 @@ class ManualController:
     
     def restore_terminal(self):
         """Restore terminal to normal mode"""
+        if self._old_stdin_flags is not None:
+            try:
+                fcntl.fcntl(sys.stdin.fileno(), fcntl.F_SETFL, self._old_stdin_flags)
+            except:
+                pass
+            self._old_stdin_flags = None
         if self.old_settings:
             try:
                 termios.tcsetattr(sys.stdin, termios.TCSADRAIN, self.old_settings)
@@ -65,197 +151,231 @@ class ManualController:
     
     def get_key(self) -> Optional[str]:
         """Get a single key press without blocking"""
-        if select.select([sys.stdin], [], [], 0) == ([sys.stdin], [], []):
-            key = sys.stdin.read(1)
-            # Handle escape sequences for arrow keys
-            if key == '\x1b':  # ESC sequence
-                if select.select([sys.stdin], [], [], 0.1) == ([sys.stdin], [], []):
-                    key += sys.stdin.read(1)
-                    if key == '\x1b[':
-                        if select.select([sys.stdin], [], [], 0.1) == ([sys.stdin], [], []):
-                            key += sys.stdin.read(1)
-            return key
-        return None
+        if not self._pending:
+            try:
+                # One read picks up a full escape sequence (terminals send it in one go)
+                self._pending = os.read(sys.stdin.fileno(), 8)
+            except BlockingIOError:
+                return None
+            if not self._pending:
+                return None
+        
+        buf = self._pending
+        # Arrow keys: ESC [ <A-D> resolved with one table lookup on the final byte
+        if buf[0] == 0x1b and len(buf) >= 3 and buf[1] == 0x5b:
+            key = _ARROW_MAP.get(buf[2]) or buf[:3].decode('latin-1')
+            self._pending = buf[3:]
+        else:
+            key = chr(buf[0])
+            self._pending = buf[1:]
+        return key
+    
+    def _write(self, msg: str):
+        """Queue terminal output, flushing once per coalescing window"""
+        self._out.write(msg)
+        self._out_pending = True
+        current_time = self._monotonic()
+        if current_time - self._last_flush > self.output_flush_interval:
+            self._flush(current_time)
+    
+    def _urgent(self, msg: str):
+        """Safety-critical output - straight to the fd, bypassing the coalescing buffer"""
+        if self._out_pending:
+            self._flush(self._monotonic())  # Keep earlier lines in order
+        os.write(self._out_fd, msg.encode('utf-8'))
+    
+    def _flush_later(self):
+        """Make sure output left in the buffer goes out once the coalescing window ends"""
+        if self._out_pending and self._flush_timer is None and self._loop:
+            self._flush_timer = self._loop.call_later(self.output_flush_interval, self._on_flush_timer)
+    
+    def _on_flush_timer(self):
+        self._flush_timer = None
+        if self._out_pending:
+            self._flush(self._monotonic())
+    
+    def _flush(self, current_time: float):
+        """Push buffered output to the terminal"""
+        self._out.flush()
+        self._out_pending = False
+        self._last_flush = current_time
     
     def process_key(self, key: str):
         """Process key press and control motors directly with safety limits"""
+        # Table lookup instead of an if/elif chain - unknown keys are ignored
+        handler = self._key_handlers.get(key)
+        return handler() if handler else True
+    
+    def _drive_axis(self, axis: str, direction: str, label: str, set_direction, set_speed, stop):
+        """Run one axis in the given direction at the current speed, subject to safety limits"""
+        self._write(f"{label}\n")
         # Calculate actual motor speed (UI speed * multiplier)
-        actual_speed = min(100.0, self.continuous_speed * self.speed_multiplier)
-        
-        if key == '\x1b[A':  # Up arrow - Y motor forward
-            print("↑ Y UP")
-            safe_speed = self._check_motor_safety('y', 'forward', actual_speed)
-            if safe_speed > 0:
-                self.tv_controller.y_motor.set_direction_forward()
-                self.tv_controller.y_motor.set_speed(safe_speed)
-            else:
-                print("🛑 Y SAFETY STOP")
-                self.tv_controller.y_motor.stop_motor()
-        elif key == '\x1b[B':  # Down arrow - Y motor reverse
-            print("↓ Y DOWN")
-            safe_speed = self._check_motor_safety('y', 'reverse', actual_speed)
-            if safe_speed > 0:
-                self.tv_controller.y_motor.set_direction_reverse()
-                self.tv_controller.y_motor.set_speed(safe_speed)
-            else:
-                print("🛑 Y SAFETY STOP")
-                self.tv_controller.y_motor.stop_motor()
-        elif key == '\x1b[C':  # Right arrow - X motor forward
-            print("→ X RIGHT")
-            safe_speed = self._check_motor_safety('x', 'forward', actual_speed)
-            if safe_speed > 0:
-                self.tv_controller.x_motor.set_direction_forward()
-                self.tv_controller.x_motor.set_speed(safe_speed)
-            else:
-                print("🛑 X SAFETY STOP")
-                self.tv_controller.x_motor.stop_motor()
-        elif key == '\x1b[D':  # Left arrow - X motor reverse
-            print("← X LEFT")
-            safe_speed = self._check_motor_safety('x', 'reverse', actual_speed)
-            if safe_speed > 0:
-                self.tv_controller.x_motor.set_direction_reverse()
-                self.tv_controller.x_motor.set_speed(safe_speed)
-            else:
-                print("🛑 X SAFETY STOP")
-                self.tv_controller.x_motor.stop_motor()
-        elif key == ' ':  # Spacebar - stop all
-            print("⏹️  STOP ALL")
-            self.tv_controller.x_motor.stop_motor()
-            self.tv_controller.y_motor.stop_motor()
-        elif key == 'q' or key == '\x03':  # Q or Ctrl+C
-            print("🚪 QUIT")
-            self.running = False
-            return False
-        elif key == '+':  # Increase speed
-            self.continuous_speed = min(100.0, self.continuous_speed + 5.0)
-            print(f"⚡ Speed: {self.continuous_speed:.0f}%")
-        elif key == '-':  # Decrease speed
-            self.continuous_speed = max(10.0, self.continuous_speed - 5.0)
-            print(f"⚡ Speed: {self.continuous_speed:.0f}%")
-        elif key == 's':  # Show current position
-            try:
-                x, y = self.tv_controller.get_current_position()
-                print(f"📍 Position: X={x:.1f}%, Y={y:.1f}%")
-            except:
-                print("❌ Error reading position")
-        
+        actual_speed = self.continuous_speed * self.speed_multiplier
+        if actual_speed > 100.0:
+            actual_speed = 100.0
+        safe_speed = self._check_motor_safety(axis, direction, actual_speed)
+        if safe_speed > 0:
+            # Key auto-repeat re-sends the same command - skip the GPIO writes if nothing changed
+            cmd = (direction, safe_speed)
+            if self._last_cmd[axis] != cmd:
+                set_direction()
+                set_speed(safe_speed)
+                self._last_cmd[axis] = cmd
+        else:
+            self._urgent(f"🛑 {axis.upper()} SAFETY STOP\n")
+            stop()
+            self._last_cmd[axis] = None
+        return True
+    
+    def _y_forward(self):
+        """Up arrow - Y motor forward"""
+        return self._drive_axis('y', 'forward', "↑ Y UP", self._y_fwd, self._y_speed, self._y_stop)
+    
+    def _y_reverse(self):
+        """Down arrow - Y motor reverse"""
+        return self._drive_axis('y', 'reverse', "↓ Y DOWN", self._y_rev, self._y_speed, self._y_stop)
+    
+    def _x_forward(self):
+        """Right arrow - X motor forward"""
+        return self._drive_axis('x', 'forward', "→ X RIGHT", self._x_fwd, self._x_speed, self._x_stop)
+    
+    def _x_reverse(self):
+        """Left arrow - X motor reverse"""
+        return self._drive_axis('x', 'reverse', "← X LEFT", self._x_rev, self._x_speed, self._x_stop)
+    
+    def _stop_all(self):
+        """Spacebar - stop all"""
+        self._urgent("⏹️  STOP ALL\n")
+        self._stop_motors()
+        return True
+    
+    def _stop_motors(self):
+        """Stop both motors and forget the last issued commands"""
+        self._stop_both()
+        self._last_cmd['x'] = self._last_cmd['y'] = None
+    
+    def _quit(self):
+        """Q or Ctrl+C - leave manual control"""
+        self._urgent("🚪 QUIT\n")
+        self.running = False
+        return False
+    
+    def _speed_up(self):
+        """Increase speed"""
+        speed = self.continuous_speed + 5.0
+        self.continuous_speed = speed if speed < 100.0 else 100.0
+        self._write(f"⚡ Speed: {self.continuous_speed:.0f}%\n")
         return True
     
-    def _get_cached_position(self):
-        """Get position with caching and I2C deadlock prevention"""
-        current_time = time.time()
-        if current_time - self.last_position_read > self.position_cache_duration:
-            # Use lock to serialize I2C operations and prevent deadlock
-            if self.i2c_lock.acquire(blocking=False):  # Non-blocking acquire
-                try:
-                    self.cached_x_pos, self.cached_y_pos = self.tv_controller.get_current_position()
-                    self.last_position_read = current_time
-                except Exception as e:
-                    print(f"❌ Position read error: {e}")
-                    # Keep using cached values on error - prevents deadlock
-                finally:
-                    self.i2c_lock.release()
-            # If lock not available, use cached values (prevents blocking)
-        return self.cached_x_pos, self.cached_y_pos
+    def _speed_down(self):
+        """Decrease speed"""
+        speed = self.continuous_speed - 5.0
+        self.continuous_speed = speed if speed > 10.0 else 10.0
+        self._write(f"⚡ Speed: {self.continuous_speed:.0f}%\n")
+        return True
+    
+    def _show_position(self):
+        """Show current position"""
+        snap = self._fresh_snapshot()
+        if snap:
+            self._write(f"📍 Position: X={snap[0]:.1f}%, Y={snap[1]:.1f}%\n")
+        else:
+            self._write("❌ Error reading position\n")
+        return True
+    
+    def _sampler(self):
+        """Background thread: the only place that touches the I2C sensors during manual control"""
+        tv = self.tv_controller
+        while self.running:
+            try:
+                x, y = tv.get_current_position()
+                x_voltage = tv.x_sensor.read_voltage()
+                y_voltage = tv.y_sensor.read_voltage()
+            except Exception:
+                x = None  # Keep the previous snapshot; it ages out via snapshot_max_age
+            if x is not None:
+                # Single reference assignment - atomic under the GIL
+                self._snapshot = (x, y, x_voltage, y_voltage, self._monotonic())
+            time.sleep(self.sample_interval)
+    
+    def _fresh_snapshot(self) -> Optional[tuple]:
+        """Latest sensor snapshot, or None if none yet or it has gone stale"""
+        snap = self._snapshot
+        if snap is None or self._monotonic() - snap[4] > self.snapshot_max_age:
+            return None
+        return snap
+    
+    def _get_cached_position(self) -> Optional[Tuple[float, float]]:
+        """Last sampled position without touching the I2C bus, or None if none yet or it has gone stale"""
+        snap = self._fresh_snapshot()
+        if snap is None:
+            return None
+        return snap[0], snap[1]
     
     def _check_motor_safety(self, axis: str, direction: str, requested_speed: float) -> float:
         """Check safety limits and return safe speed (0 = stop)"""
         try:
             # Throttle safety checks to prevent I2C deadlock
-            current_time = time.time()
+            current_time = self._monotonic()
             if current_time - self.last_safety_check < self.safety_check_interval:
                 return requested_speed  # Skip safety check, use last known safe speed
             
             self.last_safety_check = current_time
             
-            # Get cached position to reduce I2C calls
-            x_pos, y_pos = self._get_cached_position()
-            
-            if axis == 'x':
-                # Get X sensor voltage with I2C lock protection
-                if self.i2c_lock.acquire(blocking=False):  # Non-blocking acquire
-                    try:
-                        current_voltage = self.tv_controller.x_sensor.read_voltage()
-                    except Exception as e:
-                        print(f"❌ X voltage read error: {e}")
-                        return requested_speed  # Allow movement on sensor error
-                    finally:
-                        self.i2c_lock.release()
-                else:
-                    return requested_speed  # Skip safety check if I2C busy
-                config = self.tv_controller.config['hardware']['calibration']['x_axis']
-            else:
-                # Get Y sensor voltage with I2C lock protection
-                if self.i2c_lock.acquire(blocking=False):  # Non-blocking acquire
-                    try:
-                        current_voltage = self.tv_controller.y_sensor.read_voltage()
-                    except Exception as e:
-                        print(f"❌ Y voltage read error: {e}")
-                        return requested_speed  # Allow movement on sensor error
-                    finally:
-                        self.i2c_lock.release()
-                else:
-                    return requested_speed  # Skip safety check if I2C busy
-                config = self.tv_controller.config['hardware']['calibration']['y_axis']
+            # Per-axis settings precomputed in __init__ - one lookup instead of six
+            params = self._safety_params[axis]
+            if params is None:
+                self._urgent(f"❌ Safety check error for {axis}: no calibration for this axis\n")
+                return 0  # Stop on error for safety
+            (min_voltage, max_voltage, safety_margin, slow_zone_margin,
+             safety_slow_speed, check_limits, voltage_slot) = params
             
-            # Get safety settings
-            min_voltage = config['min_voltage']
-            max_voltage = config['max_voltage']
-            safety_margin = config.get('safety_margin', 0.05)
-            slow_zone_margin = config.get('slow_zone_margin', 0.1)
-            safety_slow_speed = config.get('safety_slow_speed', 30)
+            # Voltage comes from the sampler snapshot - never blocks on the I2C bus
+            snap = self._fresh_snapshot()
+            if snap is None:
+                self._write(f"❌ No recent {axis.upper()} voltage sample\n")
+                return requested_speed  # Allow movement on sensor error
+            current_voltage = snap[voltage_slot]
             
-            # Debug output
-            print(f"\n🔍 {axis.upper()} Safety Check:")
-            print(f"   Voltage: {current_voltage:.3f}V, Range: {min_voltage:.3f}V-{max_voltage:.3f}V")
-            print(f"   Margins: safety={safety_margin:.3f}V, slow={slow_zone_margin:.3f}V")
-            print(f"   Direction: {direction}, Requested: {requested_speed:.1f}%")
+            # Debug output (TVARM_DEBUG=1) - skipped entirely otherwise
+            if self._debug:
+                self._write(f"\n🔍 {axis.upper()} Safety Check:\n")
+                self._write(f"   Voltage: {current_voltage:.3f}V, Range: {min_voltage:.3f}V-{max_voltage:.3f}V\n")
+                self._write(f"   Margins: safety={safety_margin:.3f}V, slow={slow_zone_margin:.3f}V\n")
+                self._write(f"   Direction: {direction}, Requested: {requested_speed:.1f}%\n")
             
             # Check safety using motor's safety method
-            if axis == 'x':
-                should_stop, max_speed = self.tv_controller.x_motor.check_safety_limits(
-                    current_voltage, min_voltage, max_voltage, 
-                    safety_margin, slow_zone_margin, safety_slow_speed, direction)
-            else:
-                should_stop, max_speed = self.tv_controller.y_motor.check_safety_limits(
-                    current_voltage, min_voltage, max_voltage,
-                    safety_margin, slow_zone_margin, safety_slow_speed, direction)
+            should_stop, max_speed = check_limits(
+                current_voltage, min_voltage, max_voltage,
+                safety_margin, slow_zone_margin, safety_slow_speed, direction)
             
-            print(f"   Result: stop={should_stop}, max_speed={max_speed:.1f}%")
+            if self._debug:
+                self._write(f"   Result: stop={should_stop}, max_speed={max_speed:.1f}%\n")
             
             if should_stop:
-                print(f"   🛑 STOPPING {axis.upper()} motor")
+                self._urgent(f"   🛑 STOPPING {axis.upper()} motor\n")
                 return 0
             else:
-                final_speed = min(requested_speed, max_speed)
-                print(f"   ✅ {axis.upper()} speed: {requested_speed:.1f}% → {final_speed:.1f}%")
+                final_speed = requested_speed if requested_speed < max_speed else max_speed
+                if self._debug:
+                    self._write(f"   ✅ {axis.upper()} speed: {requested_speed:.1f}% → {final_speed:.1f}%\n")
                 return final_speed
                 
         except Exception as e:
-            print(f"❌ Safety check error for {axis}: {e}")
+            self._write(f"❌ Safety check error for {axis}: {e}\n")
             return 0  # Stop on error for safety
     
-    def control_loop(self):
-        """Main control loop for position display"""
-        last_position_update = 0
-        
-        while self.running:
-            try:
-                # Get current position periodically
-                current_time = time.time()
-                if current_time - last_position_update > self.position_update_interval:
-                    try:
-                        x, y = self._get_cached_position()
-                        print(f"\r📍 X={x:5.1f}%, Y={y:5.1f}% | Speed: {self.continuous_speed:.0f}%        ", end="", flush=True)
-                        last_position_update = current_time
-                    except:
-                        pass
-                
-                time.sleep(0.02)  # Much faster response time (20ms for immediate stop)
-                
-            except Exception as e:
-                print(f"\n❌ Error in control loop: {e}")
-                break
+    def _update_position_display(self):
+        """Redraw the position status line, skipping the write when nothing visible changed"""
+        position = self._get_cached_position()
+        speed = round(self.continuous_speed)
+        if position is None:
+            status, fmt = (speed,), _STATUS_NO_POS_FMT
+        else:
+            status, fmt = (round(position[0], 1), round(position[1], 1), speed), _STATUS_FMT
+        if status != self._last_status:
+            self._last_status = status
+            self._write(fmt % status)
     
     def run(self):
         """Run manual control mode"""
@@ -279,36 +399,16 @@ class ManualController:
         try:
             self.running = True
             
-            # Start control loop thread
-            self.control_thread = threading.Thread(target=self.control_loop, daemon=True)
-            self.control_thread.start()
+            # Sensor sampling runs on its own thread so I2C settle delays never stall keys
+            self.sampler_thread = threading.Thread(target=self._sampler, daemon=True)
+            self.sampler_thread.start()
             
-            # Main key processing loop
-            last_key_time = 0
-            key_timeout = 0.15  # Stop motors if no key pressed for 150ms
-            
-            while self.running:
-                key = self.get_key()
-                current_time = time.time()
-                
-                if key:
-                    last_key_time = current_time
-                    if not self.process_key(key):
-                        break
-                else:
-                    # No key pressed - check if we should stop motors
-                    if current_time - last_key_time > key_timeout:
-                        # Stop motors if no key has been pressed recently
-                        self.tv_controller.x_motor.stop_motor()
-                        self.tv_controller.y_motor.stop_motor()
-                        last_key_time = current_time  # Reset to prevent repeated stopping
-                
-                time.sleep(0.02)  # Faster key detection (20ms for responsive control)
+            asyncio.run(self.run_async())
             
             # Stop all motors when exiting
-            self.tv_controller.x_motor.stop_motor()
-            self.tv_controller.y_motor.stop_motor()
+            self._stop_motors()
             
+            self._flush(self._monotonic())
             print("\n🛑 Manual control stopped - motors stopped")
             return True
             
@@ -320,9 +420,63 @@ class ManualController:
             return False
         finally:
             self.running = False
+            if self.sampler_thread and self.sampler_thread.is_alive():
+                self.sampler_thread.join(timeout=2)
+            self._flush(self._monotonic())  # Never leave buffered output behind
             self.restore_terminal()
 
 
+    async def run_async(self):
+        """Single-threaded key/display loop: stdin readiness and timers drive everything"""
+        loop = self._loop = asyncio.get_running_loop()
+        self._done = loop.create_future()
+        stdin_fd = sys.stdin.fileno()
+        loop.add_reader(stdin_fd, self._on_stdin)
+        self._key_timer = loop.call_soon(self._on_key_timeout)
+        self._tick()
+        try:
+            await self._done
+        finally:
+            loop.remove_reader(stdin_fd)
+            for timer in (self._key_timer, self._tick_timer, self._flush_timer):
+                if timer:
+                    timer.cancel()
+            self._key_timer = self._tick_timer = self._flush_timer = None
+            self._loop = None
+    
+    def _on_stdin(self):
+        """stdin readable - dispatch every key that arrived"""
+        try:
+            key = self.get_key()
+            while key is not None:
+                if not self.process_key(key):
+                    if not self._done.done():
+                        self._done.set_result(None)
+                    return
+                key = self.get_key()
+        except Exception as e:
+            # Surface handler errors in run() instead of the loop's default logger
+            if not self._done.done():
+                self._done.set_exception(e)
+            return
+        # Any key re-arms the release timeout
+        self._key_timer.cancel()
+        self._key_timer = self._loop.call_later(self.key_timeout, self._on_key_timeout)
+        self._flush_later()
+    
+    def _on_key_timeout(self):
+        """No key pressed recently - stop motors (repeats every key_timeout while idle)"""
+        self._stop_motors()
+        self._key_timer = self._loop.call_later(self.key_timeout, self._on_key_timeout)
+        self._flush_later()
+    
+    def _tick(self):
+        """Periodic status redraw"""
+        self._update_position_display()
+        self._tick_timer = self._loop.call_later(self.position_update_interval, self._tick)
+        self._flush_later()
+
+
 def main():
     """Test manual control standalone"""
     import yaml
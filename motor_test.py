@@ -3,8 +3,9 @@
 Simple Motor Test - Test DC motors directly without complex control loops
 """
 
-import time
 import sys
+import asyncio
+import threading
 
 try:
     import RPi.GPIO as GPIO
@@ -12,7 +13,51 @@ except ImportError:
     print("RPi.GPIO not available - simulation mode")
     GPIO = None
 
-def test_motor(ain1_pin, ain2_pin, pwm_pin, stby_pin, motor_name):
+try:
+    import pigpio
+except ImportError:
+    pigpio = None  # Fall back to RPi.GPIO software PWM
+
+# GPIO.setmode/setup touch process-wide state - serialise them across motor threads
+gpio_setup_lock = threading.Lock()
+# Set on interrupt so both motor threads stop at their next observation wait
+stop_requested = threading.Event()
+
+# Pins wired to the SoC's two hardware PWM channels
+HARDWARE_PWM_PINS = (12, 13, 18, 19)
+PWM_FREQUENCY = 1000  # 1kHz
+
+class HardwarePWM:
+    """pigpio hardware PWM behind the same start/ChangeDutyCycle/stop calls as GPIO.PWM"""
+    
+    def __init__(self, pi, pin, frequency):
+        if pin not in HARDWARE_PWM_PINS:
+            raise ValueError(f"GPIO {pin} has no hardware PWM channel (use one of {HARDWARE_PWM_PINS})")
+        self.pi = pi
+        self.pin = pin
+        self.frequency = frequency
+    
+    def start(self, duty_cycle):
+        self.ChangeDutyCycle(duty_cycle)
+    
+    def ChangeDutyCycle(self, duty_cycle):
+        # pigpio takes duty in millionths (0-1_000_000)
+        self.pi.hardware_PWM(self.pin, self.frequency, int(duty_cycle * 10000))
+    
+    def stop(self):
+        self.pi.hardware_PWM(self.pin, 0, 0)
+
+def connect_pigpio():
+    """Connect to the pigpio daemon, or return None to use software PWM"""
+    if not pigpio:
+        return None
+    pi = pigpio.pi()
+    if not pi.connected:
+        print("⚠️  pigpio daemon not running - using software PWM")
+        return None
+    return pi
+
+def test_motor(ain1_pin, ain2_pin, pwm_pin, stby_pin, motor_name, pi=None):
     """Test a single DC motor"""
     print(f"\n🔧 Testing {motor_name} Motor")
     print(f"Pins: AIN1={ain1_pin}, AIN2={ain2_pin}, PWM={pwm_pin}, STBY={stby_pin}")
@@ -23,32 +68,38 @@ def test_motor(ain1_pin, ain2_pin, pwm_pin, stby_pin, motor_name):
     
     try:
         # Setup GPIO
-        GPIO.setmode(GPIO.BCM)
-        GPIO.setwarnings(False)
-        GPIO.setup(ain1_pin, GPIO.OUT)
-        GPIO.setup(ain2_pin, GPIO.OUT)
-        GPIO.setup(pwm_pin, GPIO.OUT)
-        if stby_pin:
-            GPIO.setup(stby_pin, GPIO.OUT)
-            GPIO.output(stby_pin, GPIO.HIGH)  # Enable motor driver
+        with gpio_setup_lock:
+            GPIO.setmode(GPIO.BCM)
+            GPIO.setwarnings(False)
+            GPIO.setup(ain1_pin, GPIO.OUT)
+            GPIO.setup(ain2_pin, GPIO.OUT)
+            if stby_pin:
+                GPIO.setup(stby_pin, GPIO.OUT)
+                GPIO.output(stby_pin, GPIO.HIGH)  # Enable motor driver
         
-        # Setup PWM
-        pwm = GPIO.PWM(pwm_pin, 1000)  # 1kHz frequency
+        # Setup PWM - hardware channel when pigpio is available, else software
+        if pi and pwm_pin in HARDWARE_PWM_PINS:
+            pwm = HardwarePWM(pi, pwm_pin, PWM_FREQUENCY)
+            print(f"⚡ Hardware PWM on GPIO {pwm_pin}")
+        else:
+            with gpio_setup_lock:
+                GPIO.setup(pwm_pin, GPIO.OUT)
+                pwm = GPIO.PWM(pwm_pin, PWM_FREQUENCY)
         pwm.start(0)
         
         print("✅ GPIO setup complete")
         
         # Test sequence
         tests = [
-            ("STOP", lambda: stop_motor(ain1_pin, ain2_pin, pwm)),
-            ("FORWARD 30%", lambda: (set_forward(ain1_pin, ain2_pin), pwm.ChangeDutyCycle(30))),
-            ("FORWARD 60%", lambda: (set_forward(ain1_pin, ain2_pin), pwm.ChangeDutyCycle(60))),
-            ("FORWARD 90%", lambda: (set_forward(ain1_pin, ain2_pin), pwm.ChangeDutyCycle(90))),
-            ("STOP", lambda: stop_motor(ain1_pin, ain2_pin, pwm)),
-            ("REVERSE 30%", lambda: (set_reverse(ain1_pin, ain2_pin), pwm.ChangeDutyCycle(30))),
-            ("REVERSE 60%", lambda: (set_reverse(ain1_pin, ain2_pin), pwm.ChangeDutyCycle(60))),
-            ("REVERSE 90%", lambda: (set_reverse(ain1_pin, ain2_pin), pwm.ChangeDutyCycle(90))),
-            ("STOP", lambda: stop_motor(ain1_pin, ain2_pin, pwm))
+            ("STOP", lambda: stop_motor(ain1_pin, ain2_pin, pwm, pi)),
+            ("FORWARD 30%", lambda: (set_forward(ain1_pin, ain2_pin, pi), pwm.ChangeDutyCycle(30))),
+            ("FORWARD 60%", lambda: (set_forward(ain1_pin, ain2_pin, pi), pwm.ChangeDutyCycle(60))),
+            ("FORWARD 90%", lambda: (set_forward(ain1_pin, ain2_pin, pi), pwm.ChangeDutyCycle(90))),
+            ("STOP", lambda: stop_motor(ain1_pin, ain2_pin, pwm, pi)),
+            ("REVERSE 30%", lambda: (set_reverse(ain1_pin, ain2_pin, pi), pwm.ChangeDutyCycle(30))),
+            ("REVERSE 60%", lambda: (set_reverse(ain1_pin, ain2_pin, pi), pwm.ChangeDutyCycle(60))),
+            ("REVERSE 90%", lambda: (set_reverse(ain1_pin, ain2_pin, pi), pwm.ChangeDutyCycle(90))),
+            ("STOP", lambda: stop_motor(ain1_pin, ain2_pin, pwm, pi))
         ]
         
         for test_name, test_func in tests:
@@ -58,10 +109,14 @@ def test_motor(ain1_pin, ain2_pin, pwm_pin, stby_pin, motor_name):
             if "STOP" not in test_name:
                 print(f"   Motor should be moving {test_name}")
                 print("   Check for physical movement...")
-                time.sleep(3)  # Give time to observe movement
+                stop_requested.wait(3)  # Give time to observe movement
             else:
                 print("   Motor should be stopped")
-                time.sleep(1)
+                stop_requested.wait(1)
+            
+            if stop_requested.is_set():
+                print(f"⏹️  {motor_name} test stopped")
+                break
         
         print(f"\n✅ {motor_name} motor test complete")
         pwm.stop()
@@ -74,50 +129,78 @@ def test_motor(ain1_pin, ain2_pin, pwm_pin, stby_pin, motor_name):
         except:
             pass
 
-def set_forward(ain1_pin, ain2_pin):
+def set_forward(ain1_pin, ain2_pin, pi=None):
     """Set motor direction to forward"""
-    GPIO.output(ain1_pin, GPIO.HIGH)
-    GPIO.output(ain2_pin, GPIO.LOW)
+    if pi:
+        # Bank writes: drop the old pin before raising the new one, never both HIGH
+        pi.clear_bank_1(1 << ain2_pin)
+        pi.set_bank_1(1 << ain1_pin)
+    else:
+        GPIO.output(ain1_pin, GPIO.HIGH)
+        GPIO.output(ain2_pin, GPIO.LOW)
     print(f"   GPIO {ain1_pin}=HIGH, GPIO {ain2_pin}=LOW (FORWARD)")
 
-def set_reverse(ain1_pin, ain2_pin):
+def set_reverse(ain1_pin, ain2_pin, pi=None):
     """Set motor direction to reverse"""
-    GPIO.output(ain1_pin, GPIO.LOW)
-    GPIO.output(ain2_pin, GPIO.HIGH)
+    if pi:
+        pi.clear_bank_1(1 << ain1_pin)
+        pi.set_bank_1(1 << ain2_pin)
+    else:
+        GPIO.output(ain1_pin, GPIO.LOW)
+        GPIO.output(ain2_pin, GPIO.HIGH)
     print(f"   GPIO {ain1_pin}=LOW, GPIO {ain2_pin}=HIGH (REVERSE)")
 
-def stop_motor(ain1_pin, ain2_pin, pwm):
+def stop_motor(ain1_pin, ain2_pin, pwm, pi=None):
     """Stop motor"""
-    GPIO.output(ain1_pin, GPIO.LOW)
-    GPIO.output(ain2_pin, GPIO.LOW)
+    if pi:
+        pi.clear_bank_1((1 << ain1_pin) | (1 << ain2_pin))  # Both pins in one write
+    else:
+        GPIO.output(ain1_pin, GPIO.LOW)
+        GPIO.output(ain2_pin, GPIO.LOW)
     pwm.ChangeDutyCycle(0)
     print(f"   GPIO {ain1_pin}=LOW, GPIO {ain2_pin}=LOW, PWM=0% (STOP)")
 
+async def test_both_motors(pi=None):
+    """Run the X and Y motor sequences concurrently, each in its own thread"""
+    try:
+        await asyncio.gather(
+            # Test X-axis motor (Motor A)
+            asyncio.to_thread(
+                test_motor,
+                ain1_pin=17,  # GPIO 17 - AIN1
+                ain2_pin=27,  # GPIO 27 - AIN2
+                pwm_pin=18,   # GPIO 18 - PWMA
+                stby_pin=24,  # GPIO 24 - STBY
+                motor_name="X-AXIS",
+                pi=pi
+            ),
+            # Test Y-axis motor (Motor B)
+            asyncio.to_thread(
+                test_motor,
+                ain1_pin=22,  # GPIO 22 - BIN1
+                ain2_pin=23,  # GPIO 23 - BIN2
+                pwm_pin=19,   # GPIO 19 - PWMB
+                stby_pin=None,  # Shared STBY pin
+                motor_name="Y-AXIS",
+                pi=pi
+            )
+        )
+    finally:
+        # Threads can't be cancelled - tell them to stop (Ctrl+C cancels the gather)
+        stop_requested.set()
+
 def main():
     print("🚀 DC Motor Hardware Test")
     print("=" * 40)
-    print("This will test each motor at different speeds")
+    print("This will test both motors at the same time at different speeds")
     print("Watch for physical movement and listen for motor sounds")
     print()
     
+    pi = connect_pigpio()
+    
     try:
-        # Test X-axis motor (Motor A)
-        test_motor(
-            ain1_pin=17,  # GPIO 17 - AIN1
-            ain2_pin=27,  # GPIO 27 - AIN2
-            pwm_pin=18,   # GPIO 18 - PWMA
-            stby_pin=24,  # GPIO 24 - STBY
-            motor_name="X-AXIS"
-        )
-        
-        # Test Y-axis motor (Motor B)
-        test_motor(
-            ain1_pin=22,  # GPIO 22 - BIN1
-            ain2_pin=23,  # GPIO 23 - BIN2
-            pwm_pin=19,   # GPIO 19 - PWMB
-            stby_pin=None,  # Shared STBY pin
-            motor_name="Y-AXIS"
-        )
+        # The motors are on independent driver channels, so test both at once
+        asyncio.run(test_both_motors(pi))
         
         print("\n🎉 Motor test completed!")
         print("If motors didn't move, check:")
@@ -131,6 +214,8 @@ def main():
     except Exception as e:
         print(f"\n❌ Motor test failed: {e}")
     finally:
+        if pi:
+            pi.stop()
         if GPIO:
             GPIO.cleanup()
             print("🧹 GPIO cleanup complete")
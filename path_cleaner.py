@@ -3,30 +3,231 @@
 Path Cleaner - Utility to clean and optimize recorded TV arm paths
 - Make paths unidirectional (one-way only)
 - Reduce data points by removing every 2nd point
+- Or decimate with Ramer-Douglas-Peucker (--rdp-eps) to keep only shape-defining points
+- Or prune colinear points in one pass (--prune-colinear)
+- Optionally store cleaned paths as columnar .npz (--to-npz)
 - Clean up recorded movement data
 """
 
 import json
 import os
 import sys
+import math
+import time
 import argparse
+import contextlib
+import heapq
+import io
+import mmap
+from array import array
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Any
 import shutil
 from datetime import datetime
 
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Fall back to the stdlib json codec
+
+try:
+    import ijson
+except ImportError:
+    ijson = None  # Fall back to loading the whole file
+
+# ijson events that carry a value (everything else opens/closes a container)
+_SCALAR_EVENTS = frozenset(('null', 'boolean', 'integer', 'double', 'number', 'string'))
+
+from _numba_compat import njit, NUMBA_AVAILABLE  # Optional numba with a plain-Python fallback
+
+try:
+    import _rdp_kernel  # Cython build of the RDP kernel (cythonize -i _rdp_kernel.pyx)
+except ImportError:
+    _rdp_kernel = None
+
+
+@njit(cache=True)
+def _rdp_mark(xs, ys, eps, keep):
+    """
+    Iterative Ramer-Douglas-Peucker over parallel x/y buffers
+    Sets keep[i] for every point that survives; first and last are always kept
+    """
+    n = len(xs)
+    if n == 0:
+        return
+    keep[0] = True
+    keep[n - 1] = True
+    
+    # Explicit (lo, hi) stack - each push pair keeps one more point, so n slots suffice
+    stack_lo = np.empty(n, dtype=np.int64)
+    stack_hi = np.empty(n, dtype=np.int64)
+    stack_lo[0] = 0
+    stack_hi[0] = n - 1
+    top = 1
+    while top > 0:
+        top -= 1
+        lo = stack_lo[top]
+        hi = stack_hi[top]
+        if hi - lo < 2:
+            continue
+        
+        x1, y1 = xs[lo], ys[lo]
+        x2, y2 = xs[hi], ys[hi]
+        dx = x2 - x1
+        dy = y2 - y1
+        chord = math.hypot(dx, dy)
+        
+        max_dist = -1.0
+        max_idx = lo
+        for i in range(lo + 1, hi):
+            if chord > 0.0:
+                # Perpendicular distance from point i to the chord lo -> hi
+                dist = abs(dx * (y1 - ys[i]) - (x1 - xs[i]) * dy) / chord
+            else:
+                # Chord collapsed to a point (path returns to where it started)
+                dist = math.hypot(xs[i] - x1, ys[i] - y1)
+            if dist > max_dist:
+                max_dist = dist
+                max_idx = i
+        
+        if max_dist > eps:
+            keep[max_idx] = True
+            stack_lo[top] = lo
+            stack_hi[top] = max_idx
+            top += 1
+            stack_lo[top] = max_idx
+            stack_hi[top] = hi
+            top += 1
+        # else: every interior point of lo..hi stays dropped
+
+
+@njit(cache=True)
+def _restore_max_step(xs, ys, keep, max_step):
+    """
+    Edge clearance for colinear pruning: wherever dropping points would leave a
+    jump longer than max_step between kept points, keep the last point before it
+    """
+    last = 0
+    for i in range(1, len(xs)):
+        if i - 1 > last and math.hypot(xs[i] - xs[last], ys[i] - ys[last]) > max_step:
+            keep[i - 1] = True
+            last = i - 1
+        if keep[i]:
+            last = i
+
+
+@contextlib.contextmanager
+def _mapped(file_path):
+    """Read-only mmap of a file, so parsers read straight from the page cache"""
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b''  # mmap refuses empty files; let the parser report it
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield mm
+
+
+def _write_all(file_path, data: bytes):
+    """Write bytes into a preallocated file with os.pwrite - no stdio buffer in between"""
+    fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        if data and hasattr(os, 'posix_fallocate'):
+            os.posix_fallocate(fd, 0, len(data))
+        view = memoryview(data)
+        offset = 0
+        while offset < len(view):
+            offset += os.pwrite(fd, view[offset:], offset)
+    finally:
+        os.close(fd)
+
+
+def _link_or_copy(src, dst):
+    """copytree copy_function: hardlink the file, copying only across filesystems"""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+    return dst
+
+
+def _vw_indices(xs, ys, k: int):
+    """
+    Visvalingam-Whyatt: repeatedly drop the point whose triangle with its
+    neighbours has the smallest area until k points remain (endpoints stay)
+    """
+    n = len(xs)
+    prev = list(range(-1, n - 1))
+    nxt = list(range(1, n + 1))
+    removed = [False] * n
+    
+    def area(i):
+        a, c = prev[i], nxt[i]
+        return abs((xs[i] - xs[a]) * (ys[c] - ys[a]) - (xs[c] - xs[a]) * (ys[i] - ys[a])) * 0.5
+    
+    # Min-heap with lazy deletion: entries whose area no longer matches are stale
+    current = [0.0] * n
+    heap = []
+    for i in range(1, n - 1):
+        current[i] = area(i)
+        heap.append((current[i], i))
+    heapq.heapify(heap)
+    
+    remaining = n
+    while remaining > k and heap:
+        a, i = heapq.heappop(heap)
+        if removed[i] or a != current[i]:
+            continue
+        removed[i] = True
+        remaining -= 1
+        p, q = prev[i], nxt[i]
+        nxt[p] = q
+        prev[q] = p
+        # Neighbours get new triangles (never smaller than the one just removed)
+        for j in (p, q):
+            if 0 < j < n - 1:
+                current[j] = max(area(j), a)
+                heapq.heappush(heap, (current[j], j))
+    
+    return np.flatnonzero(~np.array(removed, dtype=np.bool_))
+
+
+def _clean_one(job):
+    """
+    Worker entry point for clean_all_paths - runs one PathCleaner method on one file in a child process
+    Output is captured and returned so the parent can print it in file order
+    """
+    paths_directory, settings, method, file_path, args = job
+    log = io.StringIO()
+    with contextlib.redirect_stdout(log):
+        ok = getattr(PathCleaner(paths_directory, **settings), method)(file_path, *args)
+    return file_path, ok, log.getvalue()
+
+
+# Written next to the paths by --uniform-count; not a path file itself
+MANIFEST_NAME = "manifest.json"
+
 
 class PathCleaner:
     """Cleans and optimizes recorded TV arm movement paths"""
     
-    def __init__(self, paths_directory: str = "recorded_paths"):
+    def __init__(self, paths_directory: str = "recorded_paths", pretty: bool = False, to_npz: bool = False):
         self.paths_directory = Path(paths_directory)
         self.backup_directory = Path(f"{paths_directory}_backup")
+        self.pretty = pretty  # Indented JSON for humans; compact by default
+        self.to_npz = to_npz  # Write cleaned JSON paths back as .npz
         
         if not self.paths_directory.exists():
             print(f"Error: Paths directory '{paths_directory}' not found!")
             sys.exit(1)
     
+    def path_files(self) -> List[Path]:
+        """All path files (JSON or NPZ) in the directory (the manifest is skipped)"""
+        return [file_path for pattern in ("*.json", "*.npz") for file_path in self.paths_directory.glob(pattern)
+                if file_path.name != MANIFEST_NAME]
+    
     def backup_paths(self):
         """Create backup of original paths before cleaning"""
         if self.backup_directory.exists():
@@ -36,41 +237,209 @@ class PathCleaner:
             shutil.move(str(self.backup_directory), str(backup_path))
             print(f"Moved existing backup to: {backup_name}")
         
-        shutil.copytree(str(self.paths_directory), str(self.backup_directory))
+        # Hardlinks are safe because save_path_file replaces files instead of rewriting them
+        shutil.copytree(str(self.paths_directory), str(self.backup_directory), copy_function=_link_or_copy)
         print(f"✅ Backup created: {self.backup_directory}")
     
     def load_path_file(self, file_path: Path) -> Dict[str, Any]:
         """Load a path JSON file"""
         try:
+            if orjson:
+                with _mapped(file_path) as data, memoryview(data) as view:
+                    return orjson.loads(view)
             with open(file_path, 'r') as f:
                 return json.load(f)
         except Exception as e:
             print(f"❌ Error loading {file_path}: {e}")
             return None
     
-    def save_path_file(self, file_path: Path, path_data: Dict[str, Any]):
-        """Save a path JSON file"""
+    def load_path_header(self, file_path: Path, keys=None) -> Dict[str, Any]:
+        """
+        Load only the top-level scalar fields of a path file
+        With ijson parsing stops at the points array, or once every one of keys is found
+        """
+        if file_path.suffix == '.npz':
+            loaded = self.load_path_npz(file_path, points=False)
+            return loaded and loaded[0]
+        
+        if ijson is None:
+            path_data = self.load_path_file(file_path)
+            if path_data is not None:
+                path_data.pop('points', None)
+            return path_data
+        
         try:
-            with open(file_path, 'w') as f:
-                json.dump(path_data, f, indent=2)
+            header = {}
+            with open(file_path, 'rb') as f:
+                for prefix, event, value in ijson.parse(f, use_float=True):
+                    if keys is None and prefix == 'points':
+                        break
+                    if event in _SCALAR_EVENTS and prefix and '.' not in prefix:
+                        header[prefix] = value
+                        if keys is not None and all(key in header for key in keys):
+                            break
+            return header
+        except Exception as e:
+            print(f"❌ Error loading {file_path}: {e}")
+            return None
+    
+    def load_path_soa(self, file_path: Path):
+        """
+        Load a path file as (metadata, xs, ys, ts) without building a dict per point
+        With ijson the points array is stream-parsed straight into the coordinate buffers
+        """
+        if file_path.suffix == '.npz':
+            return self.load_path_npz(file_path)
+        
+        if ijson is None:
+            path_data = self.load_path_file(file_path)
+            if path_data is None:
+                return None
+            points = path_data.pop('points', [])
+            return (path_data,) + self._to_soa(points)
+        
+        try:
+            metadata = {}
+            columns = {'points.item.x_position': array('d'),
+                       'points.item.y_position': array('d'),
+                       'points.item.timestamp': array('d')}
+            builder = None  # Collects any non-scalar top-level value other than points
+            builder_key = None
+            
+            with _mapped(file_path) as f:
+                for prefix, event, value in ijson.parse(f, use_float=True):
+                    column = columns.get(prefix)
+                    if column is not None:
+                        column.append(value)
+                    elif builder is not None:
+                        builder.event(event, value)
+                        if prefix == builder_key and event in ('end_map', 'end_array'):
+                            metadata[builder_key] = builder.value
+                            builder = None
+                    elif prefix and '.' not in prefix and prefix != 'points':
+                        if event in ('start_map', 'start_array'):
+                            builder = ijson.ObjectBuilder()
+                            builder_key = prefix
+                            builder.event(event, value)
+                        else:
+                            metadata[prefix] = value
+            
+            xs, ys, ts = (np.frombuffer(columns[key], dtype=np.float64) for key in
+                          ('points.item.x_position', 'points.item.y_position', 'points.item.timestamp'))
+            return metadata, xs, ys, ts
+        except Exception as e:
+            print(f"❌ Error loading {file_path}: {e}")
+            return None
+    
+    def load_path_npz(self, file_path: Path, points: bool = True):
+        """
+        Load a columnar .npz path as (metadata, xs, ys, ts)
+        Members are read lazily, so points=False only decompresses the metadata
+        """
+        try:
+            with np.load(file_path) as npz:
+                metadata = json.loads(str(npz['meta'][0]))
+                if not points:
+                    return metadata, None, None, None
+                return (metadata, npz['xs'].astype(np.float64), npz['ys'].astype(np.float64),
+                        npz['ts'])
+        except Exception as e:
+            print(f"❌ Error loading {file_path}: {e}")
+            return None
+    
+    def save_path_npz(self, file_path: Path, metadata: Dict[str, Any], xs, ys, ts):
+        """
+        Save a path as compressed columns: float32 positions, float64 timestamps,
+        and the metadata fields as one JSON string (atomically, like save_path_file)
+        """
+        tmp_path = Path(f"{file_path}.tmp")
+        try:
+            with open(tmp_path, 'wb') as f:
+                np.savez_compressed(f, xs=np.asarray(xs, dtype=np.float32), ys=np.asarray(ys, dtype=np.float32),
+                                    ts=np.asarray(ts, dtype=np.float64), meta=np.array([json.dumps(metadata)]))
+            os.replace(tmp_path, file_path)
             return True
         except Exception as e:
             print(f"❌ Error saving {file_path}: {e}")
+            if tmp_path.exists():
+                tmp_path.unlink()
             return False
     
-    def make_unidirectional(self, points: List[Dict]) -> List[Dict]:
+    def _save_cleaned(self, file_path: Path, path_data: Dict[str, Any], xs, ys, ts):
         """
-        Make path truly unidirectional - both X and Y axes must progress monotonically
+        Save cleaning output in the file's format (or as .npz with to_npz), pinning
+        the saved file's mtime to cleaned_mtime_ns so later edits are detected
         """
-        if len(points) < 2:
-            return points
+        path_data['cleaned_mtime_ns'] = stamp = time.time_ns()
         
-        # Analyze overall movement direction
-        start_point = points[0]
-        end_point = points[-1]
+        target = file_path.with_suffix('.npz') if self.to_npz else file_path
+        if target.suffix == '.npz':
+            saved = self.save_path_npz(target, path_data, xs, ys, ts)
+        else:
+            # Points go last so load_path_header can stop reading before them
+            path_data['points'] = self._from_soa(xs, ys, ts)
+            saved = self.save_path_file(target, path_data)
+        if not saved:
+            return False
         
-        x_movement = end_point['x_position'] - start_point['x_position']
-        y_movement = end_point['y_position'] - start_point['y_position']
+        os.utime(target, ns=(stamp, stamp))
+        if target != file_path:
+            file_path.unlink()  # Converted - the JSON original is in the backup
+            print(f"   📦 Converted to {target.name}")
+        return True
+    
+    def save_path_file(self, file_path: Path, path_data: Dict[str, Any]):
+        """Save a path JSON file (atomically, via a temp file and rename)"""
+        tmp_path = Path(f"{file_path}.tmp")
+        try:
+            if orjson:
+                # Serialises straight to bytes; NumPy arrays are written without .tolist()
+                option = orjson.OPT_SERIALIZE_NUMPY
+                if self.pretty:
+                    option |= orjson.OPT_INDENT_2
+                _write_all(tmp_path, orjson.dumps(path_data, option=option))
+            else:
+                with open(tmp_path, 'w') as f:
+                    if self.pretty:
+                        json.dump(path_data, f, indent=2)
+                    else:
+                        json.dump(path_data, f, separators=(',', ':'))
+            # New inode - a hardlinked backup keeps pointing at the original data
+            os.replace(tmp_path, file_path)
+            return True
+        except Exception as e:
+            print(f"❌ Error saving {file_path}: {e}")
+            if tmp_path.exists():
+                tmp_path.unlink()
+            return False
+    
+    @staticmethod
+    def _to_soa(points: List[Dict]):
+        """Split a list of point dicts into x, y, timestamp arrays"""
+        n = len(points)
+        xs = np.fromiter((p['x_position'] for p in points), dtype=np.float64, count=n)
+        ys = np.fromiter((p['y_position'] for p in points), dtype=np.float64, count=n)
+        ts = np.fromiter((p['timestamp'] for p in points), dtype=np.float64, count=n)
+        return xs, ys, ts
+    
+    @staticmethod
+    def _from_soa(xs, ys, ts, template: List[Dict] = None) -> List[Dict]:
+        """
+        Build point dicts from arrays, with duration_from_start computed inline
+        Other keys are copied from the matching template point if one is given
+        """
+        durations = (ts - ts[0]).tolist() if len(ts) else []
+        if template is None:
+            return [{'timestamp': t, 'x_position': x, 'y_position': y, 'duration_from_start': d}
+                    for t, x, y, d in zip(ts.tolist(), xs.tolist(), ys.tolist(), durations)]
+        return [dict(point, x_position=x, y_position=y, duration_from_start=d)
+                for point, x, y, d in zip(template, xs.tolist(), ys.tolist(), durations)]
+    
+    def _unidirectional_soa(self, xs, ys):
+        """Array core of make_unidirectional - returns corrected (xs, ys)"""
+        # Analyze overall movement direction
+        x_movement = xs[-1] - xs[0]
+        y_movement = ys[-1] - ys[0]
         
         print(f"   Movement analysis: X={x_movement:.1f}%, Y={y_movement:.1f}%")
         
@@ -82,75 +451,54 @@ class PathCleaner:
         y_dir_name = "increasing" if y_should_increase else "decreasing"
         print(f"   Required directions: X {x_dir_name}, Y {y_dir_name}")
         
-        # Start with first point
-        cleaned_points = [points[0]]
-        
-        for i in range(1, len(points)):
-            current_point = points[i]
-            last_point = cleaned_points[-1]
-            
-            current_x = current_point['x_position']
-            current_y = current_point['y_position']
-            last_x = last_point['x_position']
-            last_y = last_point['y_position']
-            
-            # Check if this point moves in the correct direction for BOTH axes
-            x_valid = True
-            y_valid = True
-            
-            if x_should_increase:
-                x_valid = current_x >= last_x  # X must increase or stay same
-            else:
-                x_valid = current_x <= last_x  # X must decrease or stay same
-                
-            if y_should_increase:
-                y_valid = current_y >= last_y  # Y must increase or stay same
-            else:
-                y_valid = current_y <= last_y  # Y must decrease or stay same
-            
-            # Debug output for first few points
-            if i <= 20:
-                x_change = current_x - last_x
-                y_change = current_y - last_y
-                direction_x = "→" if x_change > 0 else "←" if x_change < 0 else "="
-                direction_y = "↑" if y_change > 0 else "↓" if y_change < 0 else "="
-                status = "KEEP" if (x_valid and y_valid) else "SKIP"
-                print(f"   Point {i}: X={current_x:.1f}% ({direction_x}{abs(x_change):.1f}%), Y={current_y:.1f}% ({direction_y}{abs(y_change):.1f}%) - {status}")
-            
-            # Correct invalid movements instead of deleting points
-            corrected_point = current_point.copy()
-            corrected = False
-            
-            if not x_valid:
-                # Use last valid X value
-                corrected_point['x_position'] = last_x
-                corrected = True
-                if i <= 20:
-                    print(f"   >>> CORRECTED X: {current_x:.1f}% → {last_x:.1f}%")
-            
-            if not y_valid:
-                # Use last valid Y value  
-                corrected_point['y_position'] = last_y
-                corrected = True
-                if i <= 20:
-                    print(f"   >>> CORRECTED Y: {current_y:.1f}% → {last_y:.1f}%")
-            
-            # Always add the point (either original or corrected)
-            cleaned_points.append(corrected_point)
-            
-            if corrected and i <= 20:
+        # Correct invalid movements instead of deleting points: each axis is held at
+        # its last valid value, i.e. a running max (increasing) or running min (decreasing)
+        clean_xs = np.maximum.accumulate(xs) if x_should_increase else np.minimum.accumulate(xs)
+        clean_ys = np.maximum.accumulate(ys) if y_should_increase else np.minimum.accumulate(ys)
+        x_corrected = clean_xs != xs
+        y_corrected = clean_ys != ys
+        
+        # Debug output for first few points
+        for i in range(1, min(len(xs), 21)):
+            x_change = xs[i] - clean_xs[i - 1]
+            y_change = ys[i] - clean_ys[i - 1]
+            direction_x = "→" if x_change > 0 else "←" if x_change < 0 else "="
+            direction_y = "↑" if y_change > 0 else "↓" if y_change < 0 else "="
+            status = "SKIP" if (x_corrected[i] or y_corrected[i]) else "KEEP"
+            print(f"   Point {i}: X={xs[i]:.1f}% ({direction_x}{abs(x_change):.1f}%), Y={ys[i]:.1f}% ({direction_y}{abs(y_change):.1f}%) - {status}")
+            if x_corrected[i]:
+                print(f"   >>> CORRECTED X: {xs[i]:.1f}% → {clean_xs[i]:.1f}%")
+            if y_corrected[i]:
+                print(f"   >>> CORRECTED Y: {ys[i]:.1f}% → {clean_ys[i]:.1f}%")
+            if x_corrected[i] or y_corrected[i]:
                 print(f"   >>> Point {i} corrected and kept")
         
-        # Recalculate duration_from_start for cleaned points
-        if cleaned_points:
-            start_time = cleaned_points[0]['timestamp']
-            for point in cleaned_points:
-                point['duration_from_start'] = point['timestamp'] - start_time
+        corrections = int(np.count_nonzero(x_corrected | y_corrected))
+        print(f"   Unidirectional filtering: {len(xs)} → {len(clean_xs)} points (corrected {corrections} direction violations)")
         
-        corrections = len(points) - len([p for p in cleaned_points if p in points])
-        print(f"   Unidirectional filtering: {len(points)} → {len(cleaned_points)} points (corrected {corrections} direction violations)")
+        return clean_xs, clean_ys
+    
+    def make_unidirectional(self, points: List[Dict]) -> List[Dict]:
+        """
+        Make path truly unidirectional - both X and Y axes must progress monotonically
+        """
+        if len(points) < 2:
+            return points
         
-        return cleaned_points
+        xs, ys, ts = self._to_soa(points)
+        clean_xs, clean_ys = self._unidirectional_soa(xs, ys)
+        # Always keep every point (either original or corrected)
+        return self._from_soa(clean_xs, clean_ys, ts, points)
+    
+    @staticmethod
+    def _stride_indices(n: int, keep_every_nth: int):
+        """Indices of every nth point, always including the first and last"""
+        mask = np.zeros(n, dtype=bool)
+        mask[::keep_every_nth] = True
+        mask[[0, -1]] = True
+        kept = np.flatnonzero(mask)
+        print(f"   Data reduction: {n} → {len(kept)} points (removed {n - len(kept)} points)")
+        return kept
     
     def reduce_datapoints(self, points: List[Dict], keep_every_nth: int = 2) -> List[Dict]:
         """
@@ -160,74 +508,180 @@ class PathCleaner:
         if len(points) <= 2:
             return points
         
-        # Always keep first point
-        reduced_points = [points[0]]
-        
-        # Keep every nth point from the middle
-        for i in range(keep_every_nth, len(points) - 1, keep_every_nth):
-            reduced_points.append(points[i])
-        
-        # Always keep last point (if it wasn't already included)
-        if len(points) > 1 and points[-1] not in reduced_points:
-            reduced_points.append(points[-1])
-        
-        # Recalculate duration_from_start for reduced points
-        if reduced_points:
-            start_time = reduced_points[0]['timestamp']
-            for point in reduced_points:
-                point['duration_from_start'] = point['timestamp'] - start_time
+        xs, ys, ts = self._to_soa(points)
+        kept = self._stride_indices(len(points), keep_every_nth)
+        # Rebuild (recalculating duration_from_start for reduced points)
+        return self._from_soa(xs[kept], ys[kept], ts[kept], [points[i] for i in kept])
+    
+    @staticmethod
+    def _rdp_indices(xs, ys, epsilon: float):
+        """Indices kept by RDP decimation at the given tolerance"""
+        keep = np.zeros(len(xs), dtype=np.bool_)
+        if _rdp_kernel:
+            _rdp_kernel.rdp(np.ascontiguousarray(xs, dtype=np.float64), np.ascontiguousarray(ys, dtype=np.float64),
+                            float(epsilon), keep.view(np.uint8))
+        elif NUMBA_AVAILABLE:
+            _rdp_mark(np.ascontiguousarray(xs), np.ascontiguousarray(ys), float(epsilon), keep)
+        else:
+            # Plain lists are the fastest thing to index from interpreted Python
+            _rdp_mark(xs.tolist(), ys.tolist(), epsilon, keep)
+        kept = np.flatnonzero(keep)
+        print(f"   RDP decimation (eps={epsilon:.2f}%): {len(xs)} → {len(kept)} points")
+        return kept
+    
+    def rdp_decimate(self, points: List[Dict], epsilon: float) -> List[Dict]:
+        """
+        Keep only the points needed to reproduce the path shape within epsilon (% units)
+        Replaces unidirectional filtering + every-nth reduction with one pass
+        """
+        if len(points) <= 2:
+            return points
         
-        reduction = len(points) - len(reduced_points)
-        print(f"   Data reduction: {len(points)} → {len(reduced_points)} points (removed {reduction} points)")
+        xs, ys, ts = self._to_soa(points)
+        kept = self._rdp_indices(xs, ys, epsilon)
+        return self._from_soa(xs[kept], ys[kept], ts[kept], [points[i] for i in kept])
+    
+    @staticmethod
+    def _colinear_indices(xs, ys, area_eps: float, max_step: float = None):
+        """
+        Indices left after dropping every point colinear with its neighbours
+        (|cross product| of the two segments at or below area_eps, in %^2)
+        """
+        n = len(xs)
+        keep = np.ones(n, dtype=np.bool_)
+        if n > 2:
+            cross = ((xs[1:-1] - xs[:-2]) * (ys[2:] - ys[1:-1]) -
+                     (ys[1:-1] - ys[:-2]) * (xs[2:] - xs[1:-1]))
+            keep[1:-1] = np.abs(cross) > area_eps
+            if max_step is not None:
+                if NUMBA_AVAILABLE:
+                    _restore_max_step(xs, ys, keep, float(max_step))
+                else:
+                    _restore_max_step(xs.tolist(), ys.tolist(), keep, max_step)
+        kept = np.flatnonzero(keep)
+        print(f"   Colinear pruning (area={area_eps:.2f}): {n} → {len(kept)} points")
+        return kept
+    
+    def _clean_soa(self, xs, ys, ts, make_unidirectional: bool = True, reduce_points: bool = True,
+                   keep_every_nth: int = 2, rdp_eps: float = None, colinear_eps: float = None,
+                   max_step: float = None):
+        """
+        Run the whole cleaning pipeline on coordinate arrays
+        Every stage only narrows one index set, so the arrays are gathered exactly once
+        """
+        n = len(xs)
+        kept = slice(None)
+        
+        if rdp_eps is not None:
+            # RDP replaces both the unidirectional filter and every-nth reduction
+            if n > 2:
+                kept = self._rdp_indices(xs, ys, rdp_eps)
+        elif colinear_eps is not None:
+            # Cheaper single-pass alternative to RDP for mostly straight paths
+            if n > 2:
+                kept = self._colinear_indices(xs, ys, colinear_eps, max_step)
+        else:
+            # Apply unidirectional filtering (corrects values, never drops points)
+            if make_unidirectional and n >= 2:
+                xs, ys = self._unidirectional_soa(xs, ys)
+            
+            # Apply data point reduction
+            if reduce_points and n > 2:
+                kept = self._stride_indices(n, keep_every_nth)
         
-        return reduced_points
+        return xs[kept], ys[kept], ts[kept]
     
-    def clean_path_file(self, file_path: Path, make_unidirectional: bool = True, reduce_points: bool = True):
-        """Clean a single path file"""
+    def clean_path_file(self, file_path: Path, make_unidirectional: bool = True, reduce_points: bool = True,
+                        keep_every_nth: int = 2, rdp_eps: float = None, colinear_eps: float = None,
+                        max_step: float = None, uniform_count: bool = False):
+        """Clean a single path file (uniform_count only marks the settings - trimming is done by trim_path_file)"""
         print(f"\n🔧 Cleaning: {file_path.name}")
         
-        # Load the path data
-        path_data = self.load_path_file(file_path)
-        if not path_data:
+        # Skip files already cleaned with these settings and untouched since
+        params = {'make_unidirectional': make_unidirectional, 'reduce_points': reduce_points,
+                  'keep_every_nth': keep_every_nth, 'rdp_eps': rdp_eps,
+                  'colinear_eps': colinear_eps, 'max_step': max_step, 'uniform_count': uniform_count}
+        header = self.load_path_header(file_path)
+        if (header and header.get('cleaned_params') == self._params_key(params)
+                and header.get('cleaned_mtime_ns') == file_path.stat().st_mtime_ns):
+            print("   ⏭️  Already cleaned with these settings - skipping")
+            return True
+        
+        # Load the path data - points arrive as coordinate arrays, never as dicts
+        loaded = self.load_path_soa(file_path)
+        if not loaded:
             return False
+        path_data, xs, ys, ts = loaded
         
-        original_points = path_data.get('points', [])
-        if not original_points:
+        original_count = len(xs)
+        if not original_count:
             print("   ⚠️  No points found in file")
             return False
         
-        print(f"   Original: {len(original_points)} points, {path_data.get('duration', 0):.1f}s duration")
-        
-        # Start with original points
-        cleaned_points = original_points.copy()
+        print(f"   Original: {original_count} points, {path_data.get('duration', 0):.1f}s duration")
         
-        # Apply unidirectional filtering
-        if make_unidirectional:
-            cleaned_points = self.make_unidirectional(cleaned_points)
+        xs, ys, ts = self._clean_soa(xs, ys, ts, make_unidirectional, reduce_points, keep_every_nth,
+                                     rdp_eps, colinear_eps, max_step)
         
-        # Apply data point reduction
-        if reduce_points:
-            cleaned_points = self.reduce_datapoints(cleaned_points, keep_every_nth=2)
-        
-        # Update path data
-        path_data['points'] = cleaned_points
-        path_data['point_count'] = len(cleaned_points)
-        if cleaned_points:
-            path_data['duration'] = cleaned_points[-1]['duration_from_start']
+        # Update path data (point dicts are only built if saving JSON)
+        path_data['point_count'] = len(xs)
+        path_data['duration'] = float(ts[-1] - ts[0])
         
         # Add cleaning metadata
         path_data['cleaned'] = True
         path_data['cleaned_at'] = datetime.now().isoformat()
-        path_data['original_point_count'] = len(original_points)
+        path_data['original_point_count'] = original_count
+        path_data['cleaned_params'] = self._params_key(params)
         
-        print(f"   ✅ Final: {len(cleaned_points)} points, {path_data.get('duration', 0):.1f}s duration")
+        print(f"   ✅ Final: {len(xs)} points, {path_data.get('duration', 0):.1f}s duration")
         
         # Save cleaned file
-        return self.save_path_file(file_path, path_data)
+        return self._save_cleaned(file_path, path_data, xs, ys, ts)
+    
+    @staticmethod
+    def _params_key(params: Dict[str, Any]) -> str:
+        """Settings fingerprint stored in cleaned files (a flat string, so it sits in the header)"""
+        return ",".join(f"{key}={value}" for key, value in params.items())
     
-    def clean_all_paths(self, make_unidirectional: bool = True, reduce_points: bool = True):
-        """Clean all path files in the directory"""
-        json_files = list(self.paths_directory.glob("*.json"))
+    def trim_path_file(self, file_path: Path, point_count: int):
+        """Trim a cleaned path file to exactly point_count points with Visvalingam-Whyatt"""
+        loaded = self.load_path_soa(file_path)
+        if not loaded:
+            return False
+        path_data, xs, ys, ts = loaded
+        
+        if len(xs) <= point_count:
+            print(f"   {file_path.name}: {len(xs)} points - already at or below {point_count}")
+            return True
+        
+        kept = _vw_indices(xs.tolist(), ys.tolist(), point_count)
+        print(f"   {file_path.name}: VW trim {len(xs)} → {len(kept)} points")
+        
+        xs, ys, ts = xs[kept], ys[kept], ts[kept]
+        path_data['point_count'] = len(xs)
+        path_data['duration'] = float(ts[-1] - ts[0])
+        
+        return self._save_cleaned(file_path, path_data, xs, ys, ts)
+    
+    def _run_all(self, method: str, json_files: List[Path], args: tuple) -> int:
+        """Run a PathCleaner method over files in parallel processes; returns the success count"""
+        settings = {'pretty': self.pretty, 'to_npz': self.to_npz}
+        jobs = [(str(self.paths_directory), settings, method, file_path, args) for file_path in json_files]
+        success_count = 0
+        with ProcessPoolExecutor(max_workers=min(len(jobs), os.cpu_count() or 1)) as executor:
+            for file_path, ok, log in executor.map(_clean_one, jobs, chunksize=4):
+                print(log, end='')
+                success_count += ok
+        return success_count
+    
+    def clean_all_paths(self, make_unidirectional: bool = True, reduce_points: bool = True,
+                        keep_every_nth: int = 2, rdp_eps: float = None, colinear_eps: float = None,
+                        max_step: float = None, uniform_count: bool = False):
+        """
+        Clean all path files in the directory
+        With uniform_count every file is then trimmed to the median cleaned point count
+        """
+        json_files = self.path_files()
         
         if not json_files:
             print("No JSON path files found!")
@@ -238,39 +692,66 @@ class PathCleaner:
         # Create backup first
         self.backup_paths()
         
-        success_count = 0
-        for file_path in json_files:
-            if self.clean_path_file(file_path, make_unidirectional, reduce_points):
-                success_count += 1
+        # Files are independent and CPU-bound, so clean them in parallel processes
+        opts = (make_unidirectional, reduce_points, keep_every_nth, rdp_eps, colinear_eps, max_step, uniform_count)
+        success_count = self._run_all('clean_path_file', json_files, opts)
+        
+        if uniform_count:
+            self.make_uniform_count(self.path_files())  # Re-listed - files may now be .npz
         
         print(f"\n🎉 Cleaning complete!")
         print(f"✅ Successfully cleaned: {success_count}/{len(json_files)} files")
         print(f"📁 Original files backed up to: {self.backup_directory}")
     
+    def make_uniform_count(self, json_files: List[Path]):
+        """Trim every path to the median point count and record it in the manifest"""
+        counts = {}
+        for file_path in json_files:
+            header = self.load_path_header(file_path)
+            if header and header.get('point_count'):
+                counts[file_path.stem] = header['point_count']
+        if not counts:
+            return
+        
+        point_count = max(2, int(np.median(list(counts.values()))))
+        print(f"\n📏 Trimming paths to a uniform {point_count} points")
+        self._run_all('trim_path_file', json_files, (point_count,))
+        
+        manifest = {
+            'point_count': point_count,
+            'paths': {name: min(count, point_count) for name, count in sorted(counts.items())},
+            'created_at': datetime.now().isoformat()
+        }
+        with open(self.paths_directory / MANIFEST_NAME, 'w') as f:
+            json.dump(manifest, f, indent=2)
+        print(f"📝 Manifest written: {self.paths_directory / MANIFEST_NAME}")
+    
     def list_paths(self):
         """List all path files with their info"""
-        json_files = list(self.paths_directory.glob("*.json"))
+        json_files = self.path_files()
         
         if not json_files:
             print("No JSON path files found!")
             return
         
-        print(f"\nFound {len(json_files)} path files:")
-        print("-" * 80)
-        print("Name".ljust(25) + "Points".ljust(8) + "Duration".ljust(12) + "Cleaned".ljust(8) + "Size")
-        print("-" * 80)
+        rows = [f"\nFound {len(json_files)} path files:",
+                "-" * 80,
+                f"{'Name':<25}{'Points':<8}{'Duration':<12}{'Cleaned':<8}Size",
+                "-" * 80]
         
         for file_path in sorted(json_files):
-            path_data = self.load_path_file(file_path)
-            if path_data:
+            # Only the listed fields are parsed - the points array is never built
+            header = self.load_path_header(file_path, keys=('point_count', 'duration', 'cleaned'))
+            if header:
                 name = file_path.stem[:24]
-                points = path_data.get('point_count', 0)
-                duration = f"{path_data.get('duration', 0):.1f}s"
-                cleaned = "Yes" if path_data.get('cleaned', False) else "No"
+                points = header.get('point_count', 0)
+                duration = f"{header.get('duration', 0):.1f}s"
+                cleaned = "Yes" if header.get('cleaned', False) else "No"
                 size = f"{file_path.stat().st_size / 1024:.1f}KB"
                 
-                print(name.ljust(25) + str(points).ljust(8) + duration.ljust(12) + cleaned.ljust(8) + size)
-
+                rows.append(f"{name:<25}{points:<8}{duration:<12}{cleaned:<8}{size}")
+        
+        sys.stdout.write("\n".join(rows) + "\n")
 
 def main():
     parser = argparse.ArgumentParser(description='Clean and optimize recorded TV arm paths')
@@ -284,10 +765,25 @@ def main():
                        help='Skip reducing data points')
     parser.add_argument('--keep-every', type=int, default=2, 
                        help='Keep every Nth data point (default: 2)')
+    parser.add_argument('--rdp-eps', type=float, default=None,
+                       help='Decimate with Ramer-Douglas-Peucker at this tolerance (%%) '
+                            'instead of unidirectional filtering + every-Nth reduction')
+    parser.add_argument('--prune-colinear', type=float, default=None, metavar='AREA',
+                       help='Drop points colinear with their neighbours (segment cross product <= AREA, %%^2) '
+                            'instead of unidirectional filtering + every-Nth reduction')
+    parser.add_argument('--max-step', type=float, default=10.0,
+                       help='With --prune-colinear, never leave a gap longer than this between points (default: 10%%)')
+    parser.add_argument('--uniform-count', action='store_true',
+                       help='After cleaning, trim every path to the median point count (Visvalingam-Whyatt) '
+                            'and write it to manifest.json')
+    parser.add_argument('--to-npz', action='store_true',
+                       help='Save cleaned paths as compressed columnar .npz instead of JSON')
+    parser.add_argument('--pretty', action='store_true',
+                       help='Write indented JSON for reading by hand (default: compact)')
     
     args = parser.parse_args()
     
-    cleaner = PathCleaner(args.paths_dir)
+    cleaner = PathCleaner(args.paths_dir, pretty=args.pretty, to_npz=args.to_npz)
     
     if args.list:
         cleaner.list_paths()
@@ -299,14 +795,24 @@ def main():
         reduce_points = not args.no_reduce
         
         print(f"Settings:")
-        print(f"  - Make unidirectional: {'Yes' if make_unidirectional else 'No'}")
-        print(f"  - Reduce data points: {'Yes' if reduce_points else 'No'}")
-        if reduce_points:
-            print(f"  - Keep every {args.keep_every} points")
+        if args.rdp_eps is not None:
+            print(f"  - RDP decimation: eps={args.rdp_eps:.2f}%")
+        elif args.prune_colinear is not None:
+            print(f"  - Colinear pruning: area={args.prune_colinear:.2f}, max step {args.max_step:.1f}%")
+        else:
+            print(f"  - Make unidirectional: {'Yes' if make_unidirectional else 'No'}")
+            print(f"  - Reduce data points: {'Yes' if reduce_points else 'No'}")
+            if reduce_points:
+                print(f"  - Keep every {args.keep_every} points")
+        if args.to_npz:
+            print(f"  - Output format: NPZ")
+        if args.uniform_count:
+            print(f"  - Uniform point count: Yes (median, written to {MANIFEST_NAME})")
         
         confirm = input("\nProceed with cleaning? (y/N): ").strip().lower()
         if confirm == 'y':
-            cleaner.clean_all_paths(make_unidirectional, reduce_points)
+            cleaner.clean_all_paths(make_unidirectional, reduce_points, args.keep_every, args.rdp_eps,
+                                    args.prune_colinear, args.max_step, args.uniform_count)
         else:
             print("Cleaning cancelled.")
 
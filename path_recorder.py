@@ -4,34 +4,224 @@ Path Recorder - Teaching and Playback System
 Records manual movements and replays them automatically
 """
 
+import os
+import sys
 import time
 import json
 import logging
+import selectors
 import threading
-from typing import List, Dict, Tuple, Optional, Callable
+from bisect import bisect_left
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Tuple, Optional, Callable, Union
 from pathlib import Path
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 
+import numpy as np
 
-@dataclass
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Fall back to the stdlib json codec
+
+try:
+    import ijson
+except ImportError:
+    ijson = None  # Fall back to decoding the whole file
+
+# ijson events that carry a value (everything else opens/closes a container)
+_SCALAR_EVENTS = frozenset(('null', 'boolean', 'integer', 'double', 'number', 'string'))
+
+from _numba_compat import njit, NUMBA_AVAILABLE  # Optional numba with a plain-Python fallback
+
+
+@njit(cache=True)
+def _thin_mark(xs, ys, tolerance_sq, keep):
+    """
+    Set keep[i] for each point more than sqrt(tolerance_sq) from the last kept point
+    First and last are always kept
+    """
+    n = len(xs)
+    keep[0] = True
+    keep[n - 1] = True
+    last_x = xs[0]
+    last_y = ys[0]
+    for i in range(1, n):
+        dx = xs[i] - last_x
+        dy = ys[i] - last_y
+        if dx * dx + dy * dy > tolerance_sq:
+            keep[i] = True
+            last_x = xs[i]
+            last_y = ys[i]
+
+
+def _median3(a: float, b: float, c: float) -> float:
+    """Median of three values - compares only, no list or sort"""
+    return max(min(a, b), min(max(a, b), c))
+
+
+def _dumps(obj) -> bytes:
+    """Encode a path document as compact UTF-8 JSON (path_cleaner.py --pretty re-indents)"""
+    if orjson:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode()
+
+
+def _loads(data: bytes):
+    """Decode a path document read in binary mode"""
+    if orjson:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _load_header(file_path: Path) -> dict:
+    """
+    Read the top-level scalar fields of a path file
+    With ijson parsing stops where the points array starts (written last), so cost is O(header)
+    """
+    if file_path.suffix == '.npz':
+        with np.load(file_path) as npz:
+            return json.loads(str(npz['meta'][0]))  # Members load lazily - columns stay compressed
+    
+    if ijson is None:
+        with open(file_path, 'rb') as f:
+            path_dict = _loads(f.read())
+        path_dict.pop('points', None)
+        path_dict.pop('datapoints', None)
+        return path_dict
+    
+    header = {}
+    with open(file_path, 'rb') as f:
+        for prefix, event, value in ijson.parse(f, use_float=True):
+            if prefix in ('points', 'datapoints'):
+                break
+            if event in _SCALAR_EVENTS and prefix and '.' not in prefix:
+                header[prefix] = value
+    return header
+
+
+@dataclass(slots=True)
 class PathPoint:
-    """Represents a single point in a recorded path"""
+    """Represents a single point in a recorded path (no per-instance __dict__)"""
     timestamp: float
     x_position: float
     y_position: float
     duration_from_start: float = 0.0
     
     def to_dict(self) -> dict:
-        return asdict(self)
+        # Plain literal - asdict() deep-copies through field reflection on every call
+        return {'timestamp': self.timestamp, 'x_position': self.x_position,
+                'y_position': self.y_position, 'duration_from_start': self.duration_from_start}
     
     @classmethod
     def from_dict(cls, data: dict) -> 'PathPoint':
-        return cls(**data)
+        # Only the slot fields - extra keys in a path file's point dicts are ignored
+        return cls(**{name: data[name] for name in cls.__slots__ if name in data})
+
+
+@dataclass(slots=True)
+class _AxisDrive:
+    """One axis of a simultaneous move - hardware handles, target and the tuning that differs between X and Y"""
+    name: str
+    motor: object
+    sensor: object
+    config: Optional[dict]  # Calibration section for the safety limits (None if missing)
+    target: float
+    tolerance: float
+    base_speed: float
+    approach_speed: Callable[[float, float], float]
+    reversal: Tuple[float, float]  # (movement, error growth) counted towards a lock
+    major_reversal: Optional[Tuple[float, float]] = None  # Immediate stop on targets above 10%
+    reassert_direction: bool = False  # Re-send the path direction with every speed update
+
+
+class _PathBuffer:
+    """
+    Growable struct-of-arrays store for recorded points (32 bytes per point)
+    Safe for one writer (the recording thread) and one lock-free reader: append() fills the
+    row before publishing it via _n, and readers take _n before touching the arrays
+    """
+    
+    def __init__(self, capacity: int = 1024):
+        self._ts = np.empty(capacity, dtype=np.float64)
+        self._x = np.empty(capacity, dtype=np.float64)
+        self._y = np.empty(capacity, dtype=np.float64)
+        self._dur = np.empty(capacity, dtype=np.float64)
+        self._n = 0
+    
+    def append(self, timestamp: float, x: float, y: float, duration: float):
+        if self._n == len(self._ts):
+            self._grow()
+        n = self._n
+        self._ts[n] = timestamp
+        self._x[n] = x
+        self._y[n] = y
+        self._dur[n] = duration
+        self._n = n + 1
+    
+    def _grow(self):
+        # Double capacity; copy only the filled prefix. Each column is swapped in only once
+        # its copy is complete, so a reader sees either array with every published row
+        capacity = max(1, len(self._ts) * 2)
+        for name in ('_ts', '_x', '_y', '_dur'):
+            grown = np.empty(capacity, dtype=np.float64)
+            grown[:self._n] = getattr(self, name)[:self._n]
+            setattr(self, name, grown)
+    
+    def columns(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Views of the filled (timestamp, x, y, duration) columns"""
+        n = self._n
+        return self._ts[:n], self._x[:n], self._y[:n], self._dur[:n]
+    
+    def read_since(self, start: int):
+        """
+        Copy out rows published after start, for a consumer tailing a live recording
+        Returns (next_start, ts, xs, ys, dur)
+        """
+        n = self._n
+        return n, self._ts[start:n].copy(), self._x[start:n].copy(), self._y[start:n].copy(), self._dur[start:n].copy()
+    
+    def to_dicts(self) -> List[dict]:
+        """Point dicts in the on-disk JSON layout, built from bulk-converted columns"""
+        ts, xs, ys, dur = (col.tolist() for col in self.columns())
+        return [{'timestamp': t, 'x_position': x, 'y_position': y, 'duration_from_start': d}
+                for t, x, y, d in zip(ts, xs, ys, dur)]
+    
+    def __len__(self) -> int:
+        return self._n
+    
+    def __getitem__(self, i: int) -> PathPoint:
+        if i < 0:
+            i += self._n
+        if not 0 <= i < self._n:
+            raise IndexError("path point index out of range")
+        return PathPoint(float(self._ts[i]), float(self._x[i]), float(self._y[i]), float(self._dur[i]))
+    
+    def __iter__(self):
+        for i in range(self._n):
+            yield self[i]
+    
+    @classmethod
+    def from_columns(cls, ts, xs, ys, dur) -> '_PathBuffer':
+        """Wrap loaded columns; PathPoints are only built when indexed"""
+        buf = cls(0)
+        buf._ts, buf._x, buf._y, buf._dur = (np.ascontiguousarray(col, dtype=np.float64)
+                                             for col in (ts, xs, ys, dur))
+        buf._n = len(buf._ts)
+        return buf
 
 
 class PathRecorder:
     """Handles recording and playback of TV arm movement paths"""
     
+    CALLBACK_INTERVAL = 0.25  # Minimum seconds between "recording" progress callbacks
+    LOG_LIMIT_INTERVAL = 1.0  # Minimum seconds between repeats of the same loop error
+    # Balanced tolerances - both motors working well now
+    # Allow progression to final datapoint instead of timeout on small errors
+    X_TOLERANCE = 0.5  # 0.5% tolerance for X axis (good accuracy achieved)
+    Y_TOLERANCE = 0.2  # 0.2% tolerance for Y axis (tightened further to prevent 0.8%→0.6% overshoot acceptance)
+    
     def __init__(self, controller, config: dict):
         self.controller = controller
         self.config = config
@@ -39,10 +229,19 @@ class PathRecorder:
         # Recording state
         self.is_recording = False
         self.is_playing = False
-        self.current_path: List[PathPoint] = []
-        self.recording_start_time = 0.0
+        self.current_path = _PathBuffer()
+        self.recording_start_time = 0.0  # time.monotonic() at start
+        self.recording_start_wall = 0.0  # time.time() at start, anchors point timestamps
         self.recording_thread = None
         self.playback_thread = None
+        self._path_direction = 0  # Playback path type: +1 extend, -1 retract, 0 other (set by play_path)
+        
+        # Stop signals - waiting on these instead of sleeping lets stop take effect immediately
+        self._stop_recording_evt = threading.Event()
+        self._stop_playback_evt = threading.Event()
+        
+        # Rate limiting for errors repeated inside the polling loops: key -> [last emit, suppressed count]
+        self._log_limits: Dict[str, list] = {}
         
         # Callbacks
         self.recording_callback: Optional[Callable] = None
@@ -52,12 +251,37 @@ class PathRecorder:
         self.recording_interval = config.get('path_recording', {}).get('recording_interval', 0.1)
         self.position_tolerance = config.get('path_recording', {}).get('position_tolerance', 1.0)
         self.paths_directory = Path(config.get('path_recording', {}).get('paths_directory', 'recorded_paths'))
+        self.path_format = config.get('path_recording', {}).get('path_format', 'npz')
         
         # Ensure paths directory exists
         self.paths_directory.mkdir(exist_ok=True)
         
+        # list_paths result, reused while the directory's mtime is unchanged
+        self._list_cache: Optional[List[Dict]] = None
+        self._list_cache_mtime = -1
+
+        # list_paths metadata persisted across restarts, keyed by file name and validated by mtime/size.
+        # No .json suffix, so path_cleaner.py's *.json glob doesn't mistake it for a path
+        self._index_path = self.paths_directory / '.paths_index'
+        self._meta_index: Optional[Dict[str, dict]] = None
+
         logging.info(f"Path Recorder initialized - recording interval: {self.recording_interval}s")
     
+    def _log_limited(self, key: str, level: int, msg: str, *args, interval: Optional[float] = None):
+        """Log at most once per interval (default LOG_LIMIT_INTERVAL) per key, reporting how many repeats were dropped"""
+        if interval is None:
+            interval = self.LOG_LIMIT_INTERVAL
+        now = time.monotonic()
+        state = self._log_limits.setdefault(key, [-interval, 0])
+        if now - state[0] < interval:
+            state[1] += 1
+            return
+        if state[1]:
+            msg += " (%d similar suppressed)"
+            args += (state[1],)
+        state[0], state[1] = now, 0
+        logging.log(level, msg, *args)
+    
     def set_recording_callback(self, callback: Callable):
         """Set callback for recording status updates"""
         self.recording_callback = callback
@@ -82,10 +306,12 @@ class PathRecorder:
         logging.info(f"Starting path recording: {path_name}")
         
         # Reset recording state
-        self.current_path = []
-        self.recording_start_time = time.time()
+        self.current_path = _PathBuffer()
+        self.recording_start_wall = time.time()
+        self.recording_start_time = time.monotonic()
         self.is_recording = True
         self.current_path_name = path_name
+        self._stop_recording_evt.clear()
         
         # Start recording thread
         self.recording_thread = threading.Thread(target=self._recording_loop, daemon=True)
@@ -104,10 +330,17 @@ class PathRecorder:
         
         logging.info(f"Stopping path recording: {self.current_path_name}")
         self.is_recording = False
+        self._stop_recording_evt.set()
+        updates = getattr(self.controller, 'position_changed', None)
+        if updates is not None:
+            with updates:
+                updates.notify_all()  # Wake a loop waiting for the next controller reading
         
         # Wait for recording thread to finish
         if self.recording_thread and self.recording_thread.is_alive():
             self.recording_thread.join(timeout=2)
+            if self.recording_thread.is_alive():
+                logging.warning("Recording thread still busy after stop - saving the points captured so far")
         
         # Save the recorded path
         if len(self.current_path) > 0:
@@ -131,39 +364,81 @@ class PathRecorder:
     def _recording_loop(self):
         """Background thread that records position data"""
         last_x, last_y = None, None
-        
-        while self.is_recording:
+        next_t = self.recording_start_time
+        
+        # With the controller's update thread running, wake on its readings instead of
+        # polling the sensors a second time on our own schedule
+        updates = getattr(self.controller, 'position_changed', None)
+        if not getattr(self.controller, 'running', False):
+            updates = None
+        seen = getattr(self.controller, 'position_seq', None)
+        
+        # Bind per-sample lookups once
+        get_position = self.controller.get_current_position
+        monotonic = time.monotonic
+        append = self.current_path.append
+        tolerance_sq = self.position_tolerance * self.position_tolerance
+        callback = self.recording_callback
+        stop_evt = self._stop_recording_evt
+        start, start_wall = self.recording_start_time, self.recording_start_wall
+        last_callback = 0.0  # "recording" updates are throttled; started/completed are sent by start/stop
+        
+        while True:
             try:
-                # Get current position from controller
-                current_x, current_y = self.controller.get_current_position()
-                current_time = time.time()
-                duration = current_time - self.recording_start_time
+                if updates is not None:
+                    with updates:
+                        updates.wait_for(lambda: self.controller.position_seq != seen
+                                         or stop_evt.is_set(), timeout=1.0)
+                        if stop_evt.is_set():
+                            break
+                        if self.controller.position_seq == seen:
+                            if not self.controller.running:
+                                updates = None  # Update thread stopped - poll the sensors ourselves
+                            continue
+                        seen = self.controller.position_seq
+                        current_x, current_y = self.controller.current_x_position, self.controller.current_y_position
+                        # Stamp with the producer's read time, not when this thread woke up
+                        duration = max(0.0, self.controller.position_time - start)
+                else:
+                    # Get current position from controller
+                    current_x, current_y = get_position()
+                    duration = monotonic() - start
+                # Wall-clock timestamp derived from the monotonic offset, so NTP jumps can't skew it
+                current_time = start_wall + duration
                 
-                # Only record if position changed significantly
-                if (last_x is None or last_y is None or 
-                    abs(current_x - last_x) > self.position_tolerance or 
-                    abs(current_y - last_y) > self.position_tolerance):
-                    
-                    point = PathPoint(
-                        timestamp=current_time,
-                        x_position=current_x,
-                        y_position=current_y,
-                        duration_from_start=duration
-                    )
-                    
-                    self.current_path.append(point)
+                # Only record if the arm moved more than the tolerance (2-D distance, compared squared)
+                if last_x is None:
+                    moved = True
+                else:
+                    dx = current_x - last_x
+                    dy = current_y - last_y
+                    moved = dx * dx + dy * dy > tolerance_sq
+                if moved:
+                    append(current_time, current_x, current_y, duration)
                     last_x, last_y = current_x, current_y
                     
-                    logging.debug(f"Recorded point: X={current_x:.1f}%, Y={current_y:.1f}% at {duration:.1f}s")
+                    logging.debug("Recorded point: X=%.1f%%, Y=%.1f%% at %.1fs", current_x, current_y, duration)
                     
-                    if self.recording_callback:
-                        self.recording_callback("recording", self.current_path_name, len(self.current_path))
-                
-                time.sleep(self.recording_interval)
+                    if callback and duration - last_callback >= self.CALLBACK_INTERVAL:
+                        callback("recording", self.current_path_name, len(self.current_path))
+                        last_callback = duration
                 
             except Exception as e:
-                logging.error(f"Error in recording loop: {e}")
-                time.sleep(0.5)
+                self._log_limited("recording", logging.ERROR, "Error in recording loop: %r", e)
+                if updates is not None and stop_evt.wait(0.5):
+                    break
+            
+            if updates is not None:
+                continue
+            
+            # Fixed-rate schedule: sleep to the next tick rather than a full interval after the work
+            now = monotonic()
+            next_t += self.recording_interval
+            if next_t < now:
+                next_t = now  # Fell behind (slow read) - resume from now instead of bursting
+            # wait() returns True as soon as stop_recording() sets the event
+            if stop_evt.wait(next_t - now):
+                break
     
     def play_path(self, path_name: str, speed_multiplier: float = 1.0, manual_step: bool = False) -> bool:
         """Play back a recorded path"""
@@ -188,8 +463,24 @@ class PathRecorder:
         logging.info(f"Starting path playback: {path_name} ({len(path_data)} points, speed: {speed_multiplier}x, mode: {mode_desc})")
         
         self.is_playing = True
+        self._stop_playback_evt.clear()
         self.current_playback_path = path_data
+        # Playback plan: target columns resolved once here rather than per-point attribute access
+        if isinstance(path_data, _PathBuffer):
+            _, self._pb_x, self._pb_y, _ = path_data.columns()
+        else:
+            self._pb_x = np.fromiter((p.x_position for p in path_data), dtype=np.float64, count=len(path_data))
+            self._pb_y = np.fromiter((p.y_position for p in path_data), dtype=np.float64, count=len(path_data))
+        # For targets near 0%, use achievable tolerance for mechanical precision: 40% of target, minimum 0.1%
+        x_near_zero, y_near_zero = self._pb_x <= 1.0, self._pb_y <= 1.0
+        self._pb_x_tol = np.where(x_near_zero, np.maximum(0.1, self._pb_x * 0.4), self.X_TOLERANCE).tolist()
+        self._pb_y_tol = np.where(y_near_zero, np.maximum(0.1, self._pb_y * 0.4), self.Y_TOLERANCE).tolist()
+        if x_near_zero.any() or y_near_zero.any():
+            logging.info(f"🎯 NEAR ZERO: Using achievable tolerances for {int(x_near_zero.sum())} X and {int(y_near_zero.sum())} Y targets ≤1% (normal: X={self.X_TOLERANCE}%, Y={self.Y_TOLERANCE}%)")
         self.current_path_name = path_name  # Store path name for skip logic
+        # Path type resolved once here - the playback loops compare this int, not the name
+        name = path_name.lower()
+        self._path_direction = 1 if 'extend' in name else -1 if 'retract' in name else 0
         self.playback_speed = speed_multiplier
         self.manual_step_mode = manual_step
         
@@ -210,10 +501,17 @@ class PathRecorder:
         
         logging.info("Stopping path playback")
         self.is_playing = False
+        self._stop_playback_evt.set()
+        updates = getattr(self.controller, 'position_changed', None)
+        if updates is not None:
+            with updates:
+                updates.notify_all()  # Wake a move waiting for the next controller reading
         
         # Wait for playback thread to finish
         if self.playback_thread and self.playback_thread.is_alive():
             self.playback_thread.join(timeout=2)
+            if self.playback_thread.is_alive():
+                logging.warning("Playback thread still finishing a motor command - it will exit at its next stop check")
         
         if self.playback_callback:
             self.playback_callback("stopped", "", 0)
@@ -223,96 +521,74 @@ class PathRecorder:
     def _playback_loop(self):
         """Background thread that plays back recorded path with step-by-step verification"""
         try:
-            # Balanced tolerances - both motors working well now
-            # Allow progression to final datapoint instead of timeout on small errors
-            x_tolerance = 0.5   # 0.5% tolerance for X axis (good accuracy achieved)
-            y_tolerance = 0.2   # 0.2% tolerance for Y axis (tightened further to prevent 0.8%→0.6% overshoot acceptance)
             max_wait_per_point = 60.0  # Longer timeout since motors are working, just need more time
             
-            for i, point in enumerate(self.current_playback_path):
-                if not self.is_playing:
+            # Per-point targets and tolerances were resolved by play_path
+            x_targets, y_targets = self._pb_x, self._pb_y
+            x_tolerances, y_tolerances = self._pb_x_tol, self._pb_y_tol
+            xs, ys = x_targets.tolist(), y_targets.tolist()
+            
+            # Bind per-datapoint lookups once
+            n_points = len(xs)
+            get_position = self.controller.get_current_position
+            stop_evt = self._stop_playback_evt
+            callback = self.playback_callback
+            
+            # Smart datapoint skipping based on path direction
+            direction = self._path_direction
+            # EXTEND: CONSERVATIVE SKIPPING - only skip if SIGNIFICANTLY above target (5%+ margin for both axes)
+            skip_margin = 5.0  # 5% margin to account for sensor errors
+            
+            # Read once here, then refreshed from the reading taken when each datapoint is reached,
+            # so the skip check costs no extra sensor read per datapoint
+            current_x, current_y = get_position()
+            resume_at = 0
+            
+            for i in range(n_points):
+                if stop_evt.is_set():
                     break
+                if i < resume_at:
+                    continue  # Inside a skipped run
                 
-                target_x = point.x_position
-                target_y = point.y_position
-                
-                # Check if we should skip this datapoint (correct skip logic)
-                current_x, current_y = self.controller.get_current_position()
+                target_x = xs[i]
+                target_y = ys[i]
                 
                 # Track the actual datapoint number we're working on (1-based)
-                actual_datapoint_number = point.point_number if hasattr(point, 'point_number') else i + 1
+                actual_datapoint_number = i + 1
                 
-                # Smart datapoint skipping based on path direction
-                path_name = getattr(self, 'current_path_name', '').lower()
-                
-                should_skip = False
-                if 'extend' in path_name:
+                if direction > 0:
                     # EXTEND: percentages should INCREASE (0% → 96%)
-                    # CONSERVATIVE SKIPPING: Only skip if SIGNIFICANTLY above target (5%+ margin for both axes)
-                    skip_margin = 5.0  # 5% margin to account for sensor errors
-                    if (current_x > target_x + skip_margin) and (current_y > target_y + skip_margin):
-                        should_skip = True
-                        logging.info(f"🔄 EXTEND SKIP: Significantly above datapoint {actual_datapoint_number} - X={current_x:.1f}%>{target_x:.1f}%+{skip_margin}%, Y={current_y:.1f}%>{target_y:.1f}%+{skip_margin}%")
-                    else:
-                        # Don't skip - go to the datapoint anyway for accuracy
-                        should_skip = False
-                        logging.info(f"✅ EXTEND CONTINUE: Going to datapoint {actual_datapoint_number} - X={current_x:.1f}%→{target_x:.1f}%, Y={current_y:.1f}%→{target_y:.1f}% (conservative approach)")
-                elif 'retract' in path_name:
+                    should_skip = current_x > target_x + skip_margin and current_y > target_y + skip_margin
+                elif direction < 0:
                     # RETRACT: percentages should DECREASE (96% → 0%)
                     # Skip if this datapoint is ABOVE our current position (we can't go UP during retract)
-                    # OR if we're already BELOW this datapoint (already passed it going down)
-                    if (target_x > current_x or target_y > current_y) or (current_x < target_x and current_y < target_y):
-                        should_skip = True
-                        if target_x > current_x or target_y > current_y:
-                            logging.info(f"🔄 RETRACT SKIP: Datapoint {actual_datapoint_number} is ABOVE current position - X={current_x:.1f}%→{target_x:.1f}%, Y={current_y:.1f}%→{target_y:.1f}% (can't go UP while retracting)")
-                        else:
-                            logging.info(f"🔄 RETRACT SKIP: Already below datapoint {actual_datapoint_number} - X={current_x:.1f}%<{target_x:.1f}%, Y={current_y:.1f}%<{target_y:.1f}%")
+                    should_skip = target_x > current_x or target_y > current_y
+                else:
+                    should_skip = False
                 
                 if should_skip:
+                    # The arm doesn't move while skipping, so the whole run is one vectorized scan
+                    if direction > 0:
+                        skip = (current_x > x_targets[i:] + skip_margin) & (current_y > y_targets[i:] + skip_margin)
+                    else:
+                        skip = (x_targets[i:] > current_x) | (y_targets[i:] > current_y)
+                    run = len(skip) if skip.all() else int(np.argmin(skip))
+                    resume_at = i + run
+                    reason = (f"significantly above (+{skip_margin}%)" if direction > 0
+                              else "ABOVE current position (can't go UP while retracting)")
+                    logging.info(f"🔄 {'EXTEND' if direction > 0 else 'RETRACT'} SKIP: Datapoints {actual_datapoint_number}-{resume_at} - {reason} at X={current_x:.1f}%, Y={current_y:.1f}%")
                     continue
                 
-                logging.info(f"=== DATAPOINT {actual_datapoint_number}/{len(self.current_playback_path)} ===")
-                logging.info(f"Target: X={target_x:.1f}%, Y={target_y:.1f}%")
-                
-                # Reset motor lock flags for new datapoint
-                x_was_stopped = hasattr(self, 'x_stopped') and self.x_stopped
-                y_was_stopped = hasattr(self, 'y_stopped') and self.y_stopped
-                
-                if hasattr(self, 'x_stopped'):
-                    delattr(self, 'x_stopped')
-                if hasattr(self, 'y_stopped'):
-                    delattr(self, 'y_stopped')
-                if hasattr(self, 'x_last_position'):
-                    delattr(self, 'x_last_position')
-                if hasattr(self, 'y_last_position'):
-                    delattr(self, 'y_last_position')
-                if hasattr(self, 'x_last_valid_position'):
-                    delattr(self, 'x_last_valid_position')
-                if hasattr(self, 'y_last_valid_position'):
-                    delattr(self, 'y_last_valid_position')
-                
-                logging.info(f"🔄 Reset motor flags: X was {'LOCKED' if x_was_stopped else 'FREE'}, Y was {'LOCKED' if y_was_stopped else 'FREE'} -> both now FREE")
+                if direction > 0:
+                    # Don't skip - go to the datapoint anyway for accuracy
+                    logging.info(f"✅ EXTEND CONTINUE: Going to datapoint {actual_datapoint_number} - X={current_x:.1f}%→{target_x:.1f}%, Y={current_y:.1f}%→{target_y:.1f}% (conservative approach)")
                 
-                # Adjust tolerances for very small targets to improve accuracy
-                adjusted_x_tolerance = x_tolerance
-                adjusted_y_tolerance = y_tolerance
-                
-                # For targets near 0%, use achievable tolerance for mechanical precision
-                if target_x <= 1.0:
-                    adjusted_x_tolerance = max(0.1, target_x * 0.4)  # 40% of target, minimum 0.1%
-                    logging.info(f"🎯 X NEAR ZERO: Using achievable tolerance {adjusted_x_tolerance:.3f}% for target {target_x}% (normal: {x_tolerance}%)")
-                
-                if target_y <= 1.0:
-                    adjusted_y_tolerance = max(0.1, target_y * 0.4)  # 40% of target, minimum 0.1%
-                    logging.info(f"🎯 Y NEAR ZERO: Using achievable tolerance {adjusted_y_tolerance:.3f}% for target {target_y}% (normal: {y_tolerance}%)")
-                
-                # Only log tolerances if they seem unusual
-                if adjusted_x_tolerance > 1.0 or adjusted_y_tolerance > 1.0:
-                    logging.warning(f"🎯 UNUSUAL TOLERANCES: X={adjusted_x_tolerance}%, Y={adjusted_y_tolerance}% for targets X={target_x}%, Y={target_y}%")
+                logging.info(f"=== DATAPOINT {actual_datapoint_number}/{n_points} ===")
+                logging.info(f"Target: X={target_x:.1f}%, Y={target_y:.1f}%")
                 
                 # Move both axes simultaneously
                 success = self._move_to_position_simultaneous(
-                    target_x, target_y, adjusted_x_tolerance, adjusted_y_tolerance, max_wait_per_point
+                    target_x, target_y, x_tolerances[i], y_tolerances[i], max_wait_per_point
                 )
                 
                 if not success:
@@ -320,47 +596,48 @@ class PathRecorder:
                     break
                 
                 # Both axes reached target
-                current_x, current_y = self.controller.get_current_position()
+                current_x, current_y = get_position()
                 logging.info(f"✅ REACHED DATAPOINT {actual_datapoint_number}: X={current_x:.1f}%, Y={current_y:.1f}%")
                 
-                if self.playback_callback:
-                    self.playback_callback("playing", "", i + 1)
+                if callback:
+                    callback("playing", "", i + 1)
                 
                 # Manual step mode - wait for user input
                 if hasattr(self, 'manual_step_mode') and self.manual_step_mode:
-                    if i + 1 < len(self.current_playback_path):  # Not the last point
-                        next_point = self.current_playback_path[i + 1]
+                    if i + 1 < n_points:  # Not the last point
                         print("\n" + "="*60)
-                        # Get the next datapoint's actual number
-                        next_datapoint_number = next_point.point_number if hasattr(next_point, 'point_number') else i + 2
-                        print(f"🎯 REACHED DATAPOINT {actual_datapoint_number}/{len(self.current_playback_path)}")
+                        next_datapoint_number = i + 2
+                        print(f"🎯 REACHED DATAPOINT {actual_datapoint_number}/{n_points}")
                         print(f"Current: X={current_x:.1f}%, Y={current_y:.1f}%")
-                        print(f"Next target: DATAPOINT {next_datapoint_number} - X={next_point.x_position:.1f}%, Y={next_point.y_position:.1f}%")
+                        print(f"Next target: DATAPOINT {next_datapoint_number} - X={xs[i + 1]:.1f}%, Y={ys[i + 1]:.1f}%")
                         print("="*60)
                         print("Press Enter to continue to next datapoint, or 'q' to quit...")
                         print(">>> ", end="", flush=True)
                         
                         try:
-                            user_input = input().strip().lower()
+                            user_input = self._read_step_input()
+                            if user_input is None:
+                                break  # stop_playback() was called while waiting
                             if user_input == 'q':
                                 logging.info("Manual step playback stopped by user")
                                 self.is_playing = False
+                                stop_evt.set()
                                 break
                             else:
                                 print("Continuing to next datapoint...")
                         except EOFError:
                             # Handle case where input is not available
                             logging.info("No input available, continuing automatically")
-                            time.sleep(1.0)
+                            stop_evt.wait(1.0)
                     else:
                         print("\n" + "="*60)
-                        print(f"🎉 COMPLETED! Reached final datapoint {actual_datapoint_number}/{len(self.current_playback_path)}")
+                        print(f"🎉 COMPLETED! Reached final datapoint {actual_datapoint_number}/{n_points}")
                         print(f"Final position: X={current_x:.1f}%, Y={current_y:.1f}%")
                         print("="*60)
                 else:
                     logging.info(f"Proceeding to next datapoint...")
                     # Small pause between datapoints in automatic mode
-                    time.sleep(0.5)
+                    stop_evt.wait(0.5)
             
             # Stop both motors at end of path
             logging.info("Stopping both motors at end of path...")
@@ -370,8 +647,8 @@ class PathRecorder:
             self.is_playing = False
             logging.info("🎉 Path playback completed successfully - motors stopped")
             
-            if self.playback_callback:
-                self.playback_callback("completed", "", len(self.current_playback_path))
+            if callback:
+                callback("completed", "", n_points)
                 
         except Exception as e:
             logging.error(f"Error in playback loop: {e}")
@@ -379,62 +656,85 @@ class PathRecorder:
             if self.playback_callback:
                 self.playback_callback("error", "", 0)
     
+    def _read_step_input(self) -> Optional[str]:
+        """
+        Wait for a manual-step command line on stdin, checking for stop every 0.5s
+        Returns None if playback is stopped first; raises EOFError when stdin is closed
+        """
+        stop_evt = self._stop_playback_evt
+        with selectors.DefaultSelector() as sel:
+            try:
+                sel.register(sys.stdin, selectors.EVENT_READ)
+            except (OSError, ValueError):
+                # stdin can't be polled (e.g. redirected from a file) - plain blocking read
+                return input().strip().lower()
+            
+            while not stop_evt.is_set():
+                if sel.select(timeout=0.5):
+                    line = sys.stdin.readline()
+                    if not line:
+                        raise EOFError
+                    return line.strip().lower()
+        return None
+    
     def _move_to_position_with_verification(self, axis: str, target: float, tolerance: float, max_wait: float) -> bool:
         """Move a single axis to target position with verification"""
-        start_time = time.time()
+        # Bind per-poll lookups once
+        clock = time.monotonic
+        get_position = self.controller.get_current_position
+        stop_evt = self._stop_playback_evt
+        
+        # Resolve the axis once: (move command, motor stop, index into the position tuple)
+        if axis == 'X':
+            set_position, stop_motor, index = self.controller.set_x_position, self.controller.x_motor.stop_motor, 0
+        else:
+            set_position, stop_motor, index = self.controller.set_y_position, self.controller.y_motor.stop_motor, 1
+        
+        deadline = clock() + max_wait
         consecutive_good_readings = 0
         required_readings = 2
         
         logging.info(f"{axis}: Starting movement to {target:.1f}%")
         
-        while time.time() - start_time < max_wait:
-            if not self.is_playing:
+        while clock() < deadline:
+            if stop_evt.is_set():
                 return False
             
             try:
                 # Get current position with timeout protection
-                logging.info(f"{axis}: Reading current position...")
-                current_x, current_y = self.controller.get_current_position()
-                current = current_x if axis == 'X' else current_y
+                current = get_position()[index]
                 
+                # Per-poll messages are lazy %-style debug records - only formatted when DEBUG is on
                 error = abs(current - target)
-                logging.info(f"{axis}: Current={current:.1f}%, Target={target:.1f}%, Error={error:.1f}%")
+                logging.debug("%s: Current=%.1f%%, Target=%.1f%%, Error=%.1f%%", axis, current, target, error)
                 
                 # Check if within tolerance
                 if error <= tolerance:
                     consecutive_good_readings += 1
-                    logging.info(f"{axis}: ✅ Within tolerance ({consecutive_good_readings}/{required_readings} checks)")
+                    logging.debug("%s: ✅ Within tolerance (%d/%d checks)", axis, consecutive_good_readings, required_readings)
                     
                     if consecutive_good_readings >= required_readings:
                         logging.info(f"{axis}: 🎯 Position confirmed!")
-                        # Stop the motor for this axis
-                        if axis == 'X':
-                            self.controller.x_motor.stop_motor()
-                        else:
-                            self.controller.y_motor.stop_motor()
+                        stop_motor()
                         return True
                         
-                    time.sleep(1.0)  # Wait longer before next check
+                    stop_evt.wait(1.0)  # Wait longer before next check
                 else:
                     consecutive_good_readings = 0
                     
                     # Send movement command
-                    logging.info(f"{axis}: Sending move command to {target:.1f}%")
-                    if axis == 'X':
-                        self.controller.set_x_position(target, use_closed_loop=False)  # Use open-loop to avoid nested loops
-                    else:
-                        self.controller.set_y_position(target, use_closed_loop=False)
+                    logging.debug("%s: Sending move command to %.1f%% (at %.1f%%)", axis, target, current)
+                    set_position(target, use_closed_loop=False)  # Use open-loop to avoid nested loops
                     
-                    time.sleep(3.0)  # Wait much longer for motor movement
+                    stop_evt.wait(3.0)  # Wait much longer for motor movement
                     
             except Exception as e:
-                logging.error(f"{axis}: Error during position verification: {e}")
-                time.sleep(0.5)
+                self._log_limited("verify", logging.ERROR, "%s: Error during position verification: %r", axis, e)
+                stop_evt.wait(0.5)
         
         # Timeout
         try:
-            current_x, current_y = self.controller.get_current_position()
-            current = current_x if axis == 'X' else current_y
+            current = get_position()[index]
             logging.warning(f"{axis}: ⏰ Timeout - Current={current:.1f}%, Target={target:.1f}%")
         except Exception as e:
             logging.error(f"{axis}: Error reading final position: {e}")
@@ -442,7 +742,7 @@ class PathRecorder:
     
     def _move_to_position_simultaneous(self, target_x: float, target_y: float, x_tolerance: float, y_tolerance: float, max_wait: float) -> bool:
         """Move both X and Y axes simultaneously to target position"""
-        start_time = time.time()
+        deadline = time.monotonic() + max_wait
         consecutive_good_readings = 0
         required_readings = 1  # Only need 1 good reading with tight tolerances and glitch filtering
         consecutive_sensor_failures = 0  # Track consecutive sensor failures
@@ -450,8 +750,23 @@ class PathRecorder:
         
         logging.info(f"Moving both axes simultaneously: X→{target_x:.1f}%, Y→{target_y:.1f}%")
         
+        # Bind the hardware handles the monitor loop uses on every iteration
+        x_motor, y_motor = self.controller.x_motor, self.controller.y_motor
+        x_sensor, y_sensor = self.controller.x_sensor, self.controller.y_sensor
+        try:
+            calibration = self.controller.config['hardware']['calibration']
+            x_config, y_config = calibration['x_axis'], calibration['y_axis']
+        except (KeyError, TypeError):
+            x_config = y_config = None  # Safety checks below fall back to the unclamped approach speed
+        
         # Get starting position to determine expected direction
         start_x, start_y = self.controller.get_current_position()
+        
+        # FAST PATH: both axes already within tolerance - skip direction/speed commands and the monitor loop
+        if abs(start_x - target_x) <= x_tolerance and abs(start_y - target_y) <= y_tolerance:
+            logging.info(f"✅ Already at target: X={start_x:.1f}%→{target_x:.1f}%, Y={start_y:.1f}%→{target_y:.1f}% - no movement needed")
+            return True
+        
         expected_x_direction = 1 if target_x > start_x else -1 if target_x < start_x else 0
         expected_y_direction = 1 if target_y > start_y else -1 if target_y < start_y else 0
         
@@ -466,22 +781,25 @@ class PathRecorder:
         logging.info("🚀 SENDING INITIAL MOVEMENT COMMANDS TO BOTH MOTORS...")
         
         # Get current position to determine correct directions (with aggressive retries for I2C stability)
-        current_x, current_y = 0.0, 0.0
+        # The starting reading above counts as the first attempt
+        current_x, current_y = start_x, start_y
         for attempt in range(5):  # More attempts
             try:
-                current_x, current_y = self.controller.get_current_position()
+                if attempt:
+                    current_x, current_y = self.controller.get_current_position()
                 # More lenient validation - accept any non-zero reading or reasonable values
                 if (current_x > 0.01 or current_y > 0.01) or (0.0 <= current_x <= 100.0 and 0.0 <= current_y <= 100.0):
                     logging.info(f"✅ Position reading attempt {attempt + 1} SUCCESS: X={current_x:.1f}%, Y={current_y:.1f}%")
                     break
                 else:
                     logging.warning(f"❌ Position reading attempt {attempt + 1}: X={current_x:.1f}%, Y={current_y:.1f}% (invalid)")
-                    if attempt < 4:
-                        time.sleep(0.3)  # Brief wait before retry
+                    if attempt < 4 and self._stop_playback_evt.wait(0.3):  # Brief wait before retry
+                        return False
             except Exception as e:
                 logging.warning(f"❌ Position reading attempt {attempt + 1} failed: {e}")
                 if attempt < 4:
-                    time.sleep(0.3)  # Brief wait before retry
+                    if self._stop_playback_evt.wait(0.3):  # Brief wait before retry
+                        return False
                 else:
                     # Final fallback - use a reasonable middle position
                     current_x, current_y = 25.0, 25.0
@@ -493,124 +811,132 @@ class PathRecorder:
         # CRITICAL: Set directions based on PATH TYPE (extend vs retract) not just position difference
         # This ensures extend always extends, retract always retracts, regardless of position
         path_name = getattr(self, 'current_path_name', 'unknown')
-        
-        if 'extend' in path_name.lower():
-            # EXTEND PATH: Always use directions that physically extend the arm
-            self.controller.x_motor.set_direction_forward()  # X motor: FORWARD for extending
-            logging.info(f"✅ X direction: FORWARD ({current_x:.1f}% → {target_x:.1f}%) - EXTEND PATH")
-        elif 'retract' in path_name.lower():
-            # RETRACT PATH: Always use directions that physically retract the arm  
-            self.controller.x_motor.set_direction_reverse()  # X motor: REVERSE for retracting
-            logging.info(f"✅ X direction: REVERSE ({current_x:.1f}% → {target_x:.1f}%) - RETRACT PATH")
-        else:
-            # FALLBACK: Use position-based logic for unknown paths
-            if target_x > current_x:
-                self.controller.x_motor.set_direction_forward()  # Assume extending
-                logging.info(f"✅ X direction: FORWARD ({current_x:.1f}% → {target_x:.1f}%) - UNKNOWN PATH (assuming extend)")
+        is_extend_path = self._path_direction > 0
+        is_retract_path = self._path_direction < 0
+        
+        # Same decision for both motors - EXTEND always forward, RETRACT always reverse,
+        # FALLBACK to position-based logic for unknown paths
+        for axis, motor, current, target in (('X', x_motor, current_x, target_x),
+                                             ('Y', y_motor, current_y, target_y)):
+            forward = is_extend_path or (not is_retract_path and target > current)
+            if forward:
+                motor.set_direction_forward()
             else:
-                self.controller.x_motor.set_direction_reverse()  # Assume retracting
-                logging.info(f"✅ X direction: REVERSE ({current_x:.1f}% → {target_x:.1f}%) - UNKNOWN PATH (assuming retract)")
-                
-        logging.info(f"🔄 X PATH-BASED DIRECTION: {path_name} → {'FORWARD (extend)' if 'extend' in path_name.lower() else 'REVERSE (retract)' if 'retract' in path_name.lower() else 'position-based'}")
-            
-        # CRITICAL: Log the expected movement direction  
-        logging.info(f"🔄 X EXPECTED: {'INCREASE' if target_x > current_x else 'DECREASE' if target_x < current_x else 'STAY'} from {current_x:.1f}% to {target_x:.1f}%")
-        
-        # CRITICAL: Set Y motor directions based on PATH TYPE (same logic as X motor)
-        if 'extend' in path_name.lower():
-            # EXTEND PATH: Always use directions that physically extend the arm
-            self.controller.y_motor.set_direction_forward()  # Y motor: FORWARD for extending  
-            logging.info(f"✅ Y direction: FORWARD ({current_y:.1f}% → {target_y:.1f}%) - EXTEND PATH")
-        elif 'retract' in path_name.lower():
-            # RETRACT PATH: Always use directions that physically retract the arm
-            self.controller.y_motor.set_direction_reverse()  # Y motor: REVERSE for retracting
-            logging.info(f"✅ Y direction: REVERSE ({current_y:.1f}% → {target_y:.1f}%) - RETRACT PATH")
-        else:
-            # FALLBACK: Use position-based logic for unknown paths
-            if target_y > current_y:
-                self.controller.y_motor.set_direction_forward()  # Assume extending
-                logging.info(f"✅ Y direction: FORWARD ({current_y:.1f}% → {target_y:.1f}%) - UNKNOWN PATH (assuming extend)")
-            else:
-                self.controller.y_motor.set_direction_reverse()  # Assume retracting  
-                logging.info(f"✅ Y direction: REVERSE ({current_y:.1f}% → {target_y:.1f}%) - UNKNOWN PATH (assuming retract)")
-                
-        logging.info(f"🔄 Y PATH-BASED DIRECTION: {path_name} → {'FORWARD (extend)' if 'extend' in path_name.lower() else 'REVERSE (retract)' if 'retract' in path_name.lower() else 'position-based'}")
+                motor.set_direction_reverse()
+            reason = ("EXTEND PATH" if is_extend_path else "RETRACT PATH" if is_retract_path
+                      else f"UNKNOWN PATH (assuming {'extend' if forward else 'retract'})")
+            logging.info(f"✅ {axis} direction: {'FORWARD' if forward else 'REVERSE'} ({current:.1f}% → {target:.1f}%) - {reason}")
+        
+        logging.info(f"🔄 PATH-BASED DIRECTION: {path_name} → {'FORWARD (extend)' if is_extend_path else 'REVERSE (retract)' if is_retract_path else 'position-based'}")
             
         # FORCE VERIFICATION: Ensure directions were set properly
         logging.info("🔍 DIRECTION SETUP COMPLETED - MOTORS SHOULD NOW HAVE PROPER DIRECTIONS")
         
         # Set initial speeds AFTER directions are set
-        self.controller.x_motor.set_speed(50.0)
-        self.controller.y_motor.set_speed(50.0)
+        x_motor.set_speed(50.0)
+        y_motor.set_speed(50.0)
         
         logging.info(f"✅ Movement commands sent: X→{target_x:.1f}%, Y→{target_y:.1f}%")
         
         # Start monitoring immediately - no fixed delay
         logging.info("Starting position monitoring...")
         iteration_count = 0
+        next_position_log = 0.0  # Monotonic deadline for the periodic position log
+        
+        # Motor lock flags - both axes start FREE for every datapoint
+        x_stopped = False
+        y_stopped = False
         
         # Initialize position tracking for overshoot detection
-        self.x_last_position = None
-        self.y_last_position = None
+        x_last_position = None
+        y_last_position = None
         x_command_count = 0
         
         # Initialize catastrophic reversal detection counters
         consecutive_x_reversals = 0
         consecutive_y_reversals = 0
         max_consecutive_reversals = 3  # Require 3 consecutive bad readings before locking
-        
+
+        # Per-axis settings for the monitor loop - both axes run through _service_axis
+        x_drive = _AxisDrive('X', x_motor, x_sensor, x_config, target_x, x_tolerance,
+                             base_speed=25.0,  # Much slower - prevent overshoot on small targets
+                             approach_speed=calculate_x_approach_speed,
+                             reversal=(15.0, 10.0))
+        y_drive = _AxisDrive('Y', y_motor, y_sensor, y_config, target_y, y_tolerance,
+                             base_speed=80.0,  # Much faster - was too slow at 14%
+                             approach_speed=calculate_y_approach_speed,
+                             reversal=(15.0, 8.0),
+                             # Y motor is very slow to respond - only stop for major direction reversals
+                             major_reversal=(5.0, 3.0),
+                             reassert_direction=True)
+
         # Initialize overshoot detection counters
         consecutive_x_overshoot = 0
         consecutive_y_overshoot = 0
         max_consecutive_overshoot = 1  # Immediate stop on first overshoot detection (no delay)
         y_command_count = 0
         max_commands_per_axis = 15  # Emergency stop after 15 commands per axis (more attempts)
+        
+        # Last 3 sensor readings per axis - consensus runs over these, so no extra reads or sleeps
+        readings_x = deque(maxlen=3)
+        readings_y = deque(maxlen=3)
+        
+        # With the controller's update thread running, each iteration wakes on its next reading
+        # instead of taking a second, competing I2C read of its own
+        wait_for_position = getattr(self.controller, 'wait_for_position', None)
+        if not getattr(self.controller, 'running', False):
+            wait_for_position = None
+        seen = getattr(self.controller, 'position_seq', 0)
 
-        while time.time() - start_time < max_wait:
-            if not self.is_playing:
+        while time.monotonic() < deadline:
+            if self._stop_playback_evt.is_set():
                 return False
             
             iteration_count += 1
             try:
-                # Get 3 sensor readings and use consensus to eliminate glitches
-                readings_x = []
-                readings_y = []
-                
-                # SINGLE reading (no averaging) to minimize I2C bus access
+                # SINGLE reading per iteration to minimize I2C bus access
+                got_reading = False
                 try:
-                    x_reading, y_reading = self.controller.get_current_position()
+                    reading = wait_for_position(seen, 1.0, self._stop_playback_evt) if wait_for_position else None
+                    if reading is not None:
+                        seen, x_reading, y_reading = reading
+                    else:
+                        if wait_for_position and not self.controller.running:
+                            wait_for_position = None  # Update thread stopped - read the sensors ourselves
+                        x_reading, y_reading = self.controller.get_current_position()
                     readings_x.append(x_reading)
                     readings_y.append(y_reading)
+                    got_reading = True
                 except Exception as e:
-                    logging.warning(f"Sensor reading failed: {e}")
+                    self._log_limited("sensor", logging.WARNING, "Sensor reading failed: %r", e)
                 
                 # Check if we got a valid reading
-                if len(readings_x) == 0 or len(readings_y) == 0:
+                if not got_reading:
                     consecutive_sensor_failures += 1
-                    logging.warning(f"⚠️ SENSOR GLITCH {consecutive_sensor_failures}/{max_consecutive_failures} - NO VALID READINGS!")
+                    logging.warning("⚠️ SENSOR GLITCH %s/%s - NO VALID READINGS!", consecutive_sensor_failures, max_consecutive_failures)
                     
                     if consecutive_sensor_failures >= max_consecutive_failures:
                         logging.error("🚨 CRITICAL SENSOR FAILURE - TOO MANY CONSECUTIVE FAILURES!")
                         logging.error("⚠️ EMERGENCY STOP: Cannot continue without sensor feedback")
                         # Emergency stop both motors immediately
-                        self.controller.x_motor.stop_motor()
-                        self.controller.x_motor.set_speed(0)
-                        self.controller.y_motor.stop_motor()
-                        self.controller.y_motor.set_speed(0)
+                        x_motor.stop_motor()
+                        x_motor.set_speed(0)
+                        y_motor.stop_motor()
+                        y_motor.set_speed(0)
                         logging.error("🛑 Both motors emergency stopped due to persistent sensor failures")
                         return False
                     else:
-                        logging.info(f"🔄 CONTINUING WITH CAUTION - Will retry sensor reading")
+                        logging.info("🔄 CONTINUING WITH CAUTION - Will retry sensor reading")
                         # Use last known position if available, otherwise skip this iteration
-                        time.sleep(0.2)  # Brief pause to let sensors recover
+                        self._stop_playback_evt.wait(0.2)  # Brief pause to let sensors recover
                         continue
                 else:
                     # Reset failure counter on successful reading
                     if consecutive_sensor_failures > 0:
-                        logging.info(f"✅ SENSOR RECOVERY - Reset failure counter from {consecutive_sensor_failures}")
+                        logging.info("✅ SENSOR RECOVERY - Reset failure counter from %s", consecutive_sensor_failures)
                         consecutive_sensor_failures = 0
                 
-                # Use consensus of 3 readings - pick the two closest values and average them
+                # Use consensus of the last 3 readings to eliminate glitches
                 current_x = self._get_consensus_reading(readings_x, 'X')
                 current_y = self._get_consensus_reading(readings_y, 'Y')
                 
@@ -621,41 +947,43 @@ class PathRecorder:
                 # Handle sensor reading errors gracefully with resilient overshoot detection
                 try:
                     x_at_target, consecutive_x_overshoot = self._is_axis_at_target_resilient(
-                        current_x, target_x, x_tolerance, 'X', consecutive_x_overshoot, max_consecutive_overshoot)
+                        current_x, target_x, x_tolerance, 'X', consecutive_x_overshoot, max_consecutive_overshoot,
+                        is_retract_path)
                     
                     # OVERSHOOT HANDLING: Stop motor immediately if overshoot confirmed
                     if consecutive_x_overshoot >= max_consecutive_overshoot:
-                        logging.error(f"🚨 X MOTOR EMERGENCY STOP - OVERSHOOT CONFIRMED! {current_x:.1f}% (target: {target_x:.1f}%)")
+                        logging.error("🚨 X MOTOR EMERGENCY STOP - OVERSHOOT CONFIRMED! %.1f%% (target: %.1f%%)", current_x, target_x)
                         # EMERGENCY BRAKE - immediate stop for overshoot
-                        self.controller.x_motor.brake_motor()  # Short brake - immediate stop
+                        x_motor.brake_motor()  # Short brake - immediate stop
                         time.sleep(0.3)  # Longer brake for emergency stop
-                        self.controller.x_motor.stop_motor()   # Then coast
-                        self.controller.x_motor.set_speed(0)   # Zero speed
-                        self.x_stopped = True
-                        logging.error(f"🛑 X MOTOR EMERGENCY BRAKED at {current_x:.1f}%")
+                        x_motor.stop_motor()   # Then coast
+                        x_motor.set_speed(0)   # Zero speed
+                        x_stopped = True
+                        logging.error("🛑 X MOTOR EMERGENCY BRAKED at %.1f%%", current_x)
                         
                 except Exception as e:
-                    logging.warning(f"X sensor error in target check: {e}")
+                    self._log_limited("x_target", logging.WARNING, "X sensor error in target check: %r", e)
                     x_at_target = False  # Assume not at target if sensor fails
                     consecutive_x_overshoot = 0  # Reset on sensor error
                 
                 try:
                     y_at_target, consecutive_y_overshoot = self._is_axis_at_target_resilient(
-                        current_y, target_y, y_tolerance, 'Y', consecutive_y_overshoot, max_consecutive_overshoot)
+                        current_y, target_y, y_tolerance, 'Y', consecutive_y_overshoot, max_consecutive_overshoot,
+                        is_retract_path)
                     
                     # OVERSHOOT HANDLING: Stop motor immediately if overshoot confirmed
                     if consecutive_y_overshoot >= max_consecutive_overshoot:
-                        logging.error(f"🚨 Y MOTOR EMERGENCY STOP - OVERSHOOT CONFIRMED! {current_y:.1f}% (target: {target_y:.1f}%)")
+                        logging.error("🚨 Y MOTOR EMERGENCY STOP - OVERSHOOT CONFIRMED! %.1f%% (target: %.1f%%)", current_y, target_y)
                         # EMERGENCY BRAKE - immediate stop for overshoot
-                        self.controller.y_motor.brake_motor()  # Short brake - immediate stop
+                        y_motor.brake_motor()  # Short brake - immediate stop
                         time.sleep(0.3)  # Longer brake for emergency stop
-                        self.controller.y_motor.stop_motor()   # Then coast
-                        self.controller.y_motor.set_speed(0)   # Zero speed
-                        self.y_stopped = True
-                        logging.error(f"🛑 Y MOTOR EMERGENCY BRAKED at {current_y:.1f}%")
+                        y_motor.stop_motor()   # Then coast
+                        y_motor.set_speed(0)   # Zero speed
+                        y_stopped = True
+                        logging.error("🛑 Y MOTOR EMERGENCY BRAKED at %.1f%%", current_y)
                         
                 except Exception as e:
-                    logging.warning(f"Y sensor error in target check: {e}")
+                    self._log_limited("y_target", logging.WARNING, "Y sensor error in target check: %r", e)
                     y_at_target = False  # Assume not at target if sensor fails
                     consecutive_y_overshoot = 0  # Reset on sensor error
                 
@@ -663,72 +991,75 @@ class PathRecorder:
                 # TODO: Fix overshoot detection logic - it's blocking initial movement
                 # if self._check_overshoot(current_x, target_x, 'X', expected_x_direction):
                 #     logging.error(f"🚨 X MOTOR EMERGENCY STOP - OVERSHOOT! {current_x:.1f}% target was {target_x:.1f}% (expected_direction: {expected_x_direction})")
-                #     self.controller.x_motor.stop_motor()
-                #     self.controller.x_motor.set_speed(0)
-                #     self.x_stopped = True
+                #     x_motor.stop_motor()
+                #     x_motor.set_speed(0)
+                #     x_stopped = True
                     
                 # if self._check_overshoot(current_y, target_y, 'Y', expected_y_direction):
                 #     logging.error(f"🚨 Y MOTOR EMERGENCY STOP - OVERSHOOT! {current_y:.1f}% target was {target_y:.1f}% (expected_direction: {expected_y_direction})")
-                #     self.controller.y_motor.stop_motor() 
-                #     self.controller.y_motor.set_speed(0)
-                #     self.y_stopped = True
+                #     y_motor.stop_motor() 
+                #     y_motor.set_speed(0)
+                #     y_stopped = True
                 
-                # Only log position every 25 iterations to reduce log spam
-                if iteration_count % 25 == 0 or x_error > 5.0 or y_error > 5.0:
-                    logging.info(f"Position: X={current_x:.1f}%→{target_x:.1f}% (Δ{x_error:.1f}%), Y={current_y:.1f}%→{target_y:.1f}% (Δ{y_error:.1f}%) [iter {iteration_count}]")
+                # Log position every iteration while far off, otherwise every 15s to reduce log spam
+                now = time.monotonic()
+                if now >= next_position_log or x_error > 5.0 or y_error > 5.0:
+                    next_position_log = now + 15.0
+                    logging.debug("Position: X=%.1f%%→%.1f%% (Δ%.1f%%), Y=%.1f%%→%.1f%% (Δ%.1f%%) [iter %d]",
+                                  current_x, target_x, x_error, current_y, target_y, y_error, iteration_count)
                 
                 # Stop motors that have reached their targets (but don't reset counter)  
-                if x_at_target and not hasattr(self, 'x_stopped'):
-                    logging.info(f"🎯 X motor reached target {target_x:.1f}% (current: {current_x:.1f}%, error: {x_error:.1f}%, tolerance: {x_tolerance}%)")
+                if x_at_target and not x_stopped:
+                    logging.info("🎯 X motor reached target %.1f%% (current: %.1f%%, error: %.1f%%, tolerance: %s%%)", target_x, current_x, x_error, x_tolerance)
                     # AGGRESSIVE BRAKE - use brake instead of stop for immediate stopping
-                    self.controller.x_motor.brake_motor()  # Short brake - immediate stop
+                    x_motor.brake_motor()  # Short brake - immediate stop
                     time.sleep(0.2)  # Let brake take effect
-                    self.controller.x_motor.stop_motor()   # Then coast
-                    self.controller.x_motor.set_speed(0)   # Zero speed
-                    self.x_stopped = True
-                    logging.info(f"🛑 X motor FORCE STOPPED at {current_x:.1f}%")
-                elif hasattr(self, 'x_stopped') and self.x_stopped:
+                    x_motor.stop_motor()   # Then coast
+                    x_motor.set_speed(0)   # Zero speed
+                    x_stopped = True
+                    logging.info("🛑 X motor FORCE STOPPED at %.1f%%", current_x)
+                elif x_stopped:
                     # RE-ENABLED: Motor stop logic (but only if truly at target)
                     if x_error < x_tolerance:  # Only stop if actually at target
-                        self.controller.x_motor.stop_motor()
-                        self.controller.x_motor.set_speed(0)
-                        logging.debug(f"X motor stopped - at target with {x_error:.1f}% error")
+                        x_motor.stop_motor()
+                        x_motor.set_speed(0)
+                        logging.debug("X motor stopped - at target with %.1f%% error", x_error)
                     else:
                         # Check if this was an emergency brake (overshoot)
                         if consecutive_x_overshoot > 0:
                             # DO NOT RESTART after emergency brake - stay stopped!
-                            logging.error(f"🛑 X MOTOR STAYS STOPPED after emergency brake - {x_error:.1f}% from target (overshoot count: {consecutive_x_overshoot})")
+                            logging.error("🛑 X MOTOR STAYS STOPPED after emergency brake - %.1f%% from target (overshoot count: %s)", x_error, consecutive_x_overshoot)
                         else:
                             # IGNORE premature stop - motor not at target yet (normal stop, not overshoot)
-                            logging.warning(f"X motor marked as stopped but still {x_error:.1f}% away from target - ALLOWING MOVEMENT")
+                            logging.warning("X motor marked as stopped but still %.1f%% away from target - ALLOWING MOVEMENT", x_error)
                             # Clear the stopped flag so motor can continue
-                            delattr(self, 'x_stopped')
+                            x_stopped = False
                 
-                if y_at_target and not hasattr(self, 'y_stopped'):
-                    logging.info(f"🎯 Y motor reached target {target_y:.1f}% (current: {current_y:.1f}%)")
+                if y_at_target and not y_stopped:
+                    logging.info("🎯 Y motor reached target %.1f%% (current: %.1f%%)", target_y, current_y)
                     # AGGRESSIVE BRAKE - use brake instead of stop for immediate stopping
-                    self.controller.y_motor.brake_motor()  # Short brake - immediate stop
+                    y_motor.brake_motor()  # Short brake - immediate stop
                     time.sleep(0.2)  # Let brake take effect
-                    self.controller.y_motor.stop_motor()   # Then coast
-                    self.controller.y_motor.set_speed(0)   # Zero speed
-                    self.y_stopped = True
-                    logging.info(f"🛑 Y motor FORCE STOPPED at {current_y:.1f}%")
-                elif hasattr(self, 'y_stopped') and self.y_stopped:
+                    y_motor.stop_motor()   # Then coast
+                    y_motor.set_speed(0)   # Zero speed
+                    y_stopped = True
+                    logging.info("🛑 Y motor FORCE STOPPED at %.1f%%", current_y)
+                elif y_stopped:
                     # RE-ENABLED: Motor stop logic (but only if truly at target)  
                     if y_error < y_tolerance:  # Only stop if actually at target
-                        self.controller.y_motor.stop_motor()
-                        self.controller.y_motor.set_speed(0)
-                        logging.debug(f"Y motor stopped - at target with {y_error:.1f}% error")
+                        y_motor.stop_motor()
+                        y_motor.set_speed(0)
+                        logging.debug("Y motor stopped - at target with %.1f%% error", y_error)
                     else:
                         # Check if this was an emergency brake (overshoot)
                         if consecutive_y_overshoot > 0:
                             # DO NOT RESTART after emergency brake - stay stopped!
-                            logging.error(f"🛑 Y MOTOR STAYS STOPPED after emergency brake - {y_error:.1f}% from target (overshoot count: {consecutive_y_overshoot})")
+                            logging.error("🛑 Y MOTOR STAYS STOPPED after emergency brake - %.1f%% from target (overshoot count: %s)", y_error, consecutive_y_overshoot)
                         else:
                             # IGNORE premature stop - motor not at target yet (normal stop, not overshoot)
-                            logging.warning(f"Y motor marked as stopped but still {y_error:.1f}% away from target - ALLOWING MOVEMENT")
+                            logging.warning("Y motor marked as stopped but still %.1f%% away from target - ALLOWING MOVEMENT", y_error)
                             # Clear the stopped flag so motor can continue
-                            delattr(self, 'y_stopped')
+                            y_stopped = False
                 
                 # Check if both axes are at target (but NOT stopped due to overshoot)
                 x_success = x_at_target and x_error < x_tolerance  # Actually at target, not just stopped
@@ -736,274 +1067,59 @@ class PathRecorder:
                 
                 if x_success and y_success:
                     consecutive_good_readings += 1
-                    logging.info(f"✅ Both axes at target ({consecutive_good_readings}/{required_readings} checks)")
+                    logging.info("✅ Both axes at target (%s/%s checks)", consecutive_good_readings, required_readings)
                     
                     if consecutive_good_readings >= required_readings:
-                        logging.info(f"🎯 DATAPOINT SUCCESS! Both axes reached target: X={current_x:.1f}%→{target_x:.1f}%, Y={current_y:.1f}%→{target_y:.1f}%")
+                        logging.info("🎯 DATAPOINT SUCCESS! Both axes reached target: X=%.1f%%→%.1f%%, Y=%.1f%%→%.1f%%", current_x, target_x, current_y, target_y)
                         # Stop both motors to ensure they don't drift
-                        self.controller.x_motor.stop_motor()
-                        self.controller.x_motor.set_speed(0)
-                        self.controller.y_motor.stop_motor()
-                        self.controller.y_motor.set_speed(0)
+                        x_motor.stop_motor()
+                        x_motor.set_speed(0)
+                        y_motor.stop_motor()
+                        y_motor.set_speed(0)
                         logging.info("🛑 Both motors stopped - datapoint complete")
                         
-                        # Reset flags for next datapoint
-                        if hasattr(self, 'x_stopped'):
-                            delattr(self, 'x_stopped')
-                        if hasattr(self, 'y_stopped'):
-                            delattr(self, 'y_stopped')
                         return True
                         
-                    time.sleep(0.5)  # Shorter wait - we're very close to success
+                    self._stop_playback_evt.wait(0.5)  # Shorter wait - we're very close to success
                 else:
                     consecutive_good_readings = 0
                     
                     # UNIDIRECTIONAL: NO CORRECTIONS ALLOWED
                     # Motors move in one direction only until they reach target or overshoot
                     # No direction changes, no corrections - just stop when target reached
-                    corrections_sent = False
-                    
-                    # All correction logic disabled - motors just continue until target reached or timeout
-                    
-                    # No corrections - just wait for motors to reach targets or timeout
-                    if False:  # DISABLED BROKEN CODE
-                        if x_error <= 0.3:  # Within 0.3% of target - very slow for precision
-                            approach_speed = base_speed * 0.3  # 30% speed when very close
-                            logging.info(f"X PRECISION: {x_error:.2f}% error → {approach_speed:.0f}% speed (30% - preventing overshoot)")
-                        elif x_error <= 1.0:  # Within 1% of target - slow down significantly  
-                            approach_speed = base_speed * 0.5  # 50% speed when approaching
-                            logging.info(f"X SLOW DOWN: {x_error:.2f}% error → {approach_speed:.0f}% speed (50% - approaching target)")
-                        else:  # Far from target
-                            approach_speed = base_speed  # Full speed
-                        return approach_speed
-                    
-                    # Only send commands to X motor if it hasn't been stopped yet
-                    if hasattr(self, 'x_stopped') and self.x_stopped:
-                        if iteration_count % 50 == 0:  # Only log every 50 iterations to reduce spam
-                            logging.info(f"X axis LOCKED: {current_x:.1f}% [iter {iteration_count}] - check X sensor connection!")
-                    elif x_error > x_tolerance and not x_at_target and not (hasattr(self, 'x_stopped') and self.x_stopped):
-                        # Check if motor is moving in wrong direction (away from target)
-                        if hasattr(self, 'x_last_position') and self.x_last_position is not None:
-                            last_error = abs(self.x_last_position - target_x)
-                            movement = abs(current_x - self.x_last_position)
-                            
-                            # RE-ENABLED: Wrong direction detection (but much more lenient)
-                            logging.debug(f"X direction check: {self.x_last_position:.1f}% → {current_x:.1f}%, movement: {movement:.1f}%, last_error: {last_error:.1f}%, current_error: {x_error:.1f}%")
-                            
-                            # Resilient catastrophic reversal detection - require multiple consecutive bad readings
-                            if movement > 15.0 and x_error > last_error + 10.0:  # Potential reversal detected
-                                consecutive_x_reversals += 1
-                                logging.warning(f"⚠️ X POTENTIAL REVERSAL {consecutive_x_reversals}/{max_consecutive_reversals}: {self.x_last_position:.1f}% → {current_x:.1f}% (moving away from {target_x:.1f}%)")
-                                logging.warning(f"   Last error: {last_error:.1f}%, Current error: {x_error:.1f}%, Movement: {movement:.1f}%")
-                                
-                                if consecutive_x_reversals >= max_consecutive_reversals:
-                                    logging.warning(f"🚫 X CATASTROPHIC REVERSAL CONFIRMED: {max_consecutive_reversals} consecutive bad readings")
-                                    self.controller.x_motor.stop_motor()
-                                    self.controller.x_motor.set_speed(0)
-                                    self.x_stopped = True
-                                    logging.warning(f"🔒 X MOTOR LOCKED due to confirmed catastrophic reversal [iteration {iteration_count}]")
-                                else:
-                                    logging.info(f"🔄 X CONTINUING with caution - need {max_consecutive_reversals - consecutive_x_reversals} more bad readings to lock")
-                            else:
-                                # Reset counter on good reading
-                                if consecutive_x_reversals > 0:
-                                    logging.info(f"✅ X REVERSAL COUNTER RESET: Was {consecutive_x_reversals}, now 0 (good reading)")
-                                    consecutive_x_reversals = 0
-                                if iteration_count % 100 == 0:  # Reduce X continuing spam
-                                    logging.debug(f"⏳ X CONTINUING: {current_x:.1f}% → {target_x:.1f}% (movement: {movement:.1f}%, error: {x_error:.1f}%, allowing variations)")
-                        else:
-                            if iteration_count <= 5:  # Only log first few iterations
-                                logging.info(f"⏳ X CONTINUING: {current_x:.1f}% → {target_x:.1f}% (error: {x_error:.1f}%, first check)")
-                        # Send speed adjustment commands based on distance to target
-                        base_x_speed = 25.0  # Default speed for X motor (much slower - prevent overshoot on small targets)
-                        new_x_speed = calculate_x_approach_speed(x_error, base_x_speed)
-                        
-                        # SAFETY CHECK: Apply safety limits before setting speed
-                        try:
-                            x_voltage = self.controller.x_sensor.read_voltage()
-                            x_config = self.controller.config['hardware']['calibration']['x_axis']
-                            
-                            # Determine current direction based on path type
-                            path_name = getattr(self, 'current_path_name', 'unknown')
-                            if 'retract' in path_name.lower():
-                                x_direction = 'reverse'
-                            else:
-                                x_direction = 'forward'
-                            
-                            should_stop, max_safe_speed = self.controller.x_motor.check_safety_limits(
-                                x_voltage, x_config['min_voltage'], x_config['max_voltage'],
-                                x_config['safety_margin'], x_config['slow_zone_margin'], 
-                                x_config['safety_slow_speed'], x_direction
-                            )
-                            
-                            if should_stop:
-                                logging.warning(f"🛑 X SAFETY STOP: Voltage {x_voltage:.3f}V at limit")
-                                self.controller.x_motor.stop_motor()
-                                self.controller.x_motor.set_speed(0)
-                                self.x_stopped = True
-                            else:
-                                # Apply the more restrictive of safety limit or approach speed
-                                final_x_speed = min(new_x_speed, max_safe_speed)
-                                if final_x_speed < new_x_speed:
-                                    logging.warning(f"🐌 X SAFETY SLOW: {new_x_speed:.1f}% → {final_x_speed:.1f}% (voltage: {x_voltage:.3f}V)")
-                                
-                                # UNIDIRECTIONAL: Never change direction - only adjust speed
-                                # Direction was set correctly at start and must never change
-                                # Changing direction violates unidirectional movement principle
-                                
-                                self.controller.x_motor.set_speed(final_x_speed)
-                                logging.debug(f"X speed adjustment: {final_x_speed:.1f}% (direction unchanged)")
-                        except Exception as e:
-                            logging.warning(f"X safety check failed: {e}, using original speed")
-                            self.controller.x_motor.set_speed(new_x_speed)
-                            
-                        corrections_sent = True
-                        
-                        # Update last position for next check
-                        self.x_last_position = current_x
-                    elif x_at_target:
-                        logging.debug(f"X axis OK: {current_x:.1f}% (within {x_tolerance}% of {target_x:.1f}%)")
-                    
-                    # Only send commands to Y motor if it hasn't been stopped yet
-                    if hasattr(self, 'y_stopped') and self.y_stopped:
-                        if iteration_count % 50 == 0:  # Only log every 50 iterations to reduce spam
-                            logging.info(f"Y axis LOCKED: {current_y:.1f}% [iter {iteration_count}]")
-                    elif y_error > y_tolerance and not y_at_target:
-                        # Check if motor is moving in wrong direction (away from target)
-                        if hasattr(self, 'y_last_position') and self.y_last_position is not None:
-                            last_error = abs(self.y_last_position - target_y)
-                            movement = abs(current_y - self.y_last_position)
-                            
-                            # Y motor is very slow to respond - only stop for major direction reversals
-                            # Be very lenient for large movements - sensor glitches can cause false readings
-                            if target_y > 10.0:  # Large movement targets - be very lenient
-                                if movement > 5.0 and y_error > last_error + 3.0:  # Very lenient for large movements
-                                    logging.warning(f"🚫 Y MAJOR DIRECTION REVERSAL: {self.y_last_position:.1f}% → {current_y:.1f}% (moving away from {target_y:.1f}%)")
-                                    logging.warning(f"   Last error: {last_error:.1f}%, Current error: {y_error:.1f}%, Movement: {movement:.1f}%")
-                                    self.controller.y_motor.stop_motor()
-                                    self.controller.y_motor.set_speed(0)
-                                    self.y_stopped = True
-                                else:
-                                    if iteration_count % 100 == 0:  # Reduce Y continuing spam  
-                                        logging.info(f"⏳ Y CONTINUING: {current_y:.1f}% → {target_y:.1f}% (large movement, allowing sensor variations)")
-                            else:  # Small movement targets - be extremely lenient for Y motor
-                                if movement > 15.0 and y_error > last_error + 8.0:  # Potential Y reversal detected
-                                    consecutive_y_reversals += 1
-                                    logging.warning(f"⚠️ Y POTENTIAL REVERSAL {consecutive_y_reversals}/{max_consecutive_reversals}: {self.y_last_position:.1f}% → {current_y:.1f}% (moving away from {target_y:.1f}%)")
-                                    logging.warning(f"   Last error: {last_error:.1f}%, Current error: {y_error:.1f}%, Movement: {movement:.1f}%")
-                                    
-                                    if consecutive_y_reversals >= max_consecutive_reversals:
-                                        logging.warning(f"🚫 Y CATASTROPHIC REVERSAL CONFIRMED: {max_consecutive_reversals} consecutive bad readings")
-                                        self.controller.y_motor.stop_motor()
-                                        self.controller.y_motor.set_speed(0)
-                                        self.y_stopped = True
-                                        logging.warning(f"🔒 Y MOTOR LOCKED due to confirmed catastrophic reversal [iteration {iteration_count}]")
-                                    else:
-                                        logging.info(f"🔄 Y CONTINUING with caution - need {max_consecutive_reversals - consecutive_y_reversals} more bad readings to lock")
-                                else:
-                                    # Reset counter on good reading
-                                    if consecutive_y_reversals > 0:
-                                        logging.info(f"✅ Y REVERSAL COUNTER RESET: Was {consecutive_y_reversals}, now 0 (good reading)")
-                                        consecutive_y_reversals = 0
-                                    if iteration_count % 100 == 0:  # Reduce Y continuing spam
-                                        logging.info(f"⏳ Y CONTINUING: {current_y:.1f}% → {target_y:.1f}% (error: {y_error:.1f}%, allowing sensor delays)")
-                        else:
-                            if iteration_count <= 5:  # Only log first few iterations
-                                logging.info(f"⏳ Y CONTINUING: {current_y:.1f}% → {target_y:.1f}% (error: {y_error:.1f}%, first check)")
-                        # Send speed adjustment commands based on distance to target
-                        base_y_speed = 80.0  # Default speed for Y motor (much faster - was too slow at 14%)
-                        new_y_speed = calculate_y_approach_speed(y_error, base_y_speed)
-                        
-                        # SAFETY CHECK: Apply safety limits before setting speed
-                        try:
-                            y_voltage = self.controller.y_sensor.read_voltage()
-                            y_config = self.controller.config['hardware']['calibration']['y_axis']
-                            
-                            # Determine current direction based on path type
-                            path_name = getattr(self, 'current_path_name', 'unknown')
-                            if 'retract' in path_name.lower():
-                                y_direction = 'reverse'
-                            else:
-                                y_direction = 'forward'
-                            
-                            should_stop, max_safe_speed = self.controller.y_motor.check_safety_limits(
-                                y_voltage, y_config['min_voltage'], y_config['max_voltage'],
-                                y_config['safety_margin'], y_config['slow_zone_margin'], 
-                                y_config['safety_slow_speed'], y_direction
-                            )
-                            
-                            if should_stop:
-                                logging.warning(f"🛑 Y SAFETY STOP: Voltage {y_voltage:.3f}V at limit")
-                                self.controller.y_motor.stop_motor()
-                                self.controller.y_motor.set_speed(0)
-                                self.y_stopped = True
-                            else:
-                                # Apply the more restrictive of safety limit or approach speed
-                                final_y_speed = min(new_y_speed, max_safe_speed)
-                                if final_y_speed < new_y_speed:
-                                    logging.warning(f"🐌 Y SAFETY SLOW: {new_y_speed:.1f}% → {final_y_speed:.1f}% (voltage: {y_voltage:.3f}V)")
-                                
-                                # Determine direction for Y motor using PATH-BASED logic (same as initial setup)
-                                if 'extend' in path_name.lower():
-                                    self.controller.y_motor.set_direction_forward()  # EXTEND: FORWARD
-                                elif 'retract' in path_name.lower():
-                                    self.controller.y_motor.set_direction_reverse()  # RETRACT: REVERSE
-                                else:
-                                    # Fallback to position-based
-                                    if target_y > current_y:
-                                        self.controller.y_motor.set_direction_forward()
-                                    else:
-                                        self.controller.y_motor.set_direction_reverse()
-                                
-                                self.controller.y_motor.set_speed(final_y_speed)
-                        except Exception as e:
-                            logging.warning(f"Y safety check failed: {e}, using original speed")
-                            # Fallback direction setting
-                            path_name = getattr(self, 'current_path_name', 'unknown')
-                            if 'extend' in path_name.lower():
-                                self.controller.y_motor.set_direction_forward()
-                            elif 'retract' in path_name.lower():
-                                self.controller.y_motor.set_direction_reverse()
-                            else:
-                                if target_y > current_y:
-                                    self.controller.y_motor.set_direction_forward()
-                                else:
-                                    self.controller.y_motor.set_direction_reverse()
-                            self.controller.y_motor.set_speed(new_y_speed)
-                            
-                        corrections_sent = True
-                        
-                        # Update last position for next check
-                        self.y_last_position = current_y
-                    elif y_at_target:
-                        logging.debug(f"Y axis OK: {current_y:.1f}% (within {y_tolerance}% of {target_y:.1f}%)")
-                    
-                    # Close the disabled code block
+                    x_stopped, x_last_position, consecutive_x_reversals = self._service_axis(
+                        x_drive, current_x, x_error, x_at_target, x_stopped, x_last_position,
+                        consecutive_x_reversals, max_consecutive_reversals, iteration_count)
+                    y_stopped, y_last_position, consecutive_y_reversals = self._service_axis(
+                        y_drive, current_y, y_error, y_at_target, y_stopped, y_last_position,
+                        consecutive_y_reversals, max_consecutive_reversals, iteration_count)
                     
                     # CRITICAL: Match read_potentiometers.py timing!
                     # It reads with 200ms gaps and has stable readings
-                    # We need the same gap to let I2C bus fully settle
-                    time.sleep(0.200)  # 200ms loop delay to match read_potentiometers.py
+                    # We need the same gap to let I2C bus fully settle - only when reading the sensors
+                    # ourselves; on the controller's updates the wait for the next reading paces the loop
+                    if not wait_for_position:
+                        self._stop_playback_evt.wait(0.200)  # 200ms loop delay to match read_potentiometers.py
                     
             except Exception as e:
-                logging.error(f"Error during simultaneous movement: {e}")
-                time.sleep(0.5)  # Brief pause on error
+                self._log_limited("simultaneous", logging.ERROR, "Error during simultaneous movement: %r", e)
+                self._stop_playback_evt.wait(0.5)  # Brief pause on error
         
         # Timeout - stop both motors
-        self.controller.x_motor.stop_motor()
-        self.controller.y_motor.stop_motor()
+        x_motor.stop_motor()
+        y_motor.stop_motor()
         
         try:
             current_x, current_y = self.controller.get_current_position()
-            logging.warning(f"⏰ Timeout - Current: X={current_x:.1f}%, Y={current_y:.1f}%, Target: X={target_x:.1f}%, Y={target_y:.1f}%")
+            logging.warning("⏰ Timeout - Current: X=%.1f%%, Y=%.1f%%, Target: X=%.1f%%, Y=%.1f%%", current_x, current_y, target_x, target_y)
         except Exception as e:
-            logging.error(f"Error reading final position: {e}")
+            logging.error("Error reading final position: %s", e)
         return False
     
-    def _get_consensus_reading(self, readings: list, axis: str) -> float:
+    def _get_consensus_reading(self, readings: deque, axis: str) -> float:
         """
-        Get consensus from 3 sensor readings by finding the two closest values and averaging them
-        This eliminates sensor glitches that cause single bad readings
+        Get consensus from the last 3 sensor readings (oldest first)
+        Uses the newest reading unless it is a glitch against the median of the three
         """
         if len(readings) < 1:
             logging.error(f"🚨 NO {axis} SENSOR READINGS - EMERGENCY STOP REQUIRED")
@@ -1013,36 +1129,22 @@ class PathRecorder:
             self.controller.y_motor.stop_motor()
             self.controller.y_motor.set_speed(0)
             return 0.0
-        elif len(readings) == 1:
-            logging.warning(f"⚠️ {axis} DEGRADED SENSOR: Only 1 reading available - using it but risky")
-            return readings[0]
-        
-        if len(readings) == 2:
-            avg = (readings[0] + readings[1]) / 2
-            logging.debug(f"{axis} consensus (2 readings): {readings[0]:.1f}%, {readings[1]:.1f}% → {avg:.1f}%")
-            return avg
-        
-        # For 3 readings, find the two closest and average them
-        distances = [
-            (abs(readings[0] - readings[1]), 0, 1),  # distance between 0,1
-            (abs(readings[0] - readings[2]), 0, 2),  # distance between 0,2  
-            (abs(readings[1] - readings[2]), 1, 2),  # distance between 1,2
-        ]
-        
-        # Find the pair with minimum distance (most consistent)
-        min_distance, idx1, idx2 = min(distances)
-        consensus = (readings[idx1] + readings[idx2]) / 2
-        
-        logging.debug(f"{axis} consensus (3 readings): [{readings[0]:.1f}%, {readings[1]:.1f}%, {readings[2]:.1f}%] → closest pair: {readings[idx1]:.1f}%, {readings[idx2]:.1f}% → {consensus:.1f}%")
-        
-        # Log if we had to reject a glitchy reading
-        rejected_idx = [0, 1, 2]
-        rejected_idx.remove(idx1)
-        rejected_idx.remove(idx2)
-        if rejected_idx and min_distance > 2.0:  # If we rejected a reading that was >2% different
-            logging.warning(f"🔧 {axis} GLITCH REJECTED: {readings[rejected_idx[0]]:.1f}% (consensus: {consensus:.1f}%)")
-        
-        return consensus
+        
+        newest = readings[-1]
+        if len(readings) < 3:
+            # Still filling the window at the start of a move
+            return newest
+        
+        # Median of 3 - the newest sample stays unless it disagrees by >2%, so the
+        # target check doesn't lag a whole sensor read behind the moving arm
+        a, b, c = readings
+        median = _median3(a, b, c)
+        if abs(newest - median) > 2.0:
+            logging.warning("🔧 %s GLITCH REJECTED: %.1f%% (consensus: %.1f%%)", axis, newest, median)
+            return median
+        
+        logging.debug("%s consensus: [%.1f%%, %.1f%%, %.1f%%] → %.1f%%", axis, a, b, c, newest)
+        return newest
 
     def _is_axis_at_target(self, current: float, target: float, tolerance: float, axis: str) -> bool:
         """
@@ -1061,8 +1163,7 @@ class PathRecorder:
             overshoot_tolerance = 1.5  # 1.5% tolerance for small movements (<5%)
         
         # Get path type to determine movement direction
-        path_name = getattr(self, 'current_path_name', 'unknown')
-        is_retract_path = 'retract' in path_name.lower()
+        is_retract_path = self._path_direction < 0
         
         if is_retract_path:
             # Retract: going towards 0 - only overshoot if went BELOW target
@@ -1094,27 +1195,134 @@ class PathRecorder:
         logging.debug(f"{axis} NOT AT TARGET: {current:.1f}% hasn't reached {target:.1f}% yet")
         return False
 
+    def _service_axis(self, axis: _AxisDrive, current: float, error: float, at_target: bool, stopped: bool,
+                      last_position: Optional[float], reversals: int, max_reversals: int,
+                      iteration_count: int) -> Tuple[bool, Optional[float], int]:
+        """
+        One monitor-loop pass for one axis of a simultaneous move: reversal checks, then a speed update
+        Returns the updated (stopped, last_position, consecutive reversals)
+        """
+        name, motor, target = axis.name, axis.motor, axis.target
+
+        # Only send commands to the motor if it hasn't been stopped yet
+        if stopped:
+            self._log_limited(name + "_locked", logging.INFO, "%s axis LOCKED: %.1f%% [iter %s] - check %s sensor connection!",
+                              name, current, iteration_count, name, interval=30.0)
+            return stopped, last_position, reversals
+        if at_target:
+            logging.debug("%s axis OK: %.1f%% (within %s%% of %.1f%%)", name, current, axis.tolerance, target)
+            return stopped, last_position, reversals
+        if error <= axis.tolerance:
+            return stopped, last_position, reversals
+
+        # Check if motor is moving in wrong direction (away from target)
+        if last_position is not None:
+            last_error = abs(last_position - target)
+            movement = abs(current - last_position)
+            logging.debug("%s direction check: %.1f%% → %.1f%%, movement: %.1f%%, last_error: %.1f%%, current_error: %.1f%%", name, last_position, current, movement, last_error, error)
+
+            if axis.major_reversal is not None and target > 10.0:
+                # Large movement targets - be very lenient, sensor glitches can cause false readings
+                major_movement, major_growth = axis.major_reversal
+                if movement > major_movement and error > last_error + major_growth:
+                    logging.warning("🚫 %s MAJOR DIRECTION REVERSAL: %.1f%% → %.1f%% (moving away from %.1f%%)", name, last_position, current, target)
+                    logging.warning("   Last error: %.1f%%, Current error: %.1f%%, Movement: %.1f%%", last_error, error, movement)
+                    motor.stop_motor()
+                    motor.set_speed(0)
+                    stopped = True
+                else:
+                    self._log_limited(name + "_continuing", logging.DEBUG, "⏳ %s CONTINUING: %.1f%% → %.1f%% (large movement, allowing sensor variations)",
+                                      name, current, target, interval=60.0)
+            elif movement > axis.reversal[0] and error > last_error + axis.reversal[1]:
+                # Resilient catastrophic reversal detection - require multiple consecutive bad readings
+                reversals += 1
+                logging.warning("⚠️ %s POTENTIAL REVERSAL %s/%s: %.1f%% → %.1f%% (moving away from %.1f%%)", name, reversals, max_reversals, last_position, current, target)
+                logging.warning("   Last error: %.1f%%, Current error: %.1f%%, Movement: %.1f%%", last_error, error, movement)
+
+                if reversals >= max_reversals:
+                    logging.warning("🚫 %s CATASTROPHIC REVERSAL CONFIRMED: %s consecutive bad readings", name, max_reversals)
+                    motor.stop_motor()
+                    motor.set_speed(0)
+                    stopped = True
+                    logging.warning("🔒 %s MOTOR LOCKED due to confirmed catastrophic reversal [iteration %s]", name, iteration_count)
+                else:
+                    logging.info("🔄 %s CONTINUING with caution - need %s more bad readings to lock", name, max_reversals - reversals)
+            else:
+                # Reset counter on good reading
+                if reversals > 0:
+                    logging.info("✅ %s REVERSAL COUNTER RESET: Was %s, now 0 (good reading)", name, reversals)
+                    reversals = 0
+                self._log_limited(name + "_continuing", logging.DEBUG, "⏳ %s CONTINUING: %.1f%% → %.1f%% (movement: %.1f%%, error: %.1f%%, allowing variations)",
+                                  name, current, target, movement, error, interval=60.0)
+        elif iteration_count <= 5:  # Only log first few iterations
+            logging.info("⏳ %s CONTINUING: %.1f%% → %.1f%% (error: %.1f%%, first check)", name, current, target, error)
+        if stopped:
+            return stopped, current, reversals  # Locked - don't follow the stop with a new speed
+
+        # Send speed adjustment commands based on distance to target
+        new_speed = axis.approach_speed(error, axis.base_speed)
+        is_extend_path = self._path_direction > 0
+        is_retract_path = self._path_direction < 0
+
+        # SAFETY CHECK: Apply safety limits before setting speed
+        try:
+            voltage = axis.sensor.read_voltage()
+            config = axis.config
+            should_stop, max_safe_speed = motor.check_safety_limits(
+                voltage, config['min_voltage'], config['max_voltage'],
+                config['safety_margin'], config['slow_zone_margin'],
+                config['safety_slow_speed'], 'reverse' if is_retract_path else 'forward'
+            )
+
+            if should_stop:
+                logging.warning("🛑 %s SAFETY STOP: Voltage %.3fV at limit", name, voltage)
+                motor.stop_motor()
+                motor.set_speed(0)
+                stopped = True
+            else:
+                # Apply the more restrictive of safety limit or approach speed
+                final_speed = min(new_speed, max_safe_speed)
+                if final_speed < new_speed:
+                    logging.warning("🐌 %s SAFETY SLOW: %.1f%% → %.1f%% (voltage: %.3fV)", name, new_speed, final_speed, voltage)
+                new_speed = final_speed
+        except Exception as e:
+            self._log_limited(f"{name}_safety", logging.WARNING, "%s safety check failed: %r, using original speed", name, e)
+
+        if not stopped:
+            # UNIDIRECTIONAL: only the path-based direction set at the start is ever re-sent
+            if axis.reassert_direction:
+                if is_extend_path or (not is_retract_path and target > current):
+                    motor.set_direction_forward()
+                else:
+                    motor.set_direction_reverse()
+            motor.set_speed(new_speed)
+            logging.debug("%s speed adjustment: %.1f%%", name, new_speed)
+
+        # Update last position for next check
+        return stopped, current, reversals
+
     def _is_axis_at_target_resilient(self, current: float, target: float, tolerance: float, axis: str, 
-                                   consecutive_overshoot: int, max_consecutive_overshoot: int) -> tuple[bool, int]:
+                                   consecutive_overshoot: int, max_consecutive_overshoot: int,
+                                   is_retract_path: Optional[bool] = None) -> tuple[bool, int]:
         """
         Check if axis has reached target with resilient overshoot detection that requires consecutive bad readings
+        is_retract_path falls back to the direction play_path resolved when the caller doesn't pass it
         Returns: (at_target, updated_consecutive_overshoot_count)
         """
         error = abs(current - target)
         
         # ADAPTIVE overshoot tolerance based on distance to target
         # Larger tolerance for larger movements to account for momentum
-        distance_to_target = abs(current - target)
-        if distance_to_target > 10.0:
+        if error > 10.0:
             overshoot_tolerance = 5.0  # 5% tolerance for large movements (>10%)
-        elif distance_to_target > 5.0:
+        elif error > 5.0:
             overshoot_tolerance = 3.0  # 3% tolerance for medium movements (5-10%)
         else:
             overshoot_tolerance = 1.5  # 1.5% tolerance for small movements (<5%)
         
         # Get path type to determine movement direction
-        path_name = getattr(self, 'current_path_name', 'unknown')
-        is_retract_path = 'retract' in path_name.lower()
+        if is_retract_path is None:
+            is_retract_path = self._path_direction < 0
         
         # Check for potential overshoot
         potential_overshoot = False
@@ -1130,39 +1338,33 @@ class PathRecorder:
         # Handle overshoot detection with consecutive readings requirement
         if potential_overshoot:
             consecutive_overshoot += 1
-            logging.warning(f"⚠️ {axis} POTENTIAL OVERSHOOT {consecutive_overshoot}/{max_consecutive_overshoot}: {current:.1f}% (target: {target:.1f}%)")
+            logging.warning("⚠️ %s POTENTIAL OVERSHOOT %s/%s: %.1f%% (target: %.1f%%)", axis, consecutive_overshoot, max_consecutive_overshoot, current, target)
             
             if consecutive_overshoot >= max_consecutive_overshoot:
                 if is_retract_path:
-                    logging.warning(f"🚨 {axis} OVERSHOOT CONFIRMED: {current:.1f}% < {target:.1f}% - {overshoot_tolerance:.1f}% (retract went too far towards 0)")
+                    logging.warning("🚨 %s OVERSHOOT CONFIRMED: %.1f%% < %.1f%% - %.1f%% (retract went too far towards 0)", axis, current, target, overshoot_tolerance)
                 else:
-                    logging.warning(f"🚨 {axis} OVERSHOOT CONFIRMED: {current:.1f}% > {target:.1f}% + {overshoot_tolerance:.1f}% (extend went too far towards 100)")
+                    logging.warning("🚨 %s OVERSHOOT CONFIRMED: %.1f%% > %.1f%% + %.1f%% (extend went too far towards 100)", axis, current, target, overshoot_tolerance)
                 return True, consecutive_overshoot
             else:
-                logging.info(f"🔄 {axis} CONTINUING with caution - need {max_consecutive_overshoot - consecutive_overshoot} more overshoot readings to stop")
+                logging.info("🔄 %s CONTINUING with caution - need %s more overshoot readings to stop", axis, max_consecutive_overshoot - consecutive_overshoot)
         else:
             # Reset counter on good reading
             if consecutive_overshoot > 0:
-                logging.info(f"✅ {axis} OVERSHOOT COUNTER RESET: Was {consecutive_overshoot}, now 0 (good reading)")
+                logging.info("✅ %s OVERSHOOT COUNTER RESET: Was %s, now 0 (good reading)", axis, consecutive_overshoot)
                 consecutive_overshoot = 0
         
         # Only log debug info if error is very large (debugging tolerance issues)
         if error > 10.0:
-            logging.warning(f"🔍 {axis} LARGE ERROR: current={current:.1f}%, target={target:.1f}%, error={error:.1f}%, tolerance={tolerance}%")
+            logging.warning("🔍 %s LARGE ERROR: current=%.1f%%, target=%.1f%%, error=%.1f%%, tolerance=%s%%", axis, current, target, error, tolerance)
         
         # Precise target detection - must be within tolerance range, not just on one side
-        if is_retract_path:
-            # Retract: going towards 0 - at target if within tolerance range
-            if target - tolerance <= current <= target + tolerance:
-                logging.info(f"{axis} AT TARGET: {current:.1f}% reached/passed {target:.1f}% (retract)")
-                return True, consecutive_overshoot
-        else:
-            # Extend: going towards 100 - at target if within tolerance range  
-            if target - tolerance <= current <= target + tolerance:
-                logging.info(f"{axis} AT TARGET: {current:.1f}% reached/passed {target:.1f}% (extend)")
-                return True, consecutive_overshoot
+        # (same band for extend and retract)
+        if error <= tolerance:
+            logging.info("%s AT TARGET: %.1f%% reached/passed %.1f%% (%s)", axis, current, target, 'retract' if is_retract_path else 'extend')
+            return True, consecutive_overshoot
                 
-        logging.debug(f"{axis} NOT AT TARGET: {current:.1f}% hasn't reached {target:.1f}% yet")
+        logging.debug("%s NOT AT TARGET: %.1f%% hasn't reached %.1f%% yet", axis, current, target)
         return False, consecutive_overshoot
     
     def _check_overshoot(self, current: float, target: float, axis: str, expected_direction: int) -> bool:
@@ -1201,61 +1403,93 @@ class PathRecorder:
         # This prevents the system from making "corrections" that reverse direction
         return False
     
-    def save_path(self, path_name: str, path_data: List[PathPoint]) -> bool:
-        """Save a recorded path to disk"""
+    def _path_file(self, path_name: str) -> Path:
+        """File holding path_name - the .npz if there is one, otherwise the .json"""
+        npz_path = self.paths_directory / f"{path_name}.npz"
+        return npz_path if npz_path.exists() else self.paths_directory / f"{path_name}.json"
+    
+    def save_path(self, path_name: str, path_data: Union[_PathBuffer, List[PathPoint]]) -> bool:
+        """Save a recorded path to disk (.npz columns, or .json with path_format: json)"""
+        tmp_path = None
         try:
-            file_path = self.paths_directory / f"{path_name}.json"
-            
             # Convert path data to dictionary format
             path_dict = {
                 'name': path_name,
                 'recorded_at': time.time(),
                 'duration': path_data[-1].duration_from_start if path_data else 0,
                 'point_count': len(path_data),
-                'points': [point.to_dict() for point in path_data]
             }
             
-            with open(file_path, 'w') as f:
-                json.dump(path_dict, f, indent=2)
+            file_path = self.paths_directory / f"{path_name}.{'npz' if self.path_format == 'npz' else 'json'}"
+            # Write a temp file and rename it over the target, so a crash or power cut
+            # mid-save leaves the previous file intact instead of a truncated one
+            tmp_path = Path(f"{file_path}.tmp")
+            with open(tmp_path, 'wb') as f:
+                if self.path_format == 'npz':
+                    if not isinstance(path_data, _PathBuffer):
+                        rows = [(p.timestamp, p.x_position, p.y_position, p.duration_from_start) for p in path_data]
+                        path_data = _PathBuffer.from_columns(*np.array(rows, dtype=np.float64).reshape(-1, 4).T)
+                    ts, xs, ys, dur = path_data.columns()
+                    # Durations are timestamps minus the recording start, so only the start is stored
+                    if len(ts):
+                        path_dict['started_at'] = float(ts[0] - dur[0])
+                    # Same layout as path_cleaner.py: float32 positions, float64 timestamps, JSON metadata
+                    np.savez_compressed(f, xs=xs.astype(np.float32), ys=ys.astype(np.float32), ts=ts,
+                                        meta=np.array([json.dumps(path_dict)]))
+                else:
+                    path_dict['points'] = (path_data.to_dicts() if isinstance(path_data, _PathBuffer)
+                                           else [point.to_dict() for point in path_data])
+                    f.write(_dumps(path_dict))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, file_path)
+            
+            if file_path.suffix == '.npz':
+                # Drop an older .json copy so list_paths shows the path once
+                (self.paths_directory / f"{path_name}.json").unlink(missing_ok=True)
             
+            self._list_cache = None  # An in-place overwrite doesn't change the directory mtime
             logging.info(f"Path saved: {file_path}")
             return True
             
         except Exception as e:
             logging.error(f"Error saving path {path_name}: {e}")
+            if tmp_path is not None and tmp_path.exists():
+                tmp_path.unlink()
             return False
     
     def load_path(self, path_name: str) -> Optional[List[PathPoint]]:
         """Load a recorded path from disk"""
         try:
-            file_path = self.paths_directory / f"{path_name}.json"
+            file_path = self._path_file(path_name)
             
             if not file_path.exists():
                 logging.error(f"Path file not found: {file_path}")
                 return None
             
-            with open(file_path, 'r') as f:
-                path_dict = json.load(f)
+            if file_path.suffix == '.npz':
+                with np.load(file_path) as npz:
+                    ts = npz['ts']
+                    if 'dur' in npz.files:  # Files saved before durations were derived from started_at
+                        dur = npz['dur']
+                    else:
+                        started_at = json.loads(str(npz['meta'][0])).get('started_at')
+                        dur = ts - (ts[:1] if started_at is None else started_at)
+                    points = _PathBuffer.from_columns(ts, npz['xs'], npz['ys'], dur)
+                logging.info(f"Path loaded: {path_name} ({len(points)} points)")
+                return points
             
-            # Convert dictionary data back to PathPoint objects
+            with open(file_path, 'rb') as f:
+                path_dict = _loads(f.read())
+            
+            # Columns straight into a _PathBuffer, like the npz branch - PathPoints are only built on iteration.
             # Handle both old format ('points') and new format ('datapoints')
             point_data_list = path_dict.get('points', path_dict.get('datapoints', []))
-            points = []
-            
-            for point_data in point_data_list:
-                # Handle new format with different field names
-                if 'x_position' in point_data and 'y_position' in point_data:
-                    # New format - convert to PathPoint format
-                    converted_point = {
-                        'timestamp': point_data.get('timestamp', 0),
-                        'x_position': point_data['x_position'],
-                        'y_position': point_data['y_position'],
-                        'duration_from_start': 0  # Default for new format
-                    }
-                    points.append(PathPoint.from_dict(converted_point))
-                else:
-                    # Old format - use as is
-                    points.append(PathPoint.from_dict(point_data))
+            n = len(point_data_list)
+            ts = np.fromiter((p.get('timestamp', 0) for p in point_data_list), dtype=np.float64, count=n)
+            xs = np.fromiter((p['x_position'] for p in point_data_list), dtype=np.float64, count=n)
+            ys = np.fromiter((p['y_position'] for p in point_data_list), dtype=np.float64, count=n)
+            points = _PathBuffer.from_columns(ts, xs, ys, np.zeros(n))  # Durations aren't read from JSON files
             
             logging.info(f"Path loaded: {path_name} ({len(points)} points)")
             return points
@@ -1264,43 +1498,131 @@ class PathRecorder:
             logging.error(f"Error loading path {path_name}: {e}")
             return None
     
+    @staticmethod
+    def decimate(points: _PathBuffer, tolerance: float) -> _PathBuffer:
+        """
+        Thin a recorded path offline: keep a point only when it is more than tolerance away
+        from the last kept point (the recording loop's rule), plus the endpoint
+        """
+        ts, xs, ys, dur = points.columns()
+        n = len(xs)
+        if n < 3:
+            return points
+        
+        keep = np.zeros(n, dtype=np.bool_)
+        # Compare against the last *kept* point - a consecutive np.diff would drop slow drifts entirely.
+        # Compiled with numba; the pure-Python fallback runs faster over lists than array elements
+        if NUMBA_AVAILABLE:
+            _thin_mark(xs, ys, tolerance * tolerance, keep)
+        else:
+            _thin_mark(xs.tolist(), ys.tolist(), tolerance * tolerance, keep)
+        return _PathBuffer.from_columns(ts[keep], xs[keep], ys[keep], dur[keep])
+    
+    def _load_meta_index(self) -> Dict[str, dict]:
+        """Persisted list_paths metadata by file name, read once per process ({} if missing or corrupt)"""
+        if self._meta_index is None:
+            try:
+                index = _loads(self._index_path.read_bytes())
+                self._meta_index = index if isinstance(index, dict) else {}
+            except FileNotFoundError:
+                self._meta_index = {}
+            except Exception as e:
+                logging.warning(f"Ignoring unreadable path index {self._index_path}: {e}")
+                self._meta_index = {}
+        return self._meta_index
+
+    def _save_meta_index(self, index: Dict[str, dict]):
+        """Replace the persisted index atomically - a torn write would just cost one full rescan"""
+        self._meta_index = index
+        tmp_path = self._index_path.with_name(self._index_path.name + '.tmp')
+        try:
+            tmp_path.write_bytes(_dumps(index))
+            os.replace(tmp_path, self._index_path)
+        except Exception as e:
+            logging.warning(f"Could not write path index {self._index_path}: {e}")
+
+    def _read_path_meta(self, file_path: Path, mtime: float = 0) -> Optional[Dict]:
+        """list_paths entry for one file, or None if it can't be read (mtime stands in for a missing recorded_at)"""
+        try:
+            path_dict = _load_header(file_path)
+            
+            # Handle both old and new JSON formats
+            recorded_at = path_dict.get('recorded_at', mtime)
+            if isinstance(recorded_at, str):
+                # Convert ISO timestamp to Unix timestamp
+                try:
+                    from datetime import datetime
+                    dt = datetime.fromisoformat(recorded_at.replace('Z', '+00:00'))
+                    recorded_at = dt.timestamp()
+                except:
+                    recorded_at = mtime
+            
+            # Get point count from either field name
+            point_count = path_dict.get('point_count', path_dict.get('total_points', 0))
+            
+            return {
+                'name': path_dict.get('name', file_path.stem),
+                'recorded_at': recorded_at,
+                'duration': path_dict.get('duration', 0),  # Default to 0 for new format
+                'point_count': point_count,
+                'file_path': str(file_path)
+            }
+        except Exception as e:
+            logging.warning(f"Error reading path file {file_path}: {e}")
+            return None
+    
     def list_paths(self) -> List[Dict]:
         """List all available recorded paths"""
         paths = []
         
         try:
-            for file_path in self.paths_directory.glob("*.json"):
-                try:
-                    with open(file_path, 'r') as f:
-                        path_dict = json.load(f)
-                    
-                    # Handle both old and new JSON formats
-                    recorded_at = path_dict.get('recorded_at', 0)
-                    if isinstance(recorded_at, str):
-                        # Convert ISO timestamp to Unix timestamp
-                        try:
-                            from datetime import datetime
-                            dt = datetime.fromisoformat(recorded_at.replace('Z', '+00:00'))
-                            recorded_at = dt.timestamp()
-                        except:
-                            recorded_at = 0
-                    
-                    # Get point count from either field name
-                    point_count = path_dict.get('point_count', path_dict.get('total_points', 0))
-                    
-                    paths.append({
-                        'name': path_dict.get('name', file_path.stem),
-                        'recorded_at': recorded_at,
-                        'duration': path_dict.get('duration', 0),  # Default to 0 for new format
-                        'point_count': point_count,
-                        'file_path': str(file_path)
-                    })
-                except Exception as e:
-                    logging.warning(f"Error reading path file {file_path}: {e}")
-                    continue
+            # Adding, removing or atomically replacing a file bumps the directory mtime
+            dir_mtime = self.paths_directory.stat().st_mtime_ns
+            if self._list_cache is not None and dir_mtime == self._list_cache_mtime:
+                return [dict(entry) for entry in self._list_cache]
+            
+            # scandir's DirEntry caches the file type, so filtering needs no extra stat calls
+            with os.scandir(self.paths_directory) as it:
+                dir_entries = [entry for entry in it
+                               if entry.name.endswith(('.json', '.npz')) and not entry.name.startswith('.')
+                               and entry.name != "manifest.json"  # Point-count manifest from path_cleaner.py --uniform-count
+                               and entry.is_file(follow_symlinks=False)]
+            
+            # Reuse indexed metadata for every file whose mtime and size are unchanged
+            index = self._load_meta_index()
+            fresh_index = {}
+            stale = []
+            for entry in dir_entries:
+                st = entry.stat(follow_symlinks=False)
+                stamp = [st.st_mtime_ns, st.st_size]
+                indexed = index.get(entry.name)
+                if indexed is not None and indexed['stamp'] == stamp:
+                    fresh_index[entry.name] = indexed
+                    paths.append({**indexed['meta'], 'file_path': entry.path})
+                else:
+                    stale.append((entry.name, stamp, Path(entry.path), st.st_mtime))
+            
+            # Overlap the per-file open/read latency (slow on an SD card)
+            stale_files = [file_path for _, _, file_path, _ in stale]
+            stale_mtimes = [mtime for _, _, _, mtime in stale]
+            if len(stale_files) > 1:
+                with ThreadPoolExecutor(max_workers=min(8, len(stale_files))) as executor:
+                    entries = list(executor.map(self._read_path_meta, stale_files, stale_mtimes))
+            else:
+                entries = [self._read_path_meta(file_path, mtime) for file_path, mtime in zip(stale_files, stale_mtimes)]
+            for (name, stamp, _, _), entry in zip(stale, entries):
+                if entry is not None:
+                    fresh_index[name] = {'stamp': stamp, 'meta': entry}
+                    paths.append(entry)
+            
+            if fresh_index != index:
+                self._save_meta_index(fresh_index)
+                dir_mtime = self.paths_directory.stat().st_mtime_ns  # Writing the index bumps the directory too
             
             # Sort by recorded time (newest first)
             paths.sort(key=lambda x: x['recorded_at'], reverse=True)
+            self._list_cache = [dict(entry) for entry in paths]
+            self._list_cache_mtime = dir_mtime
             
         except Exception as e:
             logging.error(f"Error listing paths: {e}")
@@ -1310,10 +1632,12 @@ class PathRecorder:
     def delete_path(self, path_name: str) -> bool:
         """Delete a recorded path"""
         try:
-            file_path = self.paths_directory / f"{path_name}.json"
+            file_path = self._path_file(path_name)
             
             if file_path.exists():
                 file_path.unlink()
+                (self.paths_directory / f"{path_name}.json").unlink(missing_ok=True)
+                self._list_cache = None
                 logging.info(f"Path deleted: {path_name}")
                 return True
             else:
@@ -1324,13 +1648,20 @@ class PathRecorder:
             logging.error(f"Error deleting path {path_name}: {e}")
             return False
     
+    def read_recorded_since(self, start: int = 0):
+        """
+        Bulk-read points recorded after index start without blocking the recording thread
+        Returns (next_start, ts, xs, ys, dur) - pass next_start back in on the next call
+        """
+        return self.current_path.read_since(start)
+    
     def get_recording_status(self) -> Dict:
         """Get current recording status"""
         return {
             'is_recording': self.is_recording,
             'is_playing': self.is_playing,
             'current_path_points': len(self.current_path) if self.is_recording else 0,
-            'recording_duration': time.time() - self.recording_start_time if self.is_recording else 0
+            'recording_duration': time.monotonic() - self.recording_start_time if self.is_recording else 0
         }
     
     def cleanup(self):
@@ -1344,56 +1675,45 @@ class PathRecorder:
 
 
 # Helper functions for motor speed calculation
+# Approach speed schedules - bands are (speed, scaled by base_speed, label, note), selected
+# by the first upper error bound (%) the error doesn't exceed; the last band has no bound
+_X_SPEED_BOUNDS = (0.5, 1.0, 2.0, 3.0, 5.0, 10.0, 20.0)
+_X_SPEED_BANDS = (
+    (15.0, False, "CRAWL", "ULTRA SLOW"),               # Very close to target - fixed ultra slow crawl
+    (18.0, False, "PRECISION", "VERY SLOW"),            # Close to target - fixed very slow
+    (22.0, False, "APPROACH", "SLOW"),                  # Approaching target - fixed slow approach
+    (28.0, False, "SMALL", "MODERATE"),                 # Small movements - fixed moderate
+    (0.8, True, "MODERATE", "80% - approaching"),       # Getting closer
+    (1.6, True, "FAST", "160% - medium distance"),      # Medium distance - very fast
+    (2.0, True, "VERY FAST", "200% - far distance"),    # Far distance - blazing fast
+    (2.5, True, "TURBO MAX", "250% - maximum speed"),   # Very far from target - maximum turbo
+)
+_Y_SPEED_BOUNDS = (0.5, 1.0, 2.0, 3.0, 8.0, 15.0)
+_Y_SPEED_BANDS = (
+    (12.0, False, "CRAWL", "ULTRA SLOW"),
+    (15.0, False, "PRECISION", "VERY SLOW"),
+    (18.0, False, "APPROACH", "SLOW"),
+    (22.0, False, "MODERATE", "MODERATE"),
+    (1.4, True, "FAST", "140% - medium distance"),
+    (1.8, True, "VERY FAST", "180% - far distance"),
+    (2.2, True, "TURBO MAX", "220% - maximum speed"),
+)
+
+
+def _approach_speed(axis, error, base_speed, bounds, bands):
+    """Look up the speed band for an error with one bisect instead of an if/elif ladder"""
+    speed, scaled, label, note = bands[bisect_left(bounds, error)]
+    if scaled:
+        speed *= base_speed
+    logging.info("%s %s: %.2f%% error → %.0f%% speed (%s)", axis, label, error, speed, note)
+    return speed
+
+
 def calculate_x_approach_speed(x_error, base_speed):
     """Calculate X motor speed - DRAMATIC slowdown when close"""
-    if x_error <= 0.5:  # Very close to target - CRAWL
-        approach_speed = 15.0  # Fixed 15% - ultra slow crawl
-        logging.info(f"X CRAWL: {x_error:.2f}% error → {approach_speed:.0f}% speed (ULTRA SLOW)")
-    elif x_error <= 1.0:  # Close to target - very slow
-        approach_speed = 18.0  # Fixed 18% - very slow
-        logging.info(f"X PRECISION: {x_error:.2f}% error → {approach_speed:.0f}% speed (VERY SLOW)")
-    elif x_error <= 2.0:  # Approaching target - slow
-        approach_speed = 22.0  # Fixed 22% - slow approach
-        logging.info(f"X APPROACH: {x_error:.2f}% error → {approach_speed:.0f}% speed (SLOW)")
-    elif x_error <= 3.0:  # Small movements - moderate slow
-        approach_speed = 28.0  # Fixed 28% - moderate
-        logging.info(f"X SMALL: {x_error:.2f}% error → {approach_speed:.0f}% speed (MODERATE)")
-    elif x_error <= 5.0:  # Getting closer - moderate
-        approach_speed = base_speed * 0.8  # 80% speed (reduced from 120%)
-        logging.info(f"X MODERATE: {x_error:.2f}% error → {approach_speed:.0f}% speed (80% - approaching)")
-    elif x_error <= 10.0:  # Medium distance - very fast
-        approach_speed = base_speed * 1.6  # 160% speed (increased from 110%)
-        logging.info(f"X FAST: {x_error:.2f}% error → {approach_speed:.0f}% speed (160% - medium distance)")
-    elif x_error <= 20.0:  # Far distance - blazing fast
-        approach_speed = base_speed * 2.0  # 200% speed (increased from 130%)
-        logging.info(f"X VERY FAST: {x_error:.2f}% error → {approach_speed:.0f}% speed (200% - far distance)")
-    else:  # Very far from target - maximum turbo
-        approach_speed = base_speed * 2.5  # 250% speed (increased from 150%)
-        logging.info(f"X TURBO MAX: {x_error:.2f}% error → {approach_speed:.0f}% speed (250% - maximum speed)")
-    return approach_speed
+    return _approach_speed("X", x_error, base_speed, _X_SPEED_BOUNDS, _X_SPEED_BANDS)
 
 
 def calculate_y_approach_speed(y_error, base_speed):
     """Calculate Y motor speed - DRAMATIC slowdown when close"""
-    if y_error <= 0.5:  # Very close to target - CRAWL
-        approach_speed = 12.0  # Fixed 12% - ultra slow crawl
-        logging.info(f"Y CRAWL: {y_error:.2f}% error → {approach_speed:.0f}% speed (ULTRA SLOW)")
-    elif y_error <= 1.0:  # Close to target - very slow
-        approach_speed = 15.0  # Fixed 15% - very slow
-        logging.info(f"Y PRECISION: {y_error:.2f}% error → {approach_speed:.0f}% speed (VERY SLOW)")
-    elif y_error <= 2.0:  # Approaching target - slow
-        approach_speed = 18.0  # Fixed 18% - slow approach
-        logging.info(f"Y APPROACH: {y_error:.2f}% error → {approach_speed:.0f}% speed (SLOW)")
-    elif y_error <= 3.0:  # Small movements - moderate slow
-        approach_speed = 22.0  # Fixed 22% - moderate
-        logging.info(f"Y MODERATE: {y_error:.2f}% error → {approach_speed:.0f}% speed (MODERATE)")
-    elif y_error <= 8.0:  # Medium distance - very fast
-        approach_speed = base_speed * 1.4  # 140% speed (increased from 80%)
-        logging.info(f"Y FAST: {y_error:.2f}% error → {approach_speed:.0f}% speed (140% - medium distance)")
-    elif y_error <= 15.0:  # Far distance - blazing fast
-        approach_speed = base_speed * 1.8  # 180% speed (increased from 120%)
-        logging.info(f"Y VERY FAST: {y_error:.2f}% error → {approach_speed:.0f}% speed (180% - far distance)")
-    else:  # Very far from target - maximum turbo
-        approach_speed = base_speed * 2.2  # 220% speed (increased from 140%)
-        logging.info(f"Y TURBO MAX: {y_error:.2f}% error → {approach_speed:.0f}% speed (220% - maximum speed)")
-    return approach_speed
+    return _approach_speed("Y", y_error, base_speed, _Y_SPEED_BOUNDS, _Y_SPEED_BANDS)
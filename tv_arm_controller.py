@@ -26,6 +26,39 @@ except ImportError as e:
     ADS = None
     AnalogIn = None
 
+from _numba_compat import njit  # Optional numba with a plain-Python fallback
+
+
+# Safety zones returned by _safety_zone
+SAFETY_ZONE_CLEAR = 0
+SAFETY_ZONE_SLOW = 1
+SAFETY_ZONE_MARGIN = 2
+SAFETY_ZONE_LIMIT = 3
+
+
+@njit(cache=True)
+def _safety_zone(current_voltage, min_voltage, max_voltage, safety_margin, slow_zone_margin, forward):
+    """Classify a voltage against the limit we are moving toward (pure numeric kernel)
+
+    Only the limit in the direction of travel matters: MAX when moving forward,
+    MIN when moving in reverse.
+    """
+    if forward:
+        if current_voltage >= max_voltage:
+            return SAFETY_ZONE_LIMIT
+        if current_voltage >= max_voltage - safety_margin:
+            return SAFETY_ZONE_MARGIN
+        if current_voltage >= max_voltage - slow_zone_margin:
+            return SAFETY_ZONE_SLOW
+    else:
+        if current_voltage <= min_voltage:
+            return SAFETY_ZONE_LIMIT
+        if current_voltage <= min_voltage + safety_margin:
+            return SAFETY_ZONE_MARGIN
+        if current_voltage <= min_voltage + slow_zone_margin:
+            return SAFETY_ZONE_SLOW
+    return SAFETY_ZONE_CLEAR
+
 
 class DCMotorController:
     """Controls DC motor using TB6612FNG motor driver"""
@@ -114,12 +147,6 @@ class DCMotorController:
         
         Returns: (should_stop, max_allowed_speed)
         """
-        # Calculate safety zones
-        min_safety_limit = min_voltage + safety_margin
-        max_safety_limit = max_voltage - safety_margin
-        min_slow_zone = min_voltage + slow_zone_margin  
-        max_slow_zone = max_voltage - slow_zone_margin
-        
         # Initialize consecutive bad reading counters if not exists
         if not hasattr(self, '_safety_bad_readings'):
             self._safety_bad_readings = 0
@@ -128,29 +155,24 @@ class DCMotorController:
         potential_safety_issue = False
         safety_message = ""
         
-        if direction == 'forward':
-            # Moving forward (increasing voltage) - only check MAX limits
-            if current_voltage >= max_voltage:
-                potential_safety_issue = True
-                safety_message = f"SAFETY STOP: Voltage {current_voltage:.3f}V at absolute MAX limit ({max_voltage:.3f}V)"
-            elif current_voltage >= max_safety_limit:
-                potential_safety_issue = True
-                safety_message = f"SAFETY STOP: Voltage {current_voltage:.3f}V in MAX safety margin ({max_safety_limit:.3f}V)"
-            elif current_voltage >= max_slow_zone:
-                logging.warning(f"SAFETY SLOW: Voltage {current_voltage:.3f}V approaching MAX limit, reducing to {safety_slow_speed}%")
-                return False, safety_slow_speed
+        if direction == 'forward' or direction == 'reverse':
+            forward = direction == 'forward'
+            zone = _safety_zone(current_voltage, min_voltage, max_voltage,
+                                safety_margin, slow_zone_margin, forward)
+            
+            if zone != SAFETY_ZONE_CLEAR:
+                # Moving forward (increasing voltage) checks MAX limits, reverse checks MIN
+                side, limit = ("MAX", max_voltage) if forward else ("MIN", min_voltage)
+                if zone == SAFETY_ZONE_SLOW:
+                    logging.warning(f"SAFETY SLOW: Voltage {current_voltage:.3f}V approaching {side} limit, reducing to {safety_slow_speed}%")
+                    return False, safety_slow_speed
                 
-        elif direction == 'reverse':
-            # Moving reverse (decreasing voltage) - only check MIN limits
-            if current_voltage <= min_voltage:
-                potential_safety_issue = True
-                safety_message = f"SAFETY STOP: Voltage {current_voltage:.3f}V at absolute MIN limit ({min_voltage:.3f}V)"
-            elif current_voltage <= min_safety_limit:
                 potential_safety_issue = True
-                safety_message = f"SAFETY STOP: Voltage {current_voltage:.3f}V in MIN safety margin ({min_safety_limit:.3f}V)"
-            elif current_voltage <= min_slow_zone:
-                logging.warning(f"SAFETY SLOW: Voltage {current_voltage:.3f}V approaching MIN limit, reducing to {safety_slow_speed}%")
-                return False, safety_slow_speed
+                if zone == SAFETY_ZONE_LIMIT:
+                    safety_message = f"SAFETY STOP: Voltage {current_voltage:.3f}V at absolute {side} limit ({limit:.3f}V)"
+                else:
+                    margin_limit = limit - safety_margin if forward else limit + safety_margin
+                    safety_message = f"SAFETY STOP: Voltage {current_voltage:.3f}V in {side} safety margin ({margin_limit:.3f}V)"
         
         # Handle potential safety issues with consecutive reading requirement
         if potential_safety_issue:
@@ -224,7 +246,9 @@ class DCMotorController:
         """Closed-loop movement with position verification"""
         import time
         
-        start_time = time.time()
+        # Bound once; the monotonic clock is immune to NTP/wall-clock steps during a move
+        now, sleep = time.monotonic, time.sleep
+        deadline = now() + max_wait_time
         consecutive_checks = 0
         required_checks = 2
         
@@ -250,7 +274,7 @@ class DCMotorController:
             logging.info(f"DC Motor already at target {target_percent:.1f}%")
             return True
         
-        while time.time() - start_time < max_wait_time:
+        while now() < deadline:
             # Get current actual position from potentiometer
             actual_position = position_callback()
             position_error = abs(actual_position - target_percent)
@@ -271,7 +295,7 @@ class DCMotorController:
                     return True
                 
                 # Wait a bit before next check
-                time.sleep(0.1)
+                sleep(0.1)
                 continue
             else:
                 # Reset consecutive checks if we're not in tolerance
@@ -299,7 +323,7 @@ class DCMotorController:
                 self.moving = True
                 
                 # Wait before next position check
-                time.sleep(0.2)
+                sleep(0.2)
         
         # Timeout reached
         actual_position = position_callback()
@@ -678,6 +702,12 @@ class TVArmController:
         # Position update callback
         self.position_callback = None
         
+        # Notified (with position_seq bumped) each time the update thread stores a fresh reading;
+        # position_time is the time.monotonic() at which that reading was taken
+        self.position_changed = threading.Condition()
+        self.position_seq = 0
+        self.position_time = 0.0
+        
         logging.info("TV Arm Controller initialized")
     
     def set_position_callback(self, callback):
@@ -770,6 +800,16 @@ class TVArmController:
             logging.error(f"Error reading current position: {e}")
             return 50.0, 50.0  # Safe default
     
+    def stop_all(self):
+        """Stop (coast) both motors with one batched GPIO write for the direction pins"""
+        if GPIO:
+            GPIO.output([self.x_motor.ain1_pin, self.x_motor.ain2_pin,
+                         self.y_motor.ain1_pin, self.y_motor.ain2_pin], GPIO.LOW)
+        for motor in (self.x_motor, self.y_motor):
+            if motor.pwm:
+                motor.pwm.ChangeDutyCycle(0)
+            motor.moving = False
+    
     def get_target_position(self) -> Tuple[float, float]:
         """Get target position"""
         return self.target_x_position, self.target_y_position
@@ -819,6 +859,23 @@ class TVArmController:
             logging.error(f"Calibration failed: {e}")
             return calibration_data
     
+    def wait_for_position(self, seen_seq: int, timeout: float,
+                          stop_event: Optional[threading.Event] = None) -> Optional[Tuple[int, float, float]]:
+        """Block until the update thread publishes a reading newer than seen_seq
+        
+        Returns (seq, x, y), or None on timeout, when stop_event is set (waiters are woken
+        with position_changed.notify_all()) or when the update thread isn't running
+        """
+        def ready():
+            return (self.position_seq != seen_seq or not self.running
+                    or (stop_event is not None and stop_event.is_set()))
+        
+        with self.position_changed:
+            self.position_changed.wait_for(ready, timeout)
+            if self.position_seq == seen_seq:
+                return None
+            return self.position_seq, self.current_x_position, self.current_y_position
+    
     def _position_update_loop(self):
         """Background thread to read positions and call callback"""
         update_interval = self.config['system']['position_update_interval']
@@ -827,8 +884,13 @@ class TVArmController:
             try:
                 # Read current positions
                 x_pos, y_pos = self.get_current_position()
-                self.current_x_position = x_pos
-                self.current_y_position = y_pos
+                read_time = time.monotonic()
+                with self.position_changed:
+                    self.current_x_position = x_pos
+                    self.current_y_position = y_pos
+                    self.position_time = read_time
+                    self.position_seq += 1
+                    self.position_changed.notify_all()
                 
                 # Call position update callback if set
                 if self.position_callback: